@@ -0,0 +1,34 @@
+import time
+from argparse import ArgumentParser, Namespace
+
+from pandas import DataFrame
+
+from ptm_torrent.huggingface.createSchema import createPTMSchema
+from tests.test_createSchema import createListing, createRowWisePTMSchema, metadataPath
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--models", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args: Namespace = parser.parse_args()
+
+    df: DataFrame = createListing(args.models, args.seed)
+
+    start: float = time.perf_counter()
+    createRowWisePTMSchema(df)
+    rowWiseDuration: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    createPTMSchema(df, metadataPath)
+    columnWiseDuration: float = time.perf_counter() - start
+
+    print(
+        f"\n{args.models} models: row-wise {rowWiseDuration:.2f}s, "
+        f"column-wise {columnWiseDuration:.2f}s "
+        f"({rowWiseDuration / columnWiseDuration:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import gc
+import time
+from argparse import ArgumentParser, Namespace
+from typing import Any, Callable, List
+
+from ptm_torrent.utils.ptmSchema import (
+    ModelHub,
+    PTMTorrent,
+    from_int,
+    from_list,
+    from_none,
+    from_str,
+    from_union,
+    to_class,
+)
+
+
+def quicktypeModelHubToDict(mh: ModelHub) -> dict:
+    """ModelHub.to_dict as quicktype generated it"""
+    result: dict = {}
+    result["MetadataFilePath"] = from_str(mh.metadata_file_path)
+    result["MetadataObjectID"] = from_str(mh.metadata_object_id)
+    result["ModelHubName"] = from_str(mh.model_hub_name)
+    result["ModelHubURL"] = from_str(mh.model_hub_url)
+    return result
+
+
+def quicktypeToDict(ptm: PTMTorrent) -> dict:
+    """PTMTorrent.to_dict as quicktype generated it, through `from_union`"""
+    result: dict = {}
+    result["id"] = from_int(ptm.id)
+    result["LatestGitCommitSHA"] = from_str(ptm.latest_git_commit_sha)
+    assert isinstance(ptm.model_hub, ModelHub)
+    result["ModelHub"] = quicktypeModelHubToDict(ptm.model_hub)
+    result["ModelName"] = from_str(ptm.model_name)
+    result["ModelOwner"] = from_str(ptm.model_owner)
+    result["ModelOwnerURL"] = from_str(ptm.model_owner_url)
+    result["ModelURL"] = from_str(ptm.model_url)
+    if ptm.datasets is not None:
+        result["Dataset"] = from_union(
+            [lambda x: from_list(lambda x: x, x), from_none], ptm.datasets
+        )
+    if ptm.model_architecture is not None:
+        result["ModelArchitecture"] = from_union(
+            [from_str, from_none], ptm.model_architecture
+        )
+    if ptm.model_paper_dois is not None:
+        result["ModelPaperDOIs"] = from_union(
+            [lambda x: from_list(lambda x: x, x), from_none], ptm.model_paper_dois
+        )
+    if ptm.model_task is not None:
+        result["ModelTask"] = from_union([from_str, from_none], ptm.model_task)
+    return result
+
+
+def quicktypeModelHubFromDict(obj: Any) -> ModelHub:
+    """ModelHub.from_dict as quicktype generated it"""
+    assert isinstance(obj, dict)
+    metadata_file_path = from_str(obj.get("MetadataFilePath"))
+    metadata_object_id = from_str(obj.get("MetadataObjectID"))
+    model_hub_name = from_str(obj.get("ModelHubName"))
+    model_hub_url = from_str(obj.get("ModelHubURL"))
+    return ModelHub(
+        metadata_file_path, metadata_object_id, model_hub_name, model_hub_url
+    )
+
+
+def quicktypeFromDict(obj: Any) -> PTMTorrent:
+    """PTMTorrent.from_dict as quicktype generated it, through `from_union`"""
+    assert isinstance(obj, dict)
+    id = from_int(obj.get("id"))
+    latest_git_commit_sha = from_str(obj.get("LatestGitCommitSHA"))
+    model_hub = quicktypeModelHubFromDict(obj.get("ModelHub"))
+    model_name = from_str(obj.get("ModelName"))
+    model_owner = from_str(obj.get("ModelOwner"))
+    model_owner_url = from_str(obj.get("ModelOwnerURL"))
+    model_url = from_str(obj.get("ModelURL"))
+    datasets = from_union(
+        [lambda x: from_list(lambda x: x, x), from_none], obj.get("Dataset")
+    )
+    model_architecture = from_union([from_str, from_none], obj.get("ModelArchitecture"))
+    model_paper_dois = from_union(
+        [lambda x: from_list(lambda x: x, x), from_none], obj.get("ModelPaperDOIs")
+    )
+    model_task = from_union([from_str, from_none], obj.get("ModelTask"))
+    return PTMTorrent(
+        id,
+        latest_git_commit_sha,
+        model_hub,
+        model_name,
+        model_owner,
+        model_owner_url,
+        model_url,
+        datasets,
+        model_architecture,
+        model_paper_dois,
+        model_task,
+    )
+
+
+def createRecords(recordCount: int) -> List[PTMTorrent]:
+    """Records with every other optional field set, as the hubs emit them"""
+    modelHub: ModelHub = ModelHub(
+        metadata_file_path="data/huggingface/json/metadata/hf_metadata.json",
+        metadata_object_id="",
+        model_hub_name="Hugging Face",
+        model_hub_url="https://huggingface.co/",
+    )
+
+    records: List[PTMTorrent] = []
+
+    idx: int
+    for idx in range(recordCount):
+        hasOptionals: bool = idx % 2 == 0
+        records.append(
+            PTMTorrent(
+                id=idx,
+                latest_git_commit_sha=f"{idx:040x}",
+                model_hub=modelHub,
+                model_name=f"author/model-{idx}",
+                model_owner="author",
+                model_owner_url="https://huggingface.co/author",
+                model_url=f"https://huggingface.co/author/model-{idx}",
+                model_architecture="bert" if hasOptionals else None,
+                model_paper_dois=[f"doi:10.57967/hf/{idx}"] if hasOptionals else None,
+                model_task="fill-mask" if hasOptionals else None,
+            )
+        )
+
+    return records
+
+
+def timeSerializer(
+    name: str, serializer: Callable[[Any], Any], records: List[Any]
+) -> List[Any]:
+    # As in timeit, so collecting the output does not dominate the timings
+    gc.disable()
+    start: float = time.perf_counter()
+    output: List[Any] = [serializer(record) for record in records]
+    duration: float = time.perf_counter() - start
+    gc.enable()
+
+    print(f"{name}: {duration:.2f}s ({duration / len(records) * 1e6:.2f}us/record)")
+    return output
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--records", type=int, default=1000000)
+    args: Namespace = parser.parse_args()
+
+    records: List[PTMTorrent] = createRecords(args.records)
+
+    quicktypeDicts: List[dict] = timeSerializer(
+        "quicktype to_dict", quicktypeToDict, records
+    )
+    dicts: List[dict] = timeSerializer("to_dict", lambda ptm: ptm.to_dict(), records)
+    trustedDicts: List[dict] = timeSerializer(
+        "to_dict(validate=False)", lambda ptm: ptm.to_dict(validate=False), records
+    )
+    quicktypeRecords: List[PTMTorrent] = timeSerializer(
+        "quicktype from_dict", quicktypeFromDict, dicts
+    )
+    parsedRecords: List[PTMTorrent] = timeSerializer(
+        "from_dict", PTMTorrent.from_dict, dicts
+    )
+    trustedRecords: List[PTMTorrent] = timeSerializer(
+        "from_dict(validate=False)",
+        lambda obj: PTMTorrent.from_dict(obj, validate=False),
+        dicts,
+    )
+
+    assert dicts == quicktypeDicts, "to_dict differs from the quicktype output"
+    assert trustedDicts == quicktypeDicts, "to_dict(validate=False) differs"
+    assert quicktypeRecords == records, "the quicktype from_dict does not round trip"
+    assert parsedRecords == records, "from_dict does not round trip"
+    assert trustedRecords == records, "from_dict(validate=False) does not round trip"
+    assert to_class(PTMTorrent, records[0]) == quicktypeDicts[0]
+
+    print(
+        f"{args.records} records serialize and parse identically to the quicktype code"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from os import environ
 from pathlib import PurePath
 
 from ptm_torrent.utils.fileSystem import checkFileSystem, setupFileSystem
@@ -6,6 +7,8 @@ dataFolderPath: PurePath = PurePath("data")
 
 reposFolderPath: PurePath = PurePath("repos")
 
+httpCacheFolderPath: PurePath = PurePath("http_cache")
+
 jsonFolderPath: PurePath = PurePath("json")
 jsonMetadataFolderPath: PurePath = PurePath(f"{jsonFolderPath}/metadata")
 jsonModelMetadataFolderPath: PurePath = PurePath(f"{jsonMetadataFolderPath}/models")
@@ -13,3 +16,13 @@ jsonModelMetadataFolderPath: PurePath = PurePath(f"{jsonMetadataFolderPath}/mode
 htmlFolderPath: PurePath = PurePath("html")
 htmlMetadataFolderPath: PurePath = PurePath(f"{htmlFolderPath}/metadata")
 htmlModelMetadataFolderPath: PurePath = PurePath(f"{htmlMetadataFolderPath}/models")
+
+# Format of every list of records written to disk (hub metadata and PTM schemas)
+recordFormats: list = ["json", "ndjson", "ndjson.gz", "ndjson.zst"]
+
+recordFormatEnvironmentVariable: str = "PTM_TORRENT_RECORD_FORMAT"
+recordFormat: str = environ.get(recordFormatEnvironmentVariable, "json")
+
+if recordFormat not in recordFormats:
+    print(f"Invalid value for {recordFormatEnvironmentVariable}. Defaulting to json")
+    recordFormat = "json"
@@ -0,0 +1,84 @@
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List
+
+from ptm_torrent.pipelines import pipelineBuilders, runPipeline
+from ptm_torrent.utils.arguments import addCloneArguments, addDownloadArguments
+
+
+def runHubs(hubNames: List[str], args: Namespace) -> Dict[str, Dict[str, str]]:
+    """Runs each hub's pipeline, `args.parallel` hubs at a time"""
+    if args.parallel <= 1:
+        return {hubName: runPipeline(hubName, args) for hubName in hubNames}
+
+    statuses: Dict[str, Dict[str, str]] = {}
+
+    with ProcessPoolExecutor(max_workers=args.parallel) as executor:
+        futures: Dict[str, Future] = {
+            hubName: executor.submit(runPipeline, hubName, args) for hubName in hubNames
+        }
+
+        hubName: str
+        future: Future
+        for hubName, future in futures.items():
+            try:
+                statuses[hubName] = future.result()
+            except Exception as error:
+                print(f"[{hubName}] Pipeline raised {error!r}")
+                statuses[hubName] = {"pipeline": "failed"}
+
+    return statuses
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(prog="ptm_torrent")
+    parser.add_argument(
+        "hubs",
+        nargs="*",
+        default=list(pipelineBuilders.keys()),
+        help=f"Model hubs to run: {', '.join(pipelineBuilders)} (default: all)",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Number of hubs to run at the same time",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rerun every stage, even those that are up to date",
+    )
+    parser.add_argument(
+        "--skip-clone",
+        action="store_true",
+        help="Leave out the stages that clone git repositories",
+    )
+    addCloneArguments(parser)
+    addDownloadArguments(parser)
+    args: Namespace = parser.parse_args()
+
+    unknownHubs: List[str] = [hub for hub in args.hubs if hub not in pipelineBuilders]
+    if len(unknownHubs) > 0:
+        parser.error(f"unknown hubs: {', '.join(unknownHubs)}")
+
+    statuses: Dict[str, Dict[str, str]] = runHubs(list(dict.fromkeys(args.hubs)), args)
+
+    failed: bool = False
+
+    hubName: str
+    hubStatuses: Dict[str, str]
+    for hubName, hubStatuses in statuses.items():
+        print(f"\n{hubName}:")
+        stageName: str
+        status: str
+        for stageName, status in hubStatuses.items():
+            print(f"  {stageName}: {status}")
+            failed = failed or status == "failed"
+
+    if failed:
+        quit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,29 @@ subFolders: List[PurePath] = [
 ]
 
 huggingface_HubMetadataPath: PurePath = PurePath(
-    f"{rootFolderPath}/{jsonMetadataFolderPath}/hf_metadata.json"
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/hf_metadata.{pt.recordFormat}"
+)
+
+huggingface_HubMetadataStreamPath: PurePath = PurePath(
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/hf_metadata.ndjson"
+)
+
+huggingface_HubMetadataCursorPath: PurePath = PurePath(
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/hf_metadata.cursor.json"
 )
 
 huggingface_ReposPath: PurePath = PurePath(f"{rootFolderPath}/{reposFolderPath}")
+
+huggingface_ReposLedgerPath: PurePath = PurePath(f"{rootFolderPath}/repos_ledger.db")
+
+huggingface_ReposQueuePath: PurePath = PurePath(f"{rootFolderPath}/repos_queue.db")
+
+huggingface_LFSStorePath: PurePath = PurePath(f"{rootFolderPath}/lfs_objects")
+
+huggingface_DownloadPlanPath: PurePath = PurePath(
+    f"{rootFolderPath}/{jsonFolderPath}/hf_download_plan.json"
+)
+
+huggingface_PTMSchemaPath: PurePath = PurePath(
+    f"{rootFolderPath}/{jsonFolderPath}/huggingface.{pt.recordFormat}"
+)
@@ -1,85 +1,124 @@
 from pathlib import PurePath
-from typing import List
-from urllib.parse import ParseResult, urlparse
+from typing import List, Tuple
 
-import pandas
+import numpy
+from numpy import ndarray
 from pandas import DataFrame, Series
 from progress.bar import Bar
 
 import ptm_torrent.huggingface as hf
-from ptm_torrent.utils.fileSystem import saveJSON, testForFile, testForPath
-from ptm_torrent.utils.git import getLatestGitCommitOfFile
+from ptm_torrent.huggingface.splitRepos import getHubMetadataPath, readHubMetadata
+from ptm_torrent.utils.fileSystem import saveRecords
 from ptm_torrent.utils.ptmSchema import ModelHub, PTMTorrent
 
+modelHubName: str = "Hugging Face"
+modelHubURL: str = "https://huggingface.co/"
 
-def createModelHub(row: Series) -> ModelHub:
-    mh: ModelHub = ModelHub(
-        metadata_file_path=hf.huggingface_HubMetadataPath.__str__(),
-        metadata_object_id=str(row["id"]),
-        model_hub_name="Hugging Face",
-        model_hub_url="https://huggingface.co/",
+
+def toOptional(column: Series) -> Series:
+    """Replaces missing values with None so they are left out of the record"""
+    return column.astype(object).where(column.notna(), None)
+
+
+def toOptionalStr(column: Series) -> Series:
+    # Values are written as strings, as the `PTMTorrent` fields are typed
+    return toOptional(column.map(str, na_action="ignore"))
+
+
+def getModelOwners(df: DataFrame) -> Tuple[Series, Series]:
+    hasAuthor: Series = df["author"].notna()
+    owners: Series = df["author"].astype(str)
+
+    modelOwner: Series = owners.where(hasAuthor, "http://huggingface.co/")
+    modelOwnerURL: Series = ("https://huggingface.co/" + owners).where(
+        hasAuthor, "http://huggingface.co/"
     )
-    return mh
+    return modelOwner, modelOwnerURL
+
+
+def getModelArchitectures(df: DataFrame) -> Series:
+    # config>model_type when it exists
+    return toOptionalStr(df["config"].str.get("model_type"))
+
 
+def getModelPaperDOIs(df: DataFrame) -> Series:
+    # Tags containing "doi:", or None if there are none
+    tags: Series = df["tags"].explode()
+    dois: Series = tags[tags.str.contains("doi:", regex=False, na=False)]
 
-def createPTMSchema(df: DataFrame) -> List[dict]:
+    # explode() keeps rows in order, so each model's DOIs are contiguous
+    rows: ndarray
+    starts: ndarray
+    rows, starts = numpy.unique(dois.index.to_numpy(), return_index=True)
+    doiLists: List[list] = [
+        group.tolist() for group in numpy.split(dois.to_numpy(), starts[1:])
+    ]
+
+    return toOptional(Series(dict(zip(rows, doiLists)), dtype=object).reindex(df.index))
+
+
+def createPTMSchema(
+    df: DataFrame, metadataPath: PurePath = hf.huggingface_HubMetadataPath
+) -> List[dict]:
+    """
+    Derives every PTM Torrent field column-wise, with missing values as None,
+    instead of per `df.loc` row. Each record is still built as a `PTMTorrent`
+    and serialized one at a time.
+    """
     data: List[dict] = []
 
+    df = df.reset_index(drop=True)
+
+    print("Creating PTM Torrent columns...")
+    modelNames: List[str] = df["id"].astype(str).tolist()
+    modelOwners: Series
+    modelOwnerURLs: Series
+    modelOwners, modelOwnerURLs = getModelOwners(df)
+    modelArchitectures: Series = getModelArchitectures(df)
+    modelPaperDOIs: Series = getModelPaperDOIs(df)
+    modelTasks: Series = toOptionalStr(df["pipeline_tag"])
+
+    columns: zip = zip(
+        toOptionalStr(df["sha"]).tolist(),
+        modelNames,
+        modelOwners.tolist(),
+        modelOwnerURLs.tolist(),
+        modelArchitectures.tolist(),
+        modelPaperDOIs.tolist(),
+        modelTasks.tolist(),
+    )
+
     with Bar("Creating PTM Torrent objects...", max=len(df)) as bar:
         idx: int
-        for idx in range(len(df)):
-
-            # Pull current entry from table
-            row: Series = df.loc[idx]
-
-            # Find model owner information
-            model_owner:str
-            model_owner_url: str
-
-            # Check if owner info is populated
-            if row["author"] == None:
-                model_owner = "http://huggingface.co/"
-                model_owner_url = "http://huggingface.co/"
-            else:
-                model_owner = str(row["author"])
-                model_owner_url = f'https://huggingface.co/{model_owner}'
-
-
-            # Find architecture
-            model_architecture: str = None
-            # Check if config>model_type exists
-            config = row["config"]
-            if config != None:
-                if "model_type" in config:
-                    model_architecture = config["model_type"]
-
-            # Find task
-            model_task = row["pipeline_tag"]
-
-            # Get dois
-            model_paper_dois: List[str] = None               
-            tags: List[str] = row["tags"]
-            if tags != None:
-                temp = [x for x in tags if "doi:" in x]
-                if temp:
-                    model_paper_dois = temp
-            
-
+        for idx, (
+            sha,
+            modelName,
+            modelOwner,
+            modelOwnerURL,
+            modelArchitecture,
+            modelPaperDOI,
+            modelTask,
+        ) in enumerate(columns):
             ptm: PTMTorrent = PTMTorrent(
                 id=idx,
-                latest_git_commit_sha=row["sha"],
-                model_hub=createModelHub(row),
-                model_name=str(row["id"]),
-                model_owner=model_owner,
-                model_owner_url=model_owner_url,
-                model_url=f'https://huggingface.co/{row["id"]}',
-                datasets= None,# TODO
-                model_architecture= model_architecture,
-                model_paper_dois= model_paper_dois,# TODO
-                model_task= model_task,
+                latest_git_commit_sha=sha,
+                model_hub=ModelHub(
+                    metadata_file_path=metadataPath.__str__(),
+                    metadata_object_id=modelName,
+                    model_hub_name=modelHubName,
+                    model_hub_url=modelHubURL,
+                ),
+                model_name=modelName,
+                model_owner=modelOwner,
+                model_owner_url=modelOwnerURL,
+                model_url=f"https://huggingface.co/{modelName}",
+                model_architecture=modelArchitecture,
+                model_paper_dois=modelPaperDOI,
+                model_task=modelTask,
             )
 
-            data.append(ptm.to_dict())
+            # The columns above are already typed, so they are not asserted again
+            data.append(ptm.to_dict(validate=False))
 
             bar.next()
 
@@ -87,20 +126,15 @@ def createPTMSchema(df: DataFrame) -> List[dict]:
 
 
 def main() -> None | bool:
-    if testForFile(path=hf.huggingface_HubMetadataPath) == False:
+    metadataPath: PurePath | None = getHubMetadataPath()
+    if metadataPath is None:
         return False
 
-    jsonFilePath: PurePath = PurePath(
-        f"{hf.rootFolderPath}/{hf.jsonFolderPath}/huggingface.json"
-    )
-
-    df: DataFrame = pandas.read_json(
-        path_or_buf=hf.huggingface_HubMetadataPath
-    )
+    df: DataFrame = readHubMetadata(metadataPath)
 
-    json: List[dict] = createPTMSchema(df)
+    json: List[dict] = createPTMSchema(df, metadataPath)
 
-    saveJSON(json, filepath=jsonFilePath)
+    saveRecords(json, filepath=hf.huggingface_PTMSchemaPath)
 
 
 if __name__ == "__main__":
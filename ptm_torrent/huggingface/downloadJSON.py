@@ -1,11 +1,17 @@
+from json import dump, dumps, load
+from os import remove, truncate
 from typing import List
 
 from huggingface_hub.hf_api import ModelInfo, list_models
 from progress.bar import Bar
+from progress.spinner import Spinner
+from requests import Response
 
 import ptm_torrent.huggingface as hf
-from ptm_torrent.utils.fileSystem import saveJSON
-from ptm_torrent.utils.network import downloadJSON
+from ptm_torrent.utils.fileSystem import saveRecords, testForFile
+from ptm_torrent.utils.network import get
+
+modelListURL: str = "https://huggingface.co/api/models"
 
 
 def getModelList() -> List[dict]:
@@ -24,12 +30,86 @@ def getModelList() -> List[dict]:
     return modelList
 
 
-def main() -> None:
+def readCursor() -> dict | None:
+    if testForFile(path=hf.huggingface_HubMetadataCursorPath) == False:
+        return None
+
+    with open(hf.huggingface_HubMetadataCursorPath, "r") as cursorFile:
+        cursor: dict = load(cursorFile)
+        cursorFile.close()
+    return cursor
+
+
+def saveCursor(nextURL: str | None, offset: int) -> None:
+    if nextURL is None:
+        if testForFile(path=hf.huggingface_HubMetadataCursorPath):
+            remove(hf.huggingface_HubMetadataCursorPath)
+        return
+
+    with open(hf.huggingface_HubMetadataCursorPath, "w") as cursorFile:
+        dump(obj={"next": nextURL, "offset": offset}, fp=cursorFile)
+        cursorFile.close()
+
+
+def streamModelList(pageSize: int = 1000) -> bool:
+    """
+    Pages through the Hugging Face model listing and appends each model to
+    `hf.huggingface_HubMetadataStreamPath` as one JSON object per line.
+
+    After every page the next page's URL and the file offset are written to
+    `hf.huggingface_HubMetadataCursorPath`, so an interrupted crawl resumes
+    from the last complete page. Returns True once the listing is exhausted.
+    """
+    url: str | None = (
+        f"{modelListURL}?full=True&cardData=True&config=True&limit={pageSize}"
+    )
+    offset: int = 0
+
+    cursor: dict | None = readCursor()
+    if cursor is not None and testForFile(path=hf.huggingface_HubMetadataStreamPath):
+        print(f"Resuming the Hugging Face model listing from {cursor['next']}")
+        url = cursor["next"]
+        offset = cursor["offset"]
+        truncate(hf.huggingface_HubMetadataStreamPath, offset)
+    else:
+        open(hf.huggingface_HubMetadataStreamPath, "w").close()
+
+    with open(hf.huggingface_HubMetadataStreamPath, "a") as jsonFile:
+        with Spinner("Streaming PTMs hosted on Hugging Face...") as spinner:
+            while url is not None:
+                resp: Response = get(url=url)
+
+                if resp.status_code != 200:
+                    print(f"\nUnable to download {url} ({resp.status_code}).")
+                    return False
+
+                model: dict
+                for model in resp.json():
+                    jsonFile.write(dumps(model) + "\n")
+                    spinner.next()
+
+                jsonFile.flush()
+                offset = jsonFile.tell()
+
+                url = resp.links.get("next", {}).get("url")
+                saveCursor(nextURL=url, offset=offset)
+
+        jsonFile.close()
+
+    return True
+
+
+def main(stream: bool = False) -> None | bool:
+    if stream:
+        print(f"Streaming JSON to {hf.huggingface_HubMetadataStreamPath}")
+        if streamModelList() == False:
+            return False
+        return None
 
     json: List[dict] = getModelList()
 
     print(f"Saving JSON to {hf.huggingface_HubMetadataPath}")
-    saveJSON(json, filepath=hf.huggingface_HubMetadataPath)
+    saveRecords(json, filepath=hf.huggingface_HubMetadataPath)
 
 
 if __name__ == "__main__":
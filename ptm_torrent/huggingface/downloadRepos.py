@@ -1,31 +1,162 @@
-from typing import List
-
 import argparse
 import pathlib
-from progress.bar import Bar
-from progress.spinner import Spinner
+from pathlib import PurePath
+from typing import Dict, Iterable, List
 
 import ptm_torrent.huggingface as hf
-from ptm_torrent.utils.fileSystem import readJSON, testForFile
-from ptm_torrent.utils.git import cloneRepo
+from ptm_torrent.huggingface.splitRepos import getHubMetadataPath
+from ptm_torrent.utils.arguments import addCloneArguments, getCloneOptions
+from ptm_torrent.utils.fileSystem import findFiles, readJSON, readRecords
+from ptm_torrent.utils.git import CloneOptions, CloneResult, cloneRepos
+from ptm_torrent.utils.ledger import CloneLedger
+from ptm_torrent.utils.workQueue import WorkQueue, cloneFromQueue
+
+
+def readExpectedSHAs() -> Dict[str, str]:
+    """Maps each model's clone URL to the commit SHA reported by the Hub listing"""
+    metadataPath: PurePath | None = getHubMetadataPath()
+    if metadataPath is None:
+        return {}
 
+    json: Iterable[dict] = readRecords(jsonFilePath=metadataPath)
 
-def main(url: pathlib.Path) -> None:
+    return {f"https://huggingface.co/{obj['id']}": obj["sha"] for obj in json}
 
+
+def readURLFile(url: pathlib.Path) -> List[str]:
     with open(url, "r") as f:
-        urls = f.readlines()
-    with Bar(
-        f"Cloning git repos to {hf.huggingface_ReposPath}...", max=len(urls)
-    ) as bar:
-        url: str
-        for url in urls:
-            cloneRepo(url=url.strip("\n"), rootGitClonePath=hf.huggingface_ReposPath)
-            bar.next()
+        urls: List[str] = [line.strip("\n") for line in f.readlines()]
+    return urls
+
+
+def applyDownloadPlan(options: CloneOptions, planPath: PurePath) -> CloneOptions:
+    """
+    Leaves the LFS files that `planDownloads` assigned to other clones as
+    pointers, to be linked from the LFS store instead of downloaded
+    """
+    options.lfsExcludes = readJSON(jsonFilePath=planPath)
+    if options.lfsStorePath is None:
+        options.lfsStorePath = hf.huggingface_LFSStorePath
+    return options
+
+
+def main(
+    url: pathlib.Path, options: CloneOptions = CloneOptions()
+) -> List[CloneResult]:
+
+    urls: List[str] = readURLFile(url)
+
+    return cloneRepos(
+        urls=urls,
+        rootGitClonePath=hf.huggingface_ReposPath,
+        options=options,
+        ledger=CloneLedger(ledgerPath=hf.huggingface_ReposLedgerPath),
+        expectedSHAs=readExpectedSHAs() if options.update else None,
+    )
+
+
+def mainQueue(
+    queuePath: PurePath,
+    url: pathlib.Path | None = None,
+    options: CloneOptions = CloneOptions(),
+    leaseDuration: float = 600,
+    requeue: bool = False,
+) -> List[CloneResult]:
+    """
+    Adds the URLs in `url` (if given) to the shared work queue at `queuePath`
+    and then clones from the queue until it is drained. Run this on every node
+    against the same queue instead of splitting the URLs by hand.
+
+    With `requeue`, URLs in `url` (or every URL if `url` is not given) that are
+    already done or failed are handed out again, e.g. to retry failures or to
+    refresh clones with `options.update`.
+    """
+    queue: WorkQueue = WorkQueue(queuePath=queuePath, leaseDuration=leaseDuration)
+
+    urls: List[str] | None = None
+    if url is not None:
+        urls = readURLFile(url)
+        queue.addURLs(urls)
+
+    if requeue:
+        print(f"Requeued {queue.requeue(urls)} repos")
+
+    return cloneFromQueue(
+        queue=queue,
+        rootGitClonePath=hf.huggingface_ReposPath,
+        options=options,
+        ledger=CloneLedger(ledgerPath=hf.huggingface_ReposLedgerPath),
+    )
+
+
+def mainSplitURLs(
+    splitPath: PurePath, options: CloneOptions = CloneOptions(), requeue: bool = False
+) -> List[CloneResult]:
+    """
+    Clones every URL file written by `splitRepos` through the work queue. With
+    `requeue`, repos that finished in an earlier run are handed out again.
+    """
+    queue: WorkQueue = WorkQueue(queuePath=hf.huggingface_ReposQueuePath)
+
+    urlFile: PurePath
+    for urlFile in findFiles(globStr=f"{splitPath}/split_url_*.txt"):
+        queue.addURLs(readURLFile(urlFile))
+
+    if requeue:
+        queue.requeue()
+
+    return cloneFromQueue(
+        queue=queue,
+        rootGitClonePath=hf.huggingface_ReposPath,
+        options=options,
+        ledger=CloneLedger(ledgerPath=hf.huggingface_ReposLedgerPath),
+    )
 
 
 if __name__ == "__main__":
 
     parser = argparse.ArgumentParser()
-    parser.add_argument("url_file", type=pathlib.Path)
+    parser.add_argument("url_file", type=pathlib.Path, nargs="?")
+    parser.add_argument(
+        "--queue",
+        action="store_true",
+        help="Clone from a work queue shared with other nodes (seeded by url_file)",
+    )
+    parser.add_argument(
+        "--queue-path",
+        type=pathlib.Path,
+        default=hf.huggingface_ReposQueuePath,
+        help="SQLite database of the work queue",
+    )
+    parser.add_argument(
+        "--requeue",
+        action="store_true",
+        help="Hand out done and failed repos (of url_file, if given) again",
+    )
+    parser.add_argument(
+        "--lease",
+        type=float,
+        default=600,
+        help="Seconds a queued repo stays assigned to a worker without a heartbeat",
+    )
+    parser.add_argument(
+        "--plan",
+        type=pathlib.Path,
+        nargs="?",
+        const=hf.huggingface_DownloadPlanPath,
+        default=None,
+        help="Link LFS files planned elsewhere by planDownloads.py from the LFS store",
+    )
+    addCloneArguments(parser)
     args = parser.parse_args()
-    main(args.url_file)
+
+    options: CloneOptions = getCloneOptions(args)
+    if args.plan is not None:
+        options = applyDownloadPlan(options, args.plan)
+
+    if args.queue:
+        mainQueue(args.queue_path, args.url_file, options, args.lease, args.requeue)
+    elif args.url_file is None:
+        parser.error("url_file is required unless --queue is given")
+    else:
+        main(args.url_file, options)
@@ -0,0 +1,56 @@
+from os import environ
+from pathlib import PurePath
+
+
+def getShrinkage() -> float:
+    shrinkage: float | str | None
+
+    shrinkageEnvironmentVariable: str = "HF_TORRENT_SHRINKAGE"
+    shrinkageEnvironmentValue: str = environ.get(shrinkageEnvironmentVariable)
+
+    # A byte budget on its own selects from every model
+    if shrinkageEnvironmentValue is None and environ.get("HF_TORRENT_BUDGET"):
+        shrinkageEnvironmentValue = "1"
+
+    try:
+        shrinkage = float(shrinkageEnvironmentValue)
+    except ValueError:
+        print(f"Invalid value for {shrinkageEnvironmentVariable}. Defaulting to 0.1")
+        shrinkage = 0.1
+    except TypeError:
+        print(f"Invalid value for {shrinkageEnvironmentVariable}. Defaulting to 0.1")
+        shrinkage = 0.1
+
+    if shrinkage > 1 or shrinkage <= 0:
+        print(f"Invalid value for {shrinkageEnvironmentVariable}. Defaulting to 0.1")
+        shrinkage = 0.1
+
+    return shrinkage
+
+
+def getShardCount() -> int:
+    shardCount: int
+
+    shardsEnvironmentVariable: str = "HF_TORRENT_SHARDS"
+    shardsEnvironmentValue: str = environ.get(shardsEnvironmentVariable, "100")
+
+    try:
+        shardCount = int(shardsEnvironmentValue)
+    except ValueError:
+        print(f"Invalid value for {shardsEnvironmentVariable}. Defaulting to 100")
+        shardCount = 100
+
+    if shardCount < 1:
+        print(f"Invalid value for {shardsEnvironmentVariable}. Defaulting to 100")
+        shardCount = 100
+
+    return shardCount
+
+
+def getSplitPath() -> PurePath:
+    return PurePath(environ.get("HF_TORRENT_SPLIT_PATH", "split_urls"))
+
+
+def getStream() -> bool:
+    streamEnvironmentVariable: str = "HF_TORRENT_STREAM"
+    return environ.get(streamEnvironmentVariable, "0") not in ["", "0"]
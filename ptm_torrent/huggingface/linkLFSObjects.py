@@ -0,0 +1,33 @@
+import argparse
+from pathlib import PurePath
+
+import ptm_torrent.huggingface as hf
+from ptm_torrent.utils.lfsStore import linkModes, reconcileRepos
+
+
+def main(
+    reposPath: PurePath = hf.huggingface_ReposPath,
+    storePath: PurePath = hf.huggingface_LFSStorePath,
+    linkMode: str = "hardlink",
+    workers: int = 4,
+) -> None:
+    """
+    Moves the LFS objects of every clone into the LFS store and links them.
+    Files that `planDownloads` excluded but whose first copy never reached the
+    store are downloaded, so run this once every shard has finished.
+    """
+    reconcileRepos(
+        reposPath, storePath, linkMode=linkMode, workers=workers, pullExcluded=True
+    )
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repos", type=PurePath, default=hf.huggingface_ReposPath)
+    parser.add_argument("--store", type=PurePath, default=hf.huggingface_LFSStorePath)
+    parser.add_argument("--link", choices=linkModes, default="hardlink")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    main(args.repos, args.store, args.link, args.workers)
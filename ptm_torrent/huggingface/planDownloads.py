@@ -0,0 +1,195 @@
+from concurrent.futures import ThreadPoolExecutor
+from os.path import isfile
+from pathlib import PurePath
+from typing import Dict, List
+
+import numpy
+import pandas
+from numpy import ndarray
+from pandas import DataFrame, Series
+from progress.bar import Bar
+
+import ptm_torrent.huggingface as hf
+from ptm_torrent.huggingface.downloadRepos import readURLFile
+from ptm_torrent.huggingface.selectRepos import fetchSiblings, getFileSize
+from ptm_torrent.huggingface.splitRepos import getHubMetadataPath, readHubMetadata
+from ptm_torrent.utils.fileSystem import findFiles, saveJSON
+from ptm_torrent.utils.lfsStore import getObjectPath
+
+# Characters git-lfs treats as pattern syntax in lfs.fetchexclude
+patternCharacters: str = ",*?[\\"
+
+# Linux limits a single command line argument to 128 KiB
+maxExcludeLength: int = 100000
+
+
+def getFileOID(sibling: dict | None) -> str | None:
+    if isinstance(sibling, dict) == False:
+        return None
+    lfs: dict = sibling.get("lfs") or {}
+    # huggingface_hub keeps the API's "sha256"; newer listings call it "oid"
+    return lfs.get("sha256") or lfs.get("oid")
+
+
+def hasBlobs(siblings: List[dict] | None) -> bool:
+    # Only `?blobs=true` file lists (not the model listing) carry sizes and oids
+    return any(getFileSize(sibling) is not None for sibling in siblings or [])
+
+
+def fetchBlobs(df: DataFrame, workers: int = 8) -> DataFrame:
+    """
+    Replaces the `siblings` of models whose file lists have no sizes or LFS
+    oids with the files the Hub reports for them with `?blobs=true`
+    """
+    if "siblings" not in df.columns:
+        df = df.assign(siblings=None)
+
+    missing: Series = df["siblings"].map(hasBlobs) == False
+    modelIDs: List[str] = df.loc[missing, "id"].astype(str).tolist()
+    if len(modelIDs) == 0:
+        return df
+
+    siblings: List[List[dict] | None] = []
+    with Bar("Fetching LFS oids from Hugging Face...", max=len(modelIDs)) as bar:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            modelSiblings: List[dict] | None
+            for modelSiblings in executor.map(fetchSiblings, modelIDs):
+                siblings.append(modelSiblings)
+                bar.next()
+
+    # Models that could not be fetched keep the files from the listing
+    fetched: Series = Series(siblings, index=df.index[missing], dtype=object)
+    df = df.copy()
+    df.loc[missing, "siblings"] = fetched.where(
+        fetched.notna(), df.loc[missing, "siblings"]
+    )
+    return df
+
+
+def indexObjects(df: DataFrame) -> DataFrame:
+    """
+    Lists every LFS file in the models' `siblings` as one (url, path, oid,
+    size) row, in the order of `df`. Files the listing has no oid for are left
+    out.
+    """
+    if "siblings" not in df.columns:
+        return DataFrame(columns=["url", "path", "oid", "size"])
+
+    siblings: Series = df["siblings"].explode().dropna()
+
+    modelURLs: Series = "https://huggingface.co/" + df["id"].astype(str)
+    index: DataFrame = DataFrame(
+        {
+            "url": modelURLs[siblings.index].to_numpy(),
+            "path": siblings.map(lambda sibling: sibling.get("rfilename")).to_numpy(),
+            "oid": siblings.map(getFileOID).to_numpy(),
+            "size": pandas.to_numeric(
+                siblings.map(getFileSize), errors="coerce"
+            ).to_numpy(),
+        }
+    )
+
+    return index.dropna(subset=["path", "oid"]).reset_index(drop=True)
+
+
+def planDownloads(index: DataFrame, storePath: PurePath) -> DataFrame:
+    """
+    Adds a `download` column to `index` that is True only for the first file
+    of each oid that is not already in the store at `storePath`. Every other
+    file is linked to the store instead of being downloaded.
+    """
+    oids: ndarray = index["oid"].unique()
+    storedOIDs: Series = Series(
+        [isfile(getObjectPath(storePath, oid)) for oid in oids], index=oids
+    )
+
+    index = index.copy()
+    index["download"] = ~(
+        index["oid"].map(storedOIDs).to_numpy()
+        | index["oid"].duplicated(keep="first").to_numpy()
+    )
+    return index
+
+
+def getExcludes(plan: DataFrame) -> Dict[str, List[str]]:
+    """Maps each URL to the `lfs.fetchexclude` patterns of the files it links"""
+    linked: DataFrame = plan[~plan["download"]]
+    # Paths that would be read as patterns are downloaded rather than excluded
+    isPattern: Series = linked["path"].map(
+        lambda path: any(character in path for character in patternCharacters)
+    )
+    linked = linked[~isPattern]
+    linked = linked.sort_values("url", kind="stable")
+
+    urls: ndarray
+    starts: ndarray
+    urls, starts = numpy.unique(linked["url"].to_numpy(), return_index=True)
+    paths: List[ndarray] = numpy.split(linked["path"].to_numpy(), starts[1:])
+
+    excludes: Dict[str, List[str]] = {}
+
+    url: str
+    urlPaths: ndarray
+    for url, urlPaths in zip(urls, paths):
+        patterns: List[str] = []
+        length: int = 0
+
+        path: str
+        for path in urlPaths:
+            # Anchored to the repository root, like a .gitignore pattern
+            length += len(path) + 2
+            if length > maxExcludeLength:
+                break
+            patterns.append(f"/{path}")
+
+        excludes[url] = patterns
+
+    return excludes
+
+
+def main(
+    splitPath: PurePath = PurePath("split_urls"),
+    storePath: PurePath = hf.huggingface_LFSStorePath,
+    planPath: PurePath = hf.huggingface_DownloadPlanPath,
+) -> None | bool:
+    metadataPath: PurePath | None = getHubMetadataPath()
+    if metadataPath is None:
+        return False
+
+    # Every URL that will be cloned, in order, with its position
+    urls: Dict[str, int] = {}
+    urlFile: PurePath
+    for urlFile in sorted(findFiles(globStr=f"{splitPath}/split_url_*.txt")):
+        url: str
+        for url in readURLFile(urlFile):
+            urls.setdefault(url, len(urls))
+
+    print(f"Loading {metadataPath} into DataFrame...")
+    df: DataFrame = readHubMetadata(metadataPath)
+
+    # Keep the selected models in the order they will be cloned
+    positions: Series = ("https://huggingface.co/" + df["id"].astype(str)).map(urls)
+    df = df[positions.notna().to_numpy()]
+    df = df.iloc[positions.dropna().argsort().to_numpy()].reset_index(drop=True)
+
+    print(f"Indexing the LFS files of {len(df)} models...")
+    index: DataFrame = indexObjects(fetchBlobs(df))
+    if len(index) == 0:
+        print("No LFS oids were found for the selected models. Not planning")
+        return False
+
+    plan: DataFrame = planDownloads(index, storePath)
+
+    totalSize: float = plan["size"].sum()
+    downloadSize: float = plan.loc[plan["download"], "size"].sum()
+    print(
+        f"{len(plan)} LFS files ({totalSize / 1e12:.2f} TB), "
+        f"{int(plan['download'].sum())} to download ({downloadSize / 1e12:.2f} TB)"
+    )
+
+    print(f"Saving download plan to {planPath}")
+    saveJSON(json=getExcludes(plan), filepath=planPath)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from os import environ
+from re import Match
+from typing import Dict, List
+
+import numpy as np
+import pandas
+from pandas import DataFrame, Series
+from progress.spinner import Spinner
+from requests import Response
+
+from ptm_torrent.utils.network import get
+
+# Columns of the Hugging Face listing that models can be ranked by
+rankColumns: List[str] = ["downloads", "likes", "lastModified"]
+
+byteUnits: Dict[str, int] = {"": 0, "K": 1, "M": 2, "G": 3, "T": 4, "P": 5}
+
+modelInfoURL: str = "https://huggingface.co/api/models"
+
+
+@dataclass
+class SelectionOptions:
+    # Fraction of the (filtered) models to keep
+    shrinkage: float = 0.1
+    # Keep the best ranked models whose estimated sizes fit in this many bytes
+    byteBudget: int | None = None
+    # Keep models matching any of these values; empty lists keep everything
+    pipelineTags: List[str] = field(default_factory=list)
+    libraries: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    # One of `rankColumns`
+    rankBy: str = "downloads"
+
+
+def parseByteSize(text: str) -> int:
+    """Parses sizes such as "20TB", "500 GiB", or "1024" into bytes"""
+    match: Match | None = re.fullmatch(
+        r"\s*([\d.]+)\s*([KMGTP]?)(I?)B?\s*", text.upper()
+    )
+    if match is None:
+        raise ValueError(f"Invalid size: {text}")
+
+    base: int = 1024 if match.group(3) == "I" else 1000
+    return int(float(match.group(1)) * base ** byteUnits[match.group(2)])
+
+
+def getListEnvironmentVariable(name: str) -> List[str]:
+    return [value.strip() for value in environ.get(name, "").split(",") if value]
+
+
+def getSelectionOptions(shrinkage: float) -> SelectionOptions:
+    """
+    Reads the `HF_TORRENT_BUDGET`, `HF_TORRENT_PIPELINE_TAGS`,
+    `HF_TORRENT_LIBRARIES`, `HF_TORRENT_TAGS`, and `HF_TORRENT_RANK_BY`
+    environment variables
+    """
+    options: SelectionOptions = SelectionOptions(
+        shrinkage=shrinkage,
+        pipelineTags=getListEnvironmentVariable("HF_TORRENT_PIPELINE_TAGS"),
+        libraries=getListEnvironmentVariable("HF_TORRENT_LIBRARIES"),
+        tags=getListEnvironmentVariable("HF_TORRENT_TAGS"),
+    )
+
+    budgetEnvironmentVariable: str = "HF_TORRENT_BUDGET"
+    if environ.get(budgetEnvironmentVariable):
+        try:
+            options.byteBudget = parseByteSize(environ[budgetEnvironmentVariable])
+        except ValueError:
+            print(f"Invalid value for {budgetEnvironmentVariable}. Ignoring it")
+
+    rankEnvironmentVariable: str = "HF_TORRENT_RANK_BY"
+    rankBy: str = environ.get(rankEnvironmentVariable, "downloads")
+    if rankBy not in rankColumns:
+        print(f"Invalid value for {rankEnvironmentVariable}. Defaulting to downloads")
+        rankBy = "downloads"
+    options.rankBy = rankBy
+
+    return options
+
+
+def getFileSize(sibling: dict | None) -> int | None:
+    if isinstance(sibling, dict) == False:
+        return None
+    if sibling.get("size") is not None:
+        return sibling["size"]
+    return (sibling.get("lfs") or {}).get("size")
+
+
+def hasKnownSizes(df: DataFrame) -> bool:
+    if "siblings" not in df.columns:
+        return False
+    return bool(df["siblings"].explode().map(getFileSize).notna().any())
+
+
+def fetchSiblings(modelID: str) -> List[dict] | None:
+    """Returns the files of `modelID` with their sizes, or None on failure"""
+    resp: Response = get(url=f"{modelInfoURL}/{modelID}?blobs=true")
+    if resp.status_code != 200:
+        return None
+    return resp.json().get("siblings")
+
+
+def fetchRepoSizes(
+    df: DataFrame, byteBudget: int, workers: int = 8, batchSize: int = 64
+) -> DataFrame:
+    """
+    Replaces the `siblings` of the best ranked models with file lists that
+    include sizes, fetched a batch at a time until the models exceed
+    `byteBudget` or a whole batch fails. Returns only the models that were
+    fetched.
+    """
+    siblings: List[List[dict] | None] = []
+    totalSize: float = 0
+
+    with Spinner("Fetching repository sizes from Hugging Face...") as spinner:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while len(siblings) < len(df) and totalSize <= byteBudget:
+                batch: Series = df["id"].iloc[len(siblings) : len(siblings) + batchSize]
+
+                modelSiblings: List[dict] | None
+                for modelSiblings in executor.map(fetchSiblings, batch):
+                    siblings.append(modelSiblings)
+                    totalSize += sum(
+                        getFileSize(sibling) or 0 for sibling in modelSiblings or []
+                    )
+                    spinner.next()
+
+                # Stop rather than request every model while the Hub is failing
+                if all(
+                    batchSiblings is None for batchSiblings in siblings[-batchSize:]
+                ):
+                    break
+
+    df = df.iloc[0 : len(siblings)].copy()
+    if "siblings" not in df.columns:
+        df["siblings"] = None
+
+    # Models that could not be fetched keep the files from the listing
+    fetched: Series = Series(siblings, index=df.index, dtype=object)
+    df["siblings"] = fetched.where(fetched.notna(), df["siblings"])
+    return df
+
+
+def estimateRepoSizes(df: DataFrame) -> Series:
+    """
+    Estimates the bytes in each model's repository from its `siblings`.
+
+    Files without a recorded size (the listing only includes sizes when
+    requested) are assumed to be the average size of the files that have one.
+    """
+    if "siblings" not in df.columns:
+        return Series(1, index=df.index)
+
+    siblings: Series = df["siblings"].explode()
+    fileSizes: Series = pandas.to_numeric(siblings.map(getFileSize), errors="coerce")
+
+    averageFileSize: float = fileSizes.mean()
+    if np.isnan(averageFileSize) or averageFileSize <= 0:
+        averageFileSize = 1
+
+    fileSizes = fileSizes.where(siblings.notna(), 0).fillna(averageFileSize)
+    repoSizes: Series = fileSizes.groupby(level=0).sum().reindex(df.index)
+
+    # Even an empty repository costs a clone
+    return repoSizes.fillna(0).clip(lower=averageFileSize)
+
+
+def hasAnyTag(df: DataFrame, tags: List[str]) -> Series:
+    if "tags" not in df.columns:
+        return Series(False, index=df.index)
+
+    modelTags: Series = df["tags"].explode()
+    return (
+        modelTags.isin(tags).groupby(level=0).any().reindex(df.index, fill_value=False)
+    )
+
+
+def filterModels(df: DataFrame, options: SelectionOptions) -> DataFrame:
+    mask: Series = Series(True, index=df.index)
+
+    if len(options.pipelineTags) > 0:
+        mask &= df["pipeline_tag"].isin(options.pipelineTags)
+
+    if len(options.libraries) > 0:
+        # Libraries are listed in `library_name` and repeated in `tags`
+        libraryMask: Series = hasAnyTag(df, options.libraries)
+        if "library_name" in df.columns:
+            libraryMask |= df["library_name"].isin(options.libraries)
+        mask &= libraryMask
+
+    if len(options.tags) > 0:
+        mask &= hasAnyTag(df, options.tags)
+
+    return df[mask]
+
+
+def rankModels(df: DataFrame, rankBy: str = "downloads") -> DataFrame:
+    """Sorts the models best first and renumbers them from 0"""
+    rank: Series = df[rankBy]
+    if rankBy == "lastModified":
+        rank = pandas.to_datetime(rank, errors="coerce", utc=True)
+
+    order: np.ndarray = (
+        rank.reset_index(drop=True)
+        .sort_values(ascending=False, kind="stable", na_position="last")
+        .index.to_numpy()
+    )
+    return df.iloc[order].reset_index(drop=True)
+
+
+def selectModels(df: DataFrame, options: SelectionOptions) -> DataFrame:
+    """
+    Filters, ranks, and then trims the models in the Hugging Face listing.
+
+    Models are filtered by `options.pipelineTags`, `options.libraries`, and
+    `options.tags`, ranked by `options.rankBy`, cut to the best
+    `options.shrinkage` fraction, and finally cut to the best models whose
+    estimated sizes add up to at most `options.byteBudget`. If the listing has
+    no file sizes, they are fetched from the Hub for as many models as the
+    budget needs.
+    """
+    df = filterModels(df, options)
+    print(f"{len(df)} models match the selection filters")
+
+    df = rankModels(df, options.rankBy)
+
+    if options.shrinkage < 1:
+        df = df.iloc[0 : int(len(df) * options.shrinkage)]
+
+    if options.byteBudget is not None:
+        if hasKnownSizes(df) == False:
+            df = fetchRepoSizes(df, options.byteBudget)
+        if len(df) > 0 and hasKnownSizes(df) == False:
+            raise ValueError(
+                "No repository sizes are known, so the byte budget cannot be applied"
+            )
+
+        sizes: Series = estimateRepoSizes(df)
+        df = df[(sizes.cumsum() <= options.byteBudget).to_numpy()]
+        print(
+            f"Selected {len(df)} models "
+            f"(~{sizes.iloc[0 : len(df)].sum() / 1e12:.2f} TB)"
+        )
+
+    return df.reset_index(drop=True)
@@ -1,58 +1,87 @@
-from typing import List
+import heapq
+from os import makedirs
+from pathlib import PurePath
+from typing import List, Tuple
 
-import pandas
-import numpy as np
-from pandas import DataFrame
-from progress.bar import Bar
-from progress.spinner import Spinner
+from pandas import DataFrame, Series
 
 import ptm_torrent.huggingface as hf
-from ptm_torrent.utils.fileSystem import readJSON, testForFile
-from ptm_torrent.utils.git import cloneRepo
-
-
-def readJSONData(json: dict) -> List[str]:
-    data: List[str] = []
-
-    with Spinner("Reading JSON data...") as spinner:
-        obj: dict
-        for obj in json:
-            data.append(f"https://huggingface.co/{obj['id']}")
-            spinner.next()
-
-    return data
-
-
-def shrinkDataFrame(df: DataFrame, shrinkage: float = 0.1) -> DataFrame:
-    if shrinkage >= 1:
-        return df
-
-    dfSize: int = len(df)
-    lastRow: int = int(dfSize * shrinkage)
-
-    return df.iloc[0:lastRow, :]
-
-
-def main(shrinkage: float = 0.1) -> None:
-    if testForFile(path=hf.huggingface_HubMetadataPath) == False:
+from ptm_torrent.huggingface.selectRepos import (
+    SelectionOptions,
+    estimateRepoSizes,
+    selectModels,
+)
+from ptm_torrent.utils.fileSystem import findNewestFile, readDataFrame
+
+
+def getHubMetadataPath() -> PurePath | None:
+    """Returns whichever of the JSON or streamed NDJSON listings is newest"""
+    return findNewestFile(
+        [hf.huggingface_HubMetadataPath, hf.huggingface_HubMetadataStreamPath]
+    )
+
+
+def readHubMetadata(metadataPath: PurePath) -> DataFrame:
+    return readDataFrame(jsonFilePath=metadataPath)
+
+
+def balanceShards(sizes: Series, shardCount: int) -> List[List[int]]:
+    """
+    Assigns each index of `sizes` to one of `shardCount` shards, largest first
+    to the shard with the fewest bytes so far (longest processing time first).
+    Each shard keeps the original order of its indices.
+    """
+    shards: List[List[int]] = [[] for _ in range(shardCount)]
+    heap: List[Tuple[float, int]] = [(0, shard) for shard in range(shardCount)]
+
+    idx: int
+    size: float
+    for idx, size in sizes.sort_values(ascending=False, kind="stable").items():
+        shardSize: float
+        shard: int
+        shardSize, shard = heapq.heappop(heap)
+        shards[shard].append(idx)
+        heapq.heappush(heap, (shardSize + size, shard))
+
+    return [sorted(shard) for shard in shards]
+
+
+def main(
+    shrinkage: float = 0.1,
+    shardCount: int = 100,
+    outputPath: PurePath = PurePath("split_urls"),
+    selection: SelectionOptions | None = None,
+) -> None | bool:
+    if selection is None:
+        selection = SelectionOptions(shrinkage=shrinkage)
+
+    metadataPath: PurePath | None = getHubMetadataPath()
+    if metadataPath is None:
         return False
 
-    print(f"Loading {hf.huggingface_HubMetadataPath} into DataFrame...")
-    df: DataFrame = pandas.read_json(hf.huggingface_HubMetadataPath)
+    print(f"Loading {metadataPath} into DataFrame...")
+    df: DataFrame = readHubMetadata(metadataPath)
+
+    print(f"Selecting models by {selection.rankBy}...")
+    df = selectModels(df, selection)
 
-    print(f"Sorting DataFrame rows by download...")
-    df.sort_values(by="downloads", ascending=False, inplace=True)
-    df.reset_index(inplace=True)
+    print(f"Balancing {len(df)} repositories across {shardCount} shards...")
+    sizes: Series = estimateRepoSizes(df)
+    shards: List[List[int]] = balanceShards(sizes, shardCount)
 
-    print(f"Reducing the size of the DataFrame by {shrinkage * 100}%...")
-    df = shrinkDataFrame(df, shrinkage)
+    makedirs(outputPath, exist_ok=True)
 
-    urls: List[str] = [f"https://huggingface.co/{id}" for id in df["id"]]
-    split_urls = map(lambda x: x.tolist(), np.array_split(urls, 100))
+    i: int
+    shard: List[int]
+    for i, shard in enumerate(shards):
+        with open(f"{outputPath}/split_url_{i}.txt", "w", newline="\n") as f:
+            f.writelines([f"https://huggingface.co/{df['id'][idx]}\n" for idx in shard])
 
-    for i, split_url in enumerate(split_urls):
-        with open(f"./split_urls/split_url_{i}.txt", "w", newline="\n") as f:
-            f.writelines([url + "\n" for url in split_url])
+    shardSizes: List[float] = [sizes[shard].sum() for shard in shards]
+    print(
+        f"Saved shards to {outputPath} "
+        f"(estimated {min(shardSizes):.0f} to {max(shardSizes):.0f} bytes each)"
+    )
 
 
 if __name__ == "__main__":
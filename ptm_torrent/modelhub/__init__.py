@@ -7,6 +7,8 @@ rootFolderPath: PurePath = PurePath(f"{pt.dataFolderPath}/modelhub")
 
 reposFolderPath: PurePath = PurePath(f"{pt.reposFolderPath}")
 
+httpCacheFolderPath: PurePath = PurePath(f"{pt.httpCacheFolderPath}")
+
 jsonFolderPath: PurePath = PurePath(f"{pt.jsonFolderPath}")
 jsonMetadataFolderPath: PurePath = PurePath(f"{pt.jsonMetadataFolderPath}")
 jsonModelMetadataFolderPath: PurePath = PurePath(f"{pt.jsonModelMetadataFolderPath}")
@@ -17,6 +19,7 @@ htmlModelMetadataFolderPath: PurePath = PurePath(f"{pt.htmlModelMetadataFolderPa
 
 subFolders: List[PurePath] = [
     reposFolderPath,
+    httpCacheFolderPath,
     jsonFolderPath,
     jsonMetadataFolderPath,
     jsonModelMetadataFolderPath,
@@ -26,7 +29,15 @@ subFolders: List[PurePath] = [
 ]
 
 modelhub_HubMetadataPath: PurePath = PurePath(
-    f"{rootFolderPath}/{jsonMetadataFolderPath}/mh_metadata.json"
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/mh_metadata.{pt.recordFormat}"
 )
 
 modelhub_ReposPath: PurePath = PurePath(f"{rootFolderPath}/{reposFolderPath}")
+
+modelhub_HTTPCachePath: PurePath = PurePath(f"{rootFolderPath}/{httpCacheFolderPath}")
+
+modelhub_ReposLedgerPath: PurePath = PurePath(f"{rootFolderPath}/repos_ledger.db")
+
+modelhub_PTMSchemaPath: PurePath = PurePath(
+    f"{rootFolderPath}/{jsonFolderPath}/modelhub.{pt.recordFormat}"
+)
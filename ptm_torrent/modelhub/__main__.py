@@ -1,10 +1,22 @@
+from argparse import ArgumentParser
+
 import ptm_torrent.modelhub.createSchema as createSchema
 import ptm_torrent.modelhub.downloadJSON as downloadJSON
 import ptm_torrent.modelhub.downloadRepos as downloadRepos
 import ptm_torrent.modelhub.setupFileSystem as setupFS
+from ptm_torrent.utils.arguments import (
+    addCloneArguments,
+    addDownloadArguments,
+    getCloneOptions,
+)
 
 if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    addCloneArguments(parser)
+    addDownloadArguments(parser)
+    args = parser.parse_args()
+
     setupFS.main()
-    downloadJSON.main()
-    downloadRepos.main()
+    downloadJSON.main(useCache=args.http_cache)
+    downloadRepos.main(options=getCloneOptions(args))
     createSchema.main()
@@ -1,14 +1,18 @@
 from pathlib import PurePath
-from typing import List
+from typing import Dict, List
 from urllib.parse import ParseResult, urlparse
 
-import pandas
 from pandas import DataFrame, Series
 from progress.bar import Bar
 
 import ptm_torrent.modelhub as mh
-from ptm_torrent.utils.fileSystem import saveJSON, testForFile, testForPath
-from ptm_torrent.utils.git import getLatestGitCommit
+from ptm_torrent.utils.fileSystem import (
+    readDataFrame,
+    saveRecords,
+    testForFile,
+    testForPath,
+)
+from ptm_torrent.utils.git import getLatestGitCommits
 from ptm_torrent.utils.ptmSchema import ModelHub, PTMTorrent
 
 
@@ -22,9 +26,20 @@ def createModelHub(row: Series) -> ModelHub:
     return modelHub
 
 
+def getModelRepoPath(url: str) -> PurePath:
+    parsedURL: ParseResult = urlparse(url)
+    urlPath: str = parsedURL.path.strip("/")
+    return PurePath(f"{mh.modelhub_ReposPath}/{urlPath}")
+
+
 def createPTMSchema(df: DataFrame) -> List[dict]:
     data: List[dict] = []
 
+    repoPaths: List[PurePath] = [getModelRepoPath(url) for url in df["github"]]
+    commitSHAs: Dict[PurePath, str] = getLatestGitCommits(
+        gitProjectPaths=[path for path in repoPaths if testForPath(path)]
+    )
+
     with Bar("Creating PTM Torrent objects...", max=len(df)) as bar:
         idx: int
         for idx in range(len(df)):
@@ -35,7 +50,7 @@ def createPTMSchema(df: DataFrame) -> List[dict]:
             parsedURL: ParseResult = urlparse(url)
             urlPath: str = parsedURL.path.strip("/")
 
-            repoPath: PurePath = PurePath(f"{mh.modelhub_ReposPath}/{urlPath}")
+            repoPath: PurePath = repoPaths[idx]
             if testForPath(repoPath) == False:
                 print(f"Path not found: {repoPath}")
                 bar.next()
@@ -45,7 +60,7 @@ def createPTMSchema(df: DataFrame) -> List[dict]:
 
             ptm: PTMTorrent = PTMTorrent(
                 id=idx,
-                latest_git_commit_sha=getLatestGitCommit(gitProjectPath=repoPath),
+                latest_git_commit_sha=commitSHAs[repoPath],
                 model_hub=createModelHub(row),
                 model_name=row["name"],
                 model_owner=splitPath[0],
@@ -68,15 +83,11 @@ def main() -> None | bool:
     if testForFile(path=mh.modelhub_HubMetadataPath) == False:
         return False
 
-    jsonFilePath: PurePath = PurePath(
-        f"{mh.rootFolderPath}/{mh.jsonFolderPath}/modelhub.json"
-    )
-
-    df: DataFrame = pandas.read_json(path_or_buf=mh.modelhub_HubMetadataPath)
+    df: DataFrame = readDataFrame(jsonFilePath=mh.modelhub_HubMetadataPath)
 
     json: List[dict] = createPTMSchema(df)
 
-    saveJSON(json, filepath=jsonFilePath)
+    saveRecords(json, filepath=mh.modelhub_PTMSchemaPath)
 
 
 if __name__ == "__main__":
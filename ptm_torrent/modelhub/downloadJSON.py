@@ -1,22 +1,30 @@
 import ptm_torrent.modelhub as mh
-from ptm_torrent.utils.fileSystem import saveJSON
-from ptm_torrent.utils.network import downloadJSON
+from ptm_torrent.utils.fileSystem import saveRecords, testForFile
+from ptm_torrent.utils.network import CachedResponse, getCached
 
 
-def main() -> None:
+def main(useCache: bool = False) -> bool:
+    """Returns True if the hub metadata changed since the last download"""
     url: str = (
         "https://raw.githubusercontent.com/modelhub-ai/modelhub/master/models.json"
     )
 
     print(f"Downloading JSON from {url}...")
-    json: dict = downloadJSON(url)
+    resp: CachedResponse = getCached(
+        url, cachePath=mh.modelhub_HTTPCachePath if useCache else None
+    )
 
-    if type(json) is int:
+    if resp.statusCode != 200:
         print(f"Unable to download JSON from {url}.")
         quit(1)
 
+    if resp.changed == False and testForFile(path=mh.modelhub_HubMetadataPath):
+        print(f"{url} has not changed since the last download.")
+        return False
+
     print(f"Saving JSON to {mh.modelhub_HubMetadataPath}")
-    saveJSON(json, filepath=mh.modelhub_HubMetadataPath)
+    saveRecords(resp.json(), filepath=mh.modelhub_HubMetadataPath)
+    return True
 
 
 if __name__ == "__main__":
@@ -1,14 +1,14 @@
-from typing import List
+from typing import Iterable, List
 
-from progress.bar import Bar
 from progress.spinner import Spinner
 
 import ptm_torrent.modelhub as mh
-from ptm_torrent.utils.fileSystem import readJSON, testForFile
-from ptm_torrent.utils.git import cloneRepo
+from ptm_torrent.utils.fileSystem import readRecords, testForFile
+from ptm_torrent.utils.git import CloneOptions, CloneResult, cloneRepos
+from ptm_torrent.utils.ledger import CloneLedger
 
 
-def readJSONData(json: dict) -> List[str]:
+def readJSONData(json: Iterable[dict]) -> List[str]:
     data: List[str] = []
 
     with Spinner("Reading JSON data...") as spinner:
@@ -20,19 +20,20 @@ def readJSONData(json: dict) -> List[str]:
     return data
 
 
-def main() -> None | bool:
+def main(options: CloneOptions = CloneOptions()) -> List[CloneResult] | bool:
     if testForFile(path=mh.modelhub_HubMetadataPath) == False:
         return False
 
-    jsonData: dict = readJSON(jsonFilePath=mh.modelhub_HubMetadataPath)
+    jsonData: Iterable[dict] = readRecords(jsonFilePath=mh.modelhub_HubMetadataPath)
 
     urls: List[str] = readJSONData(json=jsonData)
 
-    with Bar(f"Cloning git repos to {mh.modelhub_ReposPath}...", max=len(urls)) as bar:
-        url: str
-        for url in urls:
-            cloneRepo(url=url, rootGitClonePath=mh.modelhub_ReposPath)
-            bar.next()
+    return cloneRepos(
+        urls=urls,
+        rootGitClonePath=mh.modelhub_ReposPath,
+        options=options,
+        ledger=CloneLedger(ledgerPath=mh.modelhub_ReposLedgerPath),
+    )
 
 
 if __name__ == "__main__":
@@ -7,6 +7,8 @@ rootFolderPath: PurePath = PurePath(f"{pt.dataFolderPath}/modelzoo")
 
 reposFolderPath: PurePath = PurePath(f"{pt.reposFolderPath}")
 
+httpCacheFolderPath: PurePath = PurePath(f"{pt.httpCacheFolderPath}")
+
 jsonFolderPath: PurePath = PurePath(f"{pt.jsonFolderPath}")
 jsonMetadataFolderPath: PurePath = PurePath(f"{pt.jsonMetadataFolderPath}")
 jsonModelMetadataFolderPath: PurePath = PurePath(f"{pt.jsonModelMetadataFolderPath}")
@@ -17,6 +19,7 @@ htmlModelMetadataFolderPath: PurePath = PurePath(f"{pt.htmlModelMetadataFolderPa
 
 subFolders: List[PurePath] = [
     reposFolderPath,
+    httpCacheFolderPath,
     jsonFolderPath,
     jsonMetadataFolderPath,
     jsonModelMetadataFolderPath,
@@ -34,7 +37,20 @@ modelzoo_ModelMetadataPath: PurePath = PurePath(
 )
 
 modelzoo_ConcatinatedModelMetadataPath: PurePath = PurePath(
-    f"{rootFolderPath}/{jsonMetadataFolderPath}/mz_models_metadata.json"
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/mz_models_metadata.{pt.recordFormat}"
+)
+
+# The model files that the concatenated model metadata was built from
+modelzoo_ConcatinatedModelListPath: PurePath = PurePath(
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/mz_models_metadata_files.json"
 )
 
 modelzoo_ReposPath: PurePath = PurePath(f"{rootFolderPath}/{reposFolderPath}")
+
+modelzoo_HTTPCachePath: PurePath = PurePath(f"{rootFolderPath}/{httpCacheFolderPath}")
+
+modelzoo_ReposLedgerPath: PurePath = PurePath(f"{rootFolderPath}/repos_ledger.db")
+
+modelzoo_PTMSchemaPath: PurePath = PurePath(
+    f"{rootFolderPath}/{jsonFolderPath}/modelzoo.{pt.recordFormat}"
+)
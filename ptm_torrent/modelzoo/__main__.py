@@ -1,12 +1,24 @@
+from argparse import ArgumentParser
+
 import ptm_torrent.modelzoo.createSchema as createSchema
 import ptm_torrent.modelzoo.downloadHubJSON as downloadHubJSON
 import ptm_torrent.modelzoo.downloadModelJSON as downloadModelJSON
 import ptm_torrent.modelzoo.downloadRepos as downloadRepos
 import ptm_torrent.modelzoo.setupFileSystem as setupFS
+from ptm_torrent.utils.arguments import (
+    addCloneArguments,
+    addDownloadArguments,
+    getCloneOptions,
+)
 
 if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    addCloneArguments(parser)
+    addDownloadArguments(parser)
+    args = parser.parse_args()
+
     setupFS.main()
-    downloadHubJSON.main()
-    downloadModelJSON.main()
-    downloadRepos.main()
+    downloadHubJSON.main(useCache=args.http_cache)
+    downloadModelJSON.main(useCache=args.http_cache)
+    downloadRepos.main(options=getCloneOptions(args))
     createSchema.main()
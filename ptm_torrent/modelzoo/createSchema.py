@@ -1,14 +1,18 @@
 from pathlib import PurePath
-from typing import List
+from typing import Dict, List
 from urllib.parse import ParseResult, urlparse
 
-import pandas
 from pandas import DataFrame, Series
 from progress.bar import Bar
 
 import ptm_torrent.modelzoo as mz
-from ptm_torrent.utils.fileSystem import saveJSON, testForFile, testForPath
-from ptm_torrent.utils.git import getLatestGitCommit
+from ptm_torrent.utils.fileSystem import (
+    readDataFrame,
+    saveRecords,
+    testForFile,
+    testForPath,
+)
+from ptm_torrent.utils.git import getLatestGitCommits
 from ptm_torrent.utils.ptmSchema import ModelHub, PTMTorrent
 
 
@@ -22,9 +26,20 @@ def createModelHub(row: Series) -> ModelHub:
     return mh
 
 
+def getModelRepoPath(url: str) -> PurePath:
+    parsedURL: ParseResult = urlparse(url)
+    urlPath: str = str(parsedURL.path).strip("/")
+    return PurePath(f"{mz.modelzoo_ReposPath}/{urlPath}")
+
+
 def createPTMSchema(df: DataFrame) -> List[dict]:
     data: List[dict] = []
 
+    repoPaths: List[PurePath] = [getModelRepoPath(url) for url in df["link"]]
+    commitSHAs: Dict[PurePath, str] = getLatestGitCommits(
+        gitProjectPaths=[path for path in repoPaths if testForPath(path)]
+    )
+
     with Bar("Creating PTM Torrent objects...", max=len(df)) as bar:
         idx: int
         for idx in range(len(df)):
@@ -35,7 +50,7 @@ def createPTMSchema(df: DataFrame) -> List[dict]:
             parsedURL: ParseResult = urlparse(url)
             urlPath: str = str(parsedURL.path).strip("/")
 
-            repoPath: PurePath = PurePath(f"{mz.modelzoo_ReposPath}/{urlPath}")
+            repoPath: PurePath = repoPaths[idx]
             if testForPath(repoPath) == False:
                 bar.next()
                 continue
@@ -50,7 +65,7 @@ def createPTMSchema(df: DataFrame) -> List[dict]:
 
             ptm: PTMTorrent = PTMTorrent(
                 id=idx,
-                latest_git_commit_sha=getLatestGitCommit(gitProjectPath=repoPath),
+                latest_git_commit_sha=commitSHAs[repoPath],
                 model_hub=createModelHub(row),
                 model_name=row["title"],
                 model_owner=splitPath[0],
@@ -73,17 +88,13 @@ def main() -> None | bool:
     if testForFile(path=mz.modelzoo_ConcatinatedModelMetadataPath) == False:
         return False
 
-    jsonFilePath: PurePath = PurePath(
-        f"{mz.rootFolderPath}/{mz.jsonFolderPath}/modelzoo.json"
-    )
-
-    df: DataFrame = pandas.read_json(
-        path_or_buf=mz.modelzoo_ConcatinatedModelMetadataPath
+    df: DataFrame = readDataFrame(
+        jsonFilePath=mz.modelzoo_ConcatinatedModelMetadataPath
     )
 
     json: List[dict] = createPTMSchema(df)
 
-    saveJSON(json, filepath=jsonFilePath)
+    saveRecords(json, filepath=mz.modelzoo_PTMSchemaPath)
 
 
 if __name__ == "__main__":
@@ -1,22 +1,29 @@
 import ptm_torrent.modelzoo as mz
-from ptm_torrent.utils.fileSystem import saveJSON
-from ptm_torrent.utils.network import downloadJSON
+from ptm_torrent.utils.fileSystem import saveJSON, testForFile
+from ptm_torrent.utils.network import CachedResponse, getCached
 
 
-def main() -> None | bool:
-
+def main(useCache: bool = False) -> bool:
+    """Returns True if the hub metadata changed since the last download"""
     url: str = "https://modelzoo.co/api/models/0/"
     headers: dict = {"User-Agent": "PTMTorrent", "Referer": "https://modelzoo.co/"}
 
     print(f"Downloading JSON from {url}...")
-    jsonData: dict | int = downloadJSON(url, headers)
+    resp: CachedResponse = getCached(
+        url, headers, cachePath=mz.modelzoo_HTTPCachePath if useCache else None
+    )
 
-    if type(jsonData) == int:
+    if resp.statusCode != 200:
         print(f"Unable to download JSON from {url}.")
         return False
 
+    if resp.changed == False and testForFile(path=mz.modelzoo_HubMetadataPath):
+        print(f"{url} has not changed since the last download.")
+        return False
+
     print(f"Saving JSON to {mz.modelzoo_HubMetadataPath}")
-    saveJSON(json=jsonData, filepath=mz.modelzoo_HubMetadataPath)
+    saveJSON(json=resp.json(), filepath=mz.modelzoo_HubMetadataPath)
+    return True
 
 
 if __name__ == "__main__":
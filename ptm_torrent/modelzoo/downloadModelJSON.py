@@ -1,50 +1,79 @@
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import PurePath
-from typing import List
+from typing import List, Tuple
 
 from progress.bar import Bar
 
 import ptm_torrent.modelzoo as mz
-from ptm_torrent.utils.fileSystem import readJSON, saveJSON
-from ptm_torrent.utils.network import downloadJSON
-
-
-def downloadModelMetadata(modelList: List[dict]) -> List[PurePath]:
+from ptm_torrent.utils.crawler import crawl
+from ptm_torrent.utils.fileSystem import readJSON, saveJSON, saveRecords, testForFile
+from ptm_torrent.utils.network import CachedResponse, getCached
+
+
+def downloadModelMetadata(
+    modelList: List[dict], cachePath: PurePath | None = None
+) -> Tuple[List[PurePath], bool]:
+    """
+    Returns the paths of the per-model metadata files and whether any of them
+    changed since the last download
+    """
     headers: dict = {"User-Agent": "PTMTorrent", "Referer": "https://modelzoo.co/"}
 
     paths: List[PurePath] = []
+    changed: bool = False
     slugs: List[str] = [model["slug"] for model in modelList]
+    urls: List[str] = [f"https://modelzoo.co/api/models/{slug}/" for slug in slugs]
 
-    with ThreadPoolExecutor() as executor:
-        with Bar(
-            "Downloading model metadata from modelzoo.co...", max=len(modelList)
-        ) as bar:
+    responses: List[CachedResponse] = crawl(
+        urls=urls,
+        fetch=lambda url: getCached(url, headers, cachePath=cachePath),
+        message="Downloading model metadata from modelzoo.co...",
+    )
 
-            def _concurrurentHelper(modelSlug: str) -> None:
-                url: str = f"https://modelzoo.co/api/models/{modelSlug}/"
-                jsonFilePath: PurePath = PurePath(
-                    f"{mz.modelzoo_ModelMetadataPath}/{modelSlug}_metadata.json"
-                )
-                jsonData: dict | int = downloadJSON(url, headers)
+    modelSlug: str
+    resp: CachedResponse
+    for modelSlug, resp in zip(slugs, responses):
+        if resp.statusCode != 200:
+            print(f"Unable to download metadata for {modelSlug} ({resp.statusCode}).")
+            continue
 
-                saveJSON(json=jsonData, filepath=jsonFilePath)
-                paths.append(jsonFilePath)
-                bar.next()
+        jsonFilePath: PurePath = PurePath(
+            f"{mz.modelzoo_ModelMetadataPath}/{modelSlug}_metadata.json"
+        )
+        paths.append(jsonFilePath)
 
-            executor.map(_concurrurentHelper, slugs)
+        if resp.changed or testForFile(path=jsonFilePath) == False:
+            saveJSON(json=resp.json(), filepath=jsonFilePath)
+            changed = True
 
-    print("\n")
-    return paths
+    return (paths, changed)
 
 
-def main() -> None | bool:
+def main(useCache: bool = False) -> bool:
+    """Returns True if the concatenated model metadata was rewritten"""
     modelMetadataJSON: List[dict] = []
     idCounter: int = 0
 
     modelHubJSON: dict = readJSON(jsonFilePath=mz.modelzoo_HubMetadataPath)
     modelList: List[dict] = modelHubJSON["models"]
 
-    modelJSONPaths: List[PurePath] = downloadModelMetadata(modelList)
+    modelJSONPaths: List[PurePath]
+    changed: bool
+    modelJSONPaths, changed = downloadModelMetadata(
+        modelList, cachePath=mz.modelzoo_HTTPCachePath if useCache else None
+    )
+
+    # Models that were removed from (or reordered in) the hub listing change the
+    # concatenated file even when every model's own metadata is unchanged
+    modelJSONFiles: List[str] = [str(path) for path in modelJSONPaths]
+    if (
+        changed == False
+        and testForFile(path=mz.modelzoo_ConcatinatedModelMetadataPath)
+        and testForFile(path=mz.modelzoo_ConcatinatedModelListPath)
+        and readJSON(jsonFilePath=mz.modelzoo_ConcatinatedModelListPath)
+        == modelJSONFiles
+    ):
+        print("Model metadata has not changed since the last download.")
+        return False
 
     modelJSONPath: PurePath
     with Bar("Concatinating JSON files...", max=len(modelJSONPaths)) as bar:
@@ -55,7 +84,11 @@ def main() -> None | bool:
             modelMetadataJSON.append(modelJSON)
             bar.next()
 
-    saveJSON(json=modelMetadataJSON, filepath=mz.modelzoo_ConcatinatedModelMetadataPath)
+    saveRecords(
+        json=modelMetadataJSON, filepath=mz.modelzoo_ConcatinatedModelMetadataPath
+    )
+    saveJSON(json=modelJSONFiles, filepath=mz.modelzoo_ConcatinatedModelListPath)
+    return True
 
 
 if __name__ == "__main__":
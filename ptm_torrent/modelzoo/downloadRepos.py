@@ -1,15 +1,15 @@
 from pathlib import PurePath
-from typing import List
+from typing import Iterable, List
 
-from progress.bar import Bar
 from progress.spinner import Spinner
 
 import ptm_torrent.modelzoo as mz
-from ptm_torrent.utils.fileSystem import readJSON, testForFile
-from ptm_torrent.utils.git import cloneRepo
+from ptm_torrent.utils.fileSystem import readRecords, testForFile
+from ptm_torrent.utils.git import CloneOptions, CloneResult, cloneRepos
+from ptm_torrent.utils.ledger import CloneLedger
 
 
-def readJSONData(json: List[dict]) -> List[str]:
+def readJSONData(json: Iterable[dict]) -> List[str]:
     data: List[str] = []
 
     with Spinner("Reading JSON data...") as spinner:
@@ -21,25 +21,33 @@ def readJSONData(json: List[dict]) -> List[str]:
     return data
 
 
-def cloneGitRepos(urls: List[str], gitCloneBarePath: PurePath) -> None:
-    url: str
-    with Bar(f"Cloning git repos to {gitCloneBarePath}...", max=len(urls)) as bar:
-        for url in urls:
-            cloneRepo(url, gitCloneBarePath)
-            bar.next()
+def cloneGitRepos(
+    urls: List[str],
+    gitCloneBarePath: PurePath,
+    options: CloneOptions = CloneOptions(),
+    ledger: CloneLedger | None = None,
+) -> List[CloneResult]:
+    return cloneRepos(
+        urls=urls, rootGitClonePath=gitCloneBarePath, options=options, ledger=ledger
+    )
 
 
-def main() -> None | bool:
+def main(options: CloneOptions = CloneOptions()) -> List[CloneResult] | bool:
     if testForFile(path=mz.modelzoo_ConcatinatedModelMetadataPath) == False:
         return False
 
-    jsonData: List[dict] = readJSON(
+    jsonData: Iterable[dict] = readRecords(
         jsonFilePath=mz.modelzoo_ConcatinatedModelMetadataPath
     )
 
     urls: List[str] = readJSONData(json=jsonData)
 
-    cloneGitRepos(urls=urls, gitCloneBarePath=mz.modelzoo_ReposPath)
+    return cloneGitRepos(
+        urls=urls,
+        gitCloneBarePath=mz.modelzoo_ReposPath,
+        options=options,
+        ledger=CloneLedger(ledgerPath=mz.modelzoo_ReposLedgerPath),
+    )
 
 
 if __name__ == "__main__":
@@ -27,8 +27,14 @@ subFolders: List[PurePath] = [
 
 onnxmodelzoo_ReposPath: PurePath = PurePath(f"{rootFolderPath}/{reposFolderPath}")
 
+onnxmodelzoo_ReposLedgerPath: PurePath = PurePath(f"{rootFolderPath}/repos_ledger.db")
+
 onnxmodelzoo_GitRepoPath: PurePath = PurePath(f"{onnxmodelzoo_ReposPath}/onnx/models")
 
+onnxmodelzoo_FileCommitIndexPath: PurePath = PurePath(
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/omz_file_commits.json"
+)
+
 onnxmodelzoo_HubHTMLPath: PurePath = PurePath(
     f"{rootFolderPath}/{htmlMetadataFolderPath}"
 )
@@ -37,18 +43,26 @@ onnxmodelzoo_ModelHTMLPath: PurePath = PurePath(
     f"{rootFolderPath}/{htmlModelMetadataFolderPath}"
 )
 
+onnxmodelzoo_HTMLCachePath: PurePath = PurePath(
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/omz_html_cache.json"
+)
+
 onnxmodelzoo_HubHTMLMetadataPath: PurePath = PurePath(
     f"{rootFolderPath}/{htmlMetadataFolderPath}/README_models.html"
 )
 
 onnxmodelzoo_HubJSONMetadataPath: PurePath = PurePath(
-    f"{rootFolderPath}/{jsonMetadataFolderPath}/omz_metadata.json"
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/omz_metadata.{pt.recordFormat}"
 )
 
 onnxmodelzoo_ModelJSONMetadataPath: PurePath = PurePath(
-    f"{rootFolderPath}/{jsonMetadataFolderPath}/omz_models_metadata.json"
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/omz_models_metadata.{pt.recordFormat}"
 )
 
 onnxmodelzoo_ConcatinatedModelMetadataPath: PurePath = PurePath(
-    f"{rootFolderPath}/{jsonMetadataFolderPath}/omz_models_metadata.json"
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/omz_models_metadata.{pt.recordFormat}"
+)
+
+onnxmodelzoo_PTMSchemaPath: PurePath = PurePath(
+    f"{rootFolderPath}/{jsonFolderPath}/onnxmodelzoo.{pt.recordFormat}"
 )
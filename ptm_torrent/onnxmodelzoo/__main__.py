@@ -1,14 +1,17 @@
+from argparse import ArgumentParser
+
 import ptm_torrent.onnxmodelzoo.createSchema as createSchema
 import ptm_torrent.onnxmodelzoo.downloadRepos as downloadRepos
-import ptm_torrent.onnxmodelzoo.mdToHTML as mdToHTML
-import ptm_torrent.onnxmodelzoo.parseHubHTML as parseHub
-import ptm_torrent.onnxmodelzoo.parseModelHTML as parseModels
+import ptm_torrent.onnxmodelzoo.parseREADMEs as parseREADMEs
 import ptm_torrent.onnxmodelzoo.setupFileSystem as setupFS
+from ptm_torrent.utils.arguments import addCloneArguments, getCloneOptions
 
 if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    addCloneArguments(parser)
+    args = parser.parse_args()
+
     setupFS.main()
-    downloadRepos.main()
-    mdToHTML.main()
-    parseHub.main()
-    parseModels.main()
+    downloadRepos.main(options=getCloneOptions(args))
+    parseREADMEs.main()
     createSchema.main()
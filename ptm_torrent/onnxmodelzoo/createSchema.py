@@ -1,14 +1,19 @@
 from pathlib import PurePath
-from typing import List
+from posixpath import normpath
+from typing import Dict, List
 from urllib.parse import ParseResult, urlparse
 
-import pandas
 from pandas import DataFrame, Series
 from progress.bar import Bar
 
 import ptm_torrent.onnxmodelzoo as omz
-from ptm_torrent.utils.fileSystem import saveJSON, testForFile, testForPath
-from ptm_torrent.utils.git import getLatestGitCommitOfFile
+from ptm_torrent.utils.fileSystem import (
+    readDataFrame,
+    saveRecords,
+    testForFile,
+    testForPath,
+)
+from ptm_torrent.utils.git import getLatestGitCommitOfFile, loadFileCommitIndex
 from ptm_torrent.utils.ptmSchema import ModelHub, PTMTorrent
 
 
@@ -22,9 +27,26 @@ def createModelHub(row: Series) -> ModelHub:
     return mh
 
 
+def getLatestCommitOfModel(
+    repoPath: PurePath, modelPath: str, fileCommits: Dict[str, str]
+) -> str:
+    sha: str | None = fileCommits.get(normpath(modelPath))
+    if sha is None:
+        # Directories and paths git log does not list verbatim
+        sha = getLatestGitCommitOfFile(gitProjectPath=repoPath, filepath=modelPath)
+    return sha
+
+
 def createPTMSchema(df: DataFrame) -> List[dict]:
     data: List[dict] = []
 
+    fileCommits: Dict[str, str] = {}
+    if testForPath(omz.onnxmodelzoo_GitRepoPath):
+        fileCommits = loadFileCommitIndex(
+            gitProjectPath=omz.onnxmodelzoo_GitRepoPath,
+            indexPath=omz.onnxmodelzoo_FileCommitIndexPath,
+        )
+
     with Bar("Creating PTM Torrent objects...", max=len(df)) as bar:
         idx: int
         for idx in range(len(df)):
@@ -45,8 +67,10 @@ def createPTMSchema(df: DataFrame) -> List[dict]:
 
             ptm: PTMTorrent = PTMTorrent(
                 id=idx,
-                latest_git_commit_sha=getLatestGitCommitOfFile(
-                    gitProjectPath=repoPath, filepath=row["ModelPath"]
+                latest_git_commit_sha=getLatestCommitOfModel(
+                    repoPath=repoPath,
+                    modelPath=row["ModelPath"],
+                    fileCommits=fileCommits,
                 ),
                 model_hub=createModelHub(row),
                 model_name=row["Model"],
@@ -70,17 +94,13 @@ def main() -> None | bool:
     if testForFile(path=omz.onnxmodelzoo_ConcatinatedModelMetadataPath) == False:
         return False
 
-    jsonFilePath: PurePath = PurePath(
-        f"{omz.rootFolderPath}/{omz.jsonFolderPath}/onnxmodelzoo.json"
-    )
-
-    df: DataFrame = pandas.read_json(
-        path_or_buf=omz.onnxmodelzoo_ConcatinatedModelMetadataPath
+    df: DataFrame = readDataFrame(
+        jsonFilePath=omz.onnxmodelzoo_ConcatinatedModelMetadataPath
     )
 
     json: List[dict] = createPTMSchema(df)
 
-    saveJSON(json, filepath=jsonFilePath)
+    saveRecords(json, filepath=omz.onnxmodelzoo_PTMSchemaPath)
 
 
 if __name__ == "__main__":
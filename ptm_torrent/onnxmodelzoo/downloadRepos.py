@@ -1,23 +1,30 @@
 from pathlib import PurePath
 from typing import List
 
-from progress.bar import Bar
-
 import ptm_torrent.onnxmodelzoo as omz
-from ptm_torrent.utils.git import cloneRepo
+from ptm_torrent.utils.git import CloneOptions, CloneResult, cloneRepos
+from ptm_torrent.utils.ledger import CloneLedger
 
 
-def cloneGitRepos(urls: List[str], gitCloneBarePath: PurePath) -> None:
-    url: str
-    with Bar(f"Cloning git repos to {gitCloneBarePath}...", max=len(urls)) as bar:
-        for url in urls:
-            cloneRepo(url, gitCloneBarePath)
-            bar.next()
+def cloneGitRepos(
+    urls: List[str],
+    gitCloneBarePath: PurePath,
+    options: CloneOptions = CloneOptions(),
+    ledger: CloneLedger | None = None,
+) -> List[CloneResult]:
+    return cloneRepos(
+        urls=urls, rootGitClonePath=gitCloneBarePath, options=options, ledger=ledger
+    )
 
 
-def main() -> None | bool:
+def main(options: CloneOptions = CloneOptions()) -> List[CloneResult] | bool:
     urls: List[str] = ["https://github.com/onnx/models"]
-    cloneGitRepos(urls, omz.onnxmodelzoo_ReposPath)
+    return cloneGitRepos(
+        urls,
+        omz.onnxmodelzoo_ReposPath,
+        options=options,
+        ledger=CloneLedger(ledgerPath=omz.onnxmodelzoo_ReposLedgerPath),
+    )
 
 
 if __name__ == "__main__":
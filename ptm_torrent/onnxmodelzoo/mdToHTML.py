@@ -1,34 +1,99 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from itertools import repeat
 from pathlib import PurePath
-from typing import List
+from typing import Dict, List, Tuple
 
 from progress.bar import Bar
 
 import ptm_torrent.onnxmodelzoo as omz
-from ptm_torrent.utils.fileSystem import findFiles, markdownToHTML
+from ptm_torrent.utils.fileSystem import (
+    findFiles,
+    getHTMLFilepath,
+    markdownToHTML,
+    readJSON,
+    saveJSON,
+    testForFile,
+)
 
 
-def main() -> None:
+def hashFile(filepath: PurePath) -> str:
+    with open(filepath, "rb") as file:
+        return sha256(file.read()).hexdigest()
+
+
+def readCache() -> Dict[str, str]:
+    if testForFile(path=omz.onnxmodelzoo_HTMLCachePath) == False:
+        return {}
+    return readJSON(jsonFilePath=omz.onnxmodelzoo_HTMLCachePath)
+
+
+def main(workers: int = 4, prettify: bool = True) -> None:
+    """
+    Converts every README in the ONNX Model Zoo to HTML on `workers`
+    processes. READMEs whose content (and `prettify`) are unchanged since the
+    last run, and whose HTML still exists, are skipped.
+    """
     readmeFiles: List[PurePath] = findFiles(
         globStr=f"{omz.onnxmodelzoo_GitRepoPath}/**/README.md"
     )
 
     onnxmodelzooREADMEPath: PurePath = readmeFiles.pop(0)
 
-    with Bar("Converting markdown files to HTML...", max=len(readmeFiles)) as bar:
+    conversions: List[Tuple[PurePath, PurePath]] = [
+        (omz.onnxmodelzoo_HubHTMLPath, onnxmodelzooREADMEPath)
+    ]
+    conversions.extend(
+        (omz.onnxmodelzoo_ModelHTMLPath, filepath) for filepath in readmeFiles
+    )
+
+    cache: Dict[str, str] = readCache()
+    updatedCache: Dict[str, str] = {}
+    outputDirectories: List[PurePath] = []
+    markdownFilepaths: List[PurePath] = []
+
+    outputDirectory: PurePath
+    markdownFilepath: PurePath
+    for outputDirectory, markdownFilepath in conversions:
+        key: str = f"{hashFile(markdownFilepath)}:{prettify}"
+        updatedCache[str(markdownFilepath)] = key
 
-        markdownToHTML(
-            outputDirectory=omz.onnxmodelzoo_HubHTMLPath,
-            markdownFilepath=onnxmodelzooREADMEPath,
-        )
+        htmlFilepath: PurePath = getHTMLFilepath(outputDirectory, markdownFilepath)
+        if cache.get(str(markdownFilepath)) == key and testForFile(path=htmlFilepath):
+            continue
 
-        filepath: PurePath
-        for filepath in readmeFiles:
-            markdownToHTML(
-                outputDirectory=omz.onnxmodelzoo_ModelHTMLPath,
-                markdownFilepath=filepath,
-            )
-            bar.next()
+        outputDirectories.append(outputDirectory)
+        markdownFilepaths.append(markdownFilepath)
+
+    print(f"{len(conversions) - len(markdownFilepaths)} READMEs are unchanged")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        with Bar(
+            "Converting markdown files to HTML...", max=len(markdownFilepaths)
+        ) as bar:
+            for _ in executor.map(
+                markdownToHTML,
+                outputDirectories,
+                markdownFilepaths,
+                repeat(prettify),
+                chunksize=8,
+            ):
+                bar.next()
+
+    saveJSON(json=updatedCache, filepath=omz.onnxmodelzoo_HTMLCachePath)
 
 
 if __name__ == "__main__":
-    main()
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Number of conversion processes"
+    )
+    parser.add_argument(
+        "--no-prettify",
+        action="store_true",
+        help="Write the rendered HTML without reformatting it",
+    )
+    args = parser.parse_args()
+
+    main(workers=args.workers, prettify=args.no_prettify == False)
@@ -7,7 +7,7 @@ from pandas import DataFrame, Series
 from progress.bar import Bar
 
 import ptm_torrent.onnxmodelzoo as omz
-from ptm_torrent.utils.fileSystem import readHTML, saveJSON
+from ptm_torrent.utils.fileSystem import readHTML, saveRecords
 
 
 def getCategories(soup: BeautifulSoup) -> List[str]:
@@ -80,16 +80,13 @@ def extractData(row: Series, id: int) -> dict:
     return data
 
 
-def main() -> None:
+def extractHubMetadata(tables: List[DataFrame], categories: List[str]) -> List[dict]:
+    """
+    Converts the hub README's tables (as read by `pandas.read_html` with
+    `extract_links="all"`) and its category anchors into metadata records
+    """
     json: List[dict] = []
 
-    soup: BeautifulSoup = readHTML(htmlFilePath=omz.onnxmodelzoo_HubHTMLMetadataPath)
-    categories: List[str] = getCategories(soup)
-
-    tables: List[DataFrame] = pandas.read_html(
-        io=omz.onnxmodelzoo_HubHTMLMetadataPath, extract_links="all"
-    )
-
     categories = categories[0 : len(tables) - len(categories)]
 
     data: DataFrame = prepareData(dfs=tables, categories=categories)
@@ -102,7 +99,20 @@ def main() -> None:
             json.append(extractData(row, id=idx))
             bar.next()
 
-    saveJSON(json, filepath=omz.onnxmodelzoo_HubJSONMetadataPath)
+    return json
+
+
+def main() -> None:
+    soup: BeautifulSoup = readHTML(htmlFilePath=omz.onnxmodelzoo_HubHTMLMetadataPath)
+    categories: List[str] = getCategories(soup)
+
+    tables: List[DataFrame] = pandas.read_html(
+        io=omz.onnxmodelzoo_HubHTMLMetadataPath, extract_links="all"
+    )
+
+    json: List[dict] = extractHubMetadata(tables, categories)
+
+    saveRecords(json, filepath=omz.onnxmodelzoo_HubJSONMetadataPath)
 
 
 if __name__ == "__main__":
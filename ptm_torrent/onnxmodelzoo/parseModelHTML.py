@@ -1,13 +1,14 @@
 from collections import namedtuple
+from operator import itemgetter
 from pathlib import PurePath
-from typing import List
+from typing import Iterable, List
 
 import pandas
 from pandas import DataFrame, Series
 from progress.bar import Bar
 
 import ptm_torrent.onnxmodelzoo as omz
-from ptm_torrent.utils.fileSystem import readJSON, saveJSON
+from ptm_torrent.utils.fileSystem import readRecords, saveRecords
 
 MetadataGroup = namedtuple(
     typename="MetadataGroup",
@@ -22,8 +23,6 @@ def prepareData(
     category: str,
     firstColumn: str = "Model",
 ) -> DataFrame:
-    validDFs: List[DataFrame] = []
-
     df: DataFrame
     for df in dfs:
         df.columns = [pair[0] for pair in df.columns]
@@ -34,12 +33,9 @@ def prepareData(
         ] = f"https://github.com/onnx/models/tree/main/{readmePath.__str__()}"
 
         if df.columns.__contains__(firstColumn):
-            rowCount: int = len(df)
-            idx: int
-            for idx in range(rowCount):
-                if df.loc[idx, firstColumn][0][0] == ">":
-                    df.drop(index=idx, inplace=True)
-            validDFs.append(df)
+            # Rows that hold a "> Note" rather than a model
+            isNote: Series = df[firstColumn].map(itemgetter(0)).str.startswith(">")
+            df.drop(index=df.index[isNote.to_numpy(dtype=bool)], inplace=True)
 
     data: DataFrame = pandas.concat(objs=dfs, ignore_index=True)
 
@@ -49,17 +45,23 @@ def prepareData(
 def extractTextFromPair(
     df: DataFrame, labels: List[str], pairIndex: int = 0, drop: bool = False
 ) -> DataFrame:
-    rowCount: int = len(df)
-    idx: int
-    for idx in range(rowCount):
-        label: str
-        for label in labels:
-            try:
-                df.loc[idx, label] = df.loc[idx, label][pairIndex]
-            except TypeError:
-                if drop:
-                    df.drop(index=idx, inplace=True)
-                continue
+    """
+    Replaces every (text, link) pair in the `labels` columns with its item at
+    `pairIndex`. Empty cells are left as they are, or with `drop` their rows
+    are removed.
+    """
+    isPair: DataFrame = df[labels].notna()
+
+    if drop:
+        hasPairs: Series = isPair.all(axis=1)
+        df.drop(index=df.index[~hasPairs.to_numpy()], inplace=True)
+        isPair = isPair[hasPairs]
+
+    label: str
+    for label in labels:
+        mask: Series = isPair[label]
+        df.loc[mask, label] = df.loc[mask, label].map(itemgetter(pairIndex))
+
     return df
 
 
@@ -75,85 +77,73 @@ def mergeColumns(
 
 
 def createJSON(df: DataFrame, category: str) -> List[dict]:
-    json: List[dict] = []
-    df = df.fillna(value="N/A")
-    rowCount: int = len(df)
-
-    idx: int
-    for idx in range(rowCount):
-        data: dict = {}
-
-        row: Series = df.loc[idx]
-        readmePath: PurePath = row["readmePath"]
-
-        data["id"] = idx
-        data["Model"] = row["Model"]
-        data["ModelSize"] = row["Download"][0]
-        data["ModelPath"] = f'{readmePath}/{row["Download"][1]}'
-        data["ONNXVersion"] = row["ONNX version"]
-        data[r"Top-1% Accuracy"] = row["Top-1 accuracy (%)"]
-        data[r"Top-5% Accuracy"] = row["Top-5 accuracy (%)"]
-        data["Accuracy"] = row["Accuracy"]
-        data["mAP"] = row["mAP"]
-        data["mIOU"] = row["mIOU  (%)"]
-        data["Mean IoU"] = row["Mean IoU"]
-        data["LFW * accuracy (%)"] = row["LFW * accuracy (%)"]
-        data["CFP-FF * accuracy (%)"] = row["CFP-FF * accuracy (%)"]
-        data["CFP-FP * accuracy (%)"] = row["CFP-FP * accuracy (%)"]
-        data["AgeDB-30 * accuracy (%)"] = row["AgeDB-30 * accuracy (%)"]
-        data["Dataset"] = row["Dataset"]
-        data["OpsetVersion"] = row["OpsetVersion"]
-        data["Top-1 Error (%)"] = row["Top-1 Error (%)"]
-        data["Category"] = row["category"]
-        data["GitHub URL"] = row["GitHub URL"]
-
-        try:
-            data["ModelSampleSize"] = row["Download (with sample test data)"][0]
-        except TypeError:
-            data["ModelSampleSize"] = None
-
-        try:
-            data[
-                "ModelSamplePath"
-            ] = f'{readmePath}/{row["Download (with sample test data)"][1]}'
-        except TypeError:
-            data["ModelSamplePath"] = None
-
-        json.append(data)
-
-    return json
-
-
-def main() -> None:
-    tables: List[DataFrame] = []
-    tableLabels: List[str] = [
-        "ONNX version",
-        "Opset version",
-        "Opset Version",
-        "Top-1 accuracy (%)",
-        "Top-5 accuracy (%)",
-        "Top-1 error",
-        "TOP-1 ERROR",
-        "Top-5 error",
-        "Accuracy",
-        "mAP",
-        "mIOU  (%)",
-        "Filename",
-        "Size",
-        "Details",
-        "Mean IoU",
-        "LFW * accuracy (%)",
-        "CFP-FF * accuracy (%)",
-        "CFP-FP * accuracy (%)",
-        "AgeDB-30 * accuracy (%)",
-        "Dataset",
-    ]
-
-    modelHubMetadata: List[dict] = readJSON(
-        jsonFilePath=omz.onnxmodelzoo_HubJSONMetadataPath
+    df = df.fillna(value="N/A").reset_index(drop=True)
+    readmePaths: Series = df["readmePath"].map(str)
+
+    def _getFilePaths(downloads: Series) -> Series:
+        # Formatted per cell so that missing links read "None" as before
+        return readmePaths + "/" + downloads.map(lambda pair: f"{pair[1]}")
+
+    data: DataFrame = DataFrame(
+        {
+            "id": df.index,
+            "Model": df["Model"],
+            "ModelSize": df["Download"].map(itemgetter(0)),
+            "ModelPath": _getFilePaths(df["Download"]),
+            "ONNXVersion": df["ONNX version"],
+            r"Top-1% Accuracy": df["Top-1 accuracy (%)"],
+            r"Top-5% Accuracy": df["Top-5 accuracy (%)"],
+            "Accuracy": df["Accuracy"],
+            "mAP": df["mAP"],
+            "mIOU": df["mIOU  (%)"],
+            "Mean IoU": df["Mean IoU"],
+            "LFW * accuracy (%)": df["LFW * accuracy (%)"],
+            "CFP-FF * accuracy (%)": df["CFP-FF * accuracy (%)"],
+            "CFP-FP * accuracy (%)": df["CFP-FP * accuracy (%)"],
+            "AgeDB-30 * accuracy (%)": df["AgeDB-30 * accuracy (%)"],
+            "Dataset": df["Dataset"],
+            "OpsetVersion": df["OpsetVersion"],
+            "Top-1 Error (%)": df["Top-1 Error (%)"],
+            "Category": df["category"],
+            "GitHub URL": df["GitHub URL"],
+            "ModelSampleSize": df["Download (with sample test data)"].map(
+                itemgetter(0)
+            ),
+            "ModelSamplePath": _getFilePaths(df["Download (with sample test data)"]),
+        },
+        dtype=object,
     )
 
-    mgList = []
+    return data.to_dict(orient="records")
+
+
+# Columns whose cells are reduced from (text, link) pairs to their text
+tableLabels: List[str] = [
+    "ONNX version",
+    "Opset version",
+    "Opset Version",
+    "Top-1 accuracy (%)",
+    "Top-5 accuracy (%)",
+    "Top-1 error",
+    "TOP-1 ERROR",
+    "Top-5 error",
+    "Accuracy",
+    "mAP",
+    "mIOU  (%)",
+    "Filename",
+    "Size",
+    "Details",
+    "Mean IoU",
+    "LFW * accuracy (%)",
+    "CFP-FF * accuracy (%)",
+    "CFP-FP * accuracy (%)",
+    "AgeDB-30 * accuracy (%)",
+    "Dataset",
+]
+
+
+def getMetadataGroups(modelHubMetadata: Iterable[dict]) -> List[MetadataGroup]:
+    mgList: List[MetadataGroup] = []
 
     metadata: dict
     for metadata in modelHubMetadata:
@@ -168,21 +158,11 @@ def main() -> None:
             )
             mgList.append(mg)
 
-    with Bar("Converting model HTML data into DataFrames...", max=len(mgList)) as bar:
-
-        mg: MetadataGroup
-        for mg in mgList:
-            modelTables: List[DataFrame] = pandas.read_html(
-                io=mg.HTMLReadmePath, extract_links="all"
-            )
+    return mgList
 
-            tables.append(
-                prepareData(
-                    dfs=modelTables, readmePath=mg.RepoReadmePath, category=mg.Category
-                )
-            )
-            bar.next()
 
+def extractModelMetadata(tables: List[DataFrame]) -> List[dict]:
+    """Cleans and converts every model README's prepared tables into records"""
     data: DataFrame = pandas.concat(objs=tables, ignore_index=True)
     data = extractTextFromPair(df=data, labels=["Model"], drop=True)
     data.reset_index(drop=True, inplace=True)
@@ -202,9 +182,36 @@ def main() -> None:
         newColumn=r"Top-1 Error (%)",
     )
 
-    json: List[dict] = createJSON(df=data, category="test")
+    return createJSON(df=data, category="test")
+
+
+def main() -> None:
+    tables: List[DataFrame] = []
+
+    modelHubMetadata: Iterable[dict] = readRecords(
+        jsonFilePath=omz.onnxmodelzoo_HubJSONMetadataPath
+    )
+
+    mgList: List[MetadataGroup] = getMetadataGroups(modelHubMetadata)
+
+    with Bar("Converting model HTML data into DataFrames...", max=len(mgList)) as bar:
+
+        mg: MetadataGroup
+        for mg in mgList:
+            modelTables: List[DataFrame] = pandas.read_html(
+                io=mg.HTMLReadmePath, extract_links="all"
+            )
+
+            tables.append(
+                prepareData(
+                    dfs=modelTables, readmePath=mg.RepoReadmePath, category=mg.Category
+                )
+            )
+            bar.next()
+
+    json: List[dict] = extractModelMetadata(tables)
 
-    saveJSON(json, filepath=omz.onnxmodelzoo_ModelJSONMetadataPath)
+    saveRecords(json, filepath=omz.onnxmodelzoo_ModelJSONMetadataPath)
 
 
 if __name__ == "__main__":
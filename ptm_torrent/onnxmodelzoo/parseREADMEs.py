@@ -0,0 +1,261 @@
+import re
+from pathlib import PurePath
+from re import Pattern
+from typing import Dict, List, Tuple
+
+import lxml.html
+import numpy
+from lxml.html import HtmlElement
+from markdown import markdown
+from pandas import DataFrame, Index
+from progress.bar import Bar
+
+import ptm_torrent.onnxmodelzoo as omz
+from ptm_torrent.onnxmodelzoo.parseHubHTML import extractHubMetadata
+from ptm_torrent.onnxmodelzoo.parseModelHTML import (
+    MetadataGroup,
+    extractModelMetadata,
+    getMetadataGroups,
+    prepareData,
+)
+from ptm_torrent.utils.fileSystem import saveRecords, testForFile
+
+# The whitespace `pandas.read_html` collapses into a single space
+whitespace: Pattern = re.compile(r"[\r\n]+|\s{2,}")
+
+Cell = Tuple[str, str | None]
+# A cell that a rowspan copies into later rows: (column, cell, rows left)
+Span = Tuple[int, Cell, int]
+
+
+def renderMarkdown(markdownFilepath: PurePath) -> HtmlElement:
+    with open(markdownFilepath, "r") as markdownFile:
+        html: str = markdown(
+            markdownFile.read(), extensions=["tables"], output_format="html"
+        )
+        markdownFile.close()
+
+    return lxml.html.document_fromstring(f"<html><body>{html}</body></html>")
+
+
+def getCellText(cell: HtmlElement) -> str:
+    """
+    Returns the text `pandas.read_html` reads from `cell` once the document
+    has been written by `BeautifulSoup.prettify()`, which puts every tag and
+    stripped string on a line of its own
+    """
+    strings: List[str] = [text.strip() for text in cell.itertext()]
+    return "  ".join(whitespace.sub(" ", text) for text in strings if text)
+
+
+def readCell(cell: HtmlElement) -> Cell:
+    # The first link in the cell, as with `extract_links="all"`
+    hrefs: List[str] = cell.xpath(".//a/@href")
+    return (getCellText(cell), hrefs[0] if len(hrefs) > 0 else None)
+
+
+def expandSpans(
+    rows: List[HtmlElement], spans: List[Span], overflow: bool = True
+) -> Tuple[List[List[Cell]], List[Span]]:
+    """
+    Reads the cells of `rows`, copying cells with a `rowspan` or `colspan`
+    into every cell they cover, as `pandas.read_html` does. Spans that reach
+    past the last row are returned for the next section, or with `overflow`
+    False, appended as rows of their own.
+    """
+    cellRows: List[List[Cell]] = []
+
+    row: HtmlElement
+    for row in rows:
+        cells: List[Cell] = []
+        nextSpans: List[Span] = []
+
+        cell: HtmlElement
+        for cell in row.xpath("./td|./th"):
+            # Spans from earlier rows that come before this cell
+            while len(spans) > 0 and spans[0][0] <= len(cells):
+                span: Span = spans.pop(0)
+                cells.append(span[1])
+                if span[2] > 1:
+                    nextSpans.append((span[0], span[1], span[2] - 1))
+
+            value: Cell = readCell(cell)
+            rowspan: int = int(cell.get("rowspan") or 1)
+            colspan: int = int(cell.get("colspan") or 1)
+
+            for _ in range(colspan):
+                if rowspan > 1:
+                    nextSpans.append((len(cells), value, rowspan - 1))
+                cells.append(value)
+
+        # Spans from earlier rows past this row's last cell
+        for span in spans:
+            cells.append(span[1])
+            if span[2] > 1:
+                nextSpans.append((span[0], span[1], span[2] - 1))
+
+        cellRows.append(cells)
+        spans = nextSpans
+
+    while overflow == False and len(spans) > 0:
+        cellRows.append([span[1] for span in spans])
+        spans = [(span[0], span[1], span[2] - 1) for span in spans if span[2] > 1]
+
+    return cellRows, spans
+
+
+def getColumnNames(levels: List[list]) -> List[Cell | str | tuple]:
+    """
+    Names the columns as `pandas.read_html` does from the (padded) header
+    rows, which hold one level each
+    """
+    names: List[Cell | str | tuple] = []
+    counts: Dict[Cell | str | tuple, int] = {}
+
+    idx: int
+    for idx in range(len(levels[0])):
+        # Cells that only pad a short header row
+        if len(levels) == 1:
+            name: Cell | str | tuple = levels[0][idx] or f"Unnamed: {idx}"
+        else:
+            name = tuple(
+                level[idx] or f"Unnamed: {idx}_level_{levelIdx}"
+                for levelIdx, level in enumerate(levels)
+            )
+
+        # Repeated names get a ".1", ".2", ... suffix on their last level
+        count: int = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            if len(levels) == 1:
+                name = f"{name}.{count}"
+            else:
+                name = (*name[:-1], f"{name[-1]}.{count}")
+            count = counts.get(name, 0)
+
+        names.append(name)
+        counts[name] = count + 1
+
+    # Only the first two levels are kept
+    if len(levels) > 1:
+        return [name[0:2] for name in names]
+    return names
+
+
+def readTable(table: HtmlElement) -> DataFrame | None:
+    """
+    Reads `table` into the same DataFrame that
+    `pandas.read_html(extract_links="all")` returns for it, or None if
+    `pandas.read_html` skips it
+    """
+    headerRows: List[HtmlElement] = table.xpath(".//thead/tr")
+    bodyRows: List[HtmlElement] = table.xpath(".//tbody//tr") + table.xpath("./tr")
+    footerRows: List[HtmlElement] = table.xpath(".//tfoot//tr")
+
+    # Without a <thead>, leading rows of <th> cells are the header
+    if len(headerRows) == 0:
+        while len(bodyRows) > 0 and all(
+            cell.tag == "th" for cell in bodyRows[0].xpath("./td|./th")
+        ):
+            headerRows.append(bodyRows.pop(0))
+
+    spans: List[Span]
+    header: List[List[Cell]]
+    body: List[List[Cell]]
+    footer: List[List[Cell]]
+    header, spans = expandSpans(headerRows, [])
+    body, spans = expandSpans(bodyRows, spans, overflow=len(footerRows) > 0)
+    footer, _ = expandSpans(footerRows, spans, overflow=False)
+
+    rows: List[List[Cell]] = header + body + footer
+    width: int = max((len(row) for row in rows), default=0)
+    if width == 0:
+        return None
+
+    # Short rows are padded with missing values
+    paddedRows: List[list] = [row + [numpy.nan] * (width - len(row)) for row in rows]
+
+    if len(header) == 0:
+        return DataFrame(data=paddedRows)
+
+    # Header rows without any cells are left out of the column names
+    levels: List[list] = [
+        [*row, *[""] * (width - len(row))] for row in header if len(row) > 0
+    ]
+    if len(header) == 1:
+        levels = [[""] * width] if len(levels) == 0 else levels
+
+    columnNames: List[Cell | str | tuple] = getColumnNames(levels)
+    return DataFrame(
+        data=paddedRows[len(header) :],
+        columns=Index(columnNames, tupleize_cols=False),
+    )
+
+
+def readTables(document: HtmlElement) -> List[DataFrame]:
+    """Reads every table in `document` as `pandas.read_html` would"""
+    tables: List[DataFrame | None] = [
+        readTable(table) for table in document.iter("table")
+    ]
+    return [table for table in tables if table is not None]
+
+
+def getCategories(document: HtmlElement) -> List[str]:
+    return [
+        anchor.get("name")
+        for anchor in document.iter("a")
+        if anchor.get("name") is not None
+    ]
+
+
+def getModelREADMEPath(repoReadmePath: PurePath) -> PurePath:
+    return PurePath(f"{omz.onnxmodelzoo_GitRepoPath}/{repoReadmePath}/README.md")
+
+
+def readModelTable(mg: MetadataGroup) -> DataFrame | None:
+    readmePath: PurePath = getModelREADMEPath(mg.RepoReadmePath)
+    if testForFile(path=readmePath) == False:
+        print(f"\nREADME not found: {readmePath}")
+        return None
+
+    return prepareData(
+        dfs=readTables(renderMarkdown(readmePath)),
+        readmePath=mg.RepoReadmePath,
+        category=mg.Category,
+    )
+
+
+def main() -> None | bool:
+    """
+    Writes the hub and model metadata that `mdToHTML`, `parseHubHTML`, and
+    `parseModelHTML` produce, but reads the tables straight from the READMEs
+    in the onnx/models checkout instead of through intermediate HTML files
+    """
+    hubREADMEPath: PurePath = PurePath(f"{omz.onnxmodelzoo_GitRepoPath}/README.md")
+    if testForFile(path=hubREADMEPath) == False:
+        return False
+
+    print(f"Reading tables from {hubREADMEPath}...")
+    hubDocument: HtmlElement = renderMarkdown(hubREADMEPath)
+    hubJSON: List[dict] = extractHubMetadata(
+        readTables(hubDocument), getCategories(hubDocument)
+    )
+    saveRecords(hubJSON, filepath=omz.onnxmodelzoo_HubJSONMetadataPath)
+
+    mgList: List[MetadataGroup] = getMetadataGroups(hubJSON)
+
+    tables: List[DataFrame] = []
+    with Bar("Reading tables from model READMEs...", max=len(mgList)) as bar:
+        mg: MetadataGroup
+        for mg in mgList:
+            table: DataFrame | None = readModelTable(mg)
+            if table is not None:
+                tables.append(table)
+            bar.next()
+
+    modelJSON: List[dict] = extractModelMetadata(tables)
+    saveRecords(modelJSON, filepath=omz.onnxmodelzoo_ModelJSONMetadataPath)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+from argparse import Namespace
+from pathlib import PurePath
+from typing import Any, Callable, Dict, List
+
+import ptm_torrent.huggingface as hf
+import ptm_torrent.modelhub as mh
+import ptm_torrent.modelzoo as mz
+import ptm_torrent.onnxmodelzoo as omz
+import ptm_torrent.pytorchhub as pyth
+from ptm_torrent.utils.arguments import getCloneOptions
+from ptm_torrent.utils.fileSystem import findFiles
+from ptm_torrent.utils.git import CloneOptions, readHeadSHA
+from ptm_torrent.utils.lfsStore import reconcileRepos
+from ptm_torrent.utils.pipeline import Pipeline, Stage
+
+
+def getStatePath(rootFolderPath: PurePath) -> PurePath:
+    return PurePath(f"{rootFolderPath}/pipeline_state.json")
+
+
+def ignoreResult(function: Callable[[], Any]) -> Callable[[], None]:
+    """
+    Download stages return False when nothing changed, which is not a failure;
+    the stages after them see whether anything changed through their inputs
+    """
+
+    def _run() -> None:
+        function()
+
+    return _run
+
+
+def getClonesVersion(reposPath: PurePath) -> Dict[str, str | None]:
+    """HEAD SHA of every `{author}/{repo}` clone in `reposPath`"""
+    return {
+        str(path): readHeadSHA(gitProjectPath=path)
+        for path in findFiles(globStr=f"{reposPath}/*/*")
+    }
+
+
+def getCloneStages(
+    name: str, run: Callable[[], Any], dependencies: List[str], skipClone: bool
+) -> List[Stage]:
+    if skipClone:
+        return []
+    return [Stage(name=name, run=run, dependencies=dependencies, alwaysRun=True)]
+
+
+def createHuggingFacePipeline(args: Namespace) -> Pipeline:
+    import ptm_torrent.huggingface.createSchema as createSchema
+    import ptm_torrent.huggingface.downloadJSON as downloadJSON
+    import ptm_torrent.huggingface.downloadRepos as downloadRepos
+    import ptm_torrent.huggingface.environment as environment
+    import ptm_torrent.huggingface.planDownloads as planDownloads
+    import ptm_torrent.huggingface.selectRepos as selectRepos
+    import ptm_torrent.huggingface.setupFileSystem as setupFS
+    import ptm_torrent.huggingface.splitRepos as splitRepos
+
+    shardCount: int = environment.getShardCount()
+    splitPath: PurePath = environment.getSplitPath()
+    selection: selectRepos.SelectionOptions = selectRepos.getSelectionOptions(
+        environment.getShrinkage()
+    )
+    options: CloneOptions = getCloneOptions(args)
+    metadataPaths: List[PurePath] = [
+        hf.huggingface_HubMetadataPath,
+        hf.huggingface_HubMetadataStreamPath,
+    ]
+
+    stages: List[Stage] = [
+        Stage(name="setupFileSystem", run=setupFS.main, alwaysRun=True),
+        Stage(
+            name="downloadJSON",
+            # Returns False only when the listing could not be downloaded
+            run=lambda: downloadJSON.main(stream=environment.getStream()),
+            dependencies=["setupFileSystem"],
+            alwaysRun=True,
+        ),
+        Stage(
+            name="splitRepos",
+            run=lambda: splitRepos.main(
+                shardCount=shardCount, outputPath=splitPath, selection=selection
+            ),
+            inputs=metadataPaths,
+            outputs=[splitPath],
+            dependencies=["downloadJSON"],
+            version=lambda: (selection, shardCount),
+        ),
+        Stage(
+            name="createSchema",
+            run=createSchema.main,
+            inputs=metadataPaths,
+            outputs=[hf.huggingface_PTMSchemaPath],
+            dependencies=["downloadJSON"],
+        ),
+    ]
+
+    def _cloneRepos() -> None:
+        # The queue remembers finished repos; requeue them so that failures are
+        # retried and, with `--update`, clones are refreshed on every run
+        if options.lfsStorePath is None:
+            downloadRepos.mainSplitURLs(splitPath, options, requeue=True)
+            return
+
+        # Download each LFS object once, then link every other copy to it
+        if planDownloads.main(splitPath, options.lfsStorePath) is not False:
+            downloadRepos.applyDownloadPlan(options, hf.huggingface_DownloadPlanPath)
+        downloadRepos.mainSplitURLs(splitPath, options, requeue=True)
+        reconcileRepos(
+            hf.huggingface_ReposPath,
+            options.lfsStorePath,
+            linkMode=options.lfsLinkMode,
+            workers=options.workers,
+            pullExcluded=True,
+        )
+
+    stages.extend(
+        getCloneStages(
+            name="downloadRepos",
+            run=_cloneRepos,
+            dependencies=["splitRepos"],
+            skipClone=args.skip_clone,
+        )
+    )
+
+    return Pipeline(
+        name="huggingface",
+        stages=stages,
+        statePath=getStatePath(hf.rootFolderPath),
+    )
+
+
+def createModelHubPipeline(args: Namespace) -> Pipeline:
+    import ptm_torrent.modelhub.createSchema as createSchema
+    import ptm_torrent.modelhub.downloadJSON as downloadJSON
+    import ptm_torrent.modelhub.downloadRepos as downloadRepos
+    import ptm_torrent.modelhub.setupFileSystem as setupFS
+
+    options: CloneOptions = getCloneOptions(args)
+
+    stages: List[Stage] = [
+        Stage(name="setupFileSystem", run=setupFS.main, alwaysRun=True),
+        Stage(
+            name="downloadJSON",
+            run=ignoreResult(lambda: downloadJSON.main(useCache=args.http_cache)),
+            dependencies=["setupFileSystem"],
+            alwaysRun=True,
+        ),
+    ]
+    stages.extend(
+        getCloneStages(
+            name="downloadRepos",
+            run=lambda: downloadRepos.main(options=options),
+            dependencies=["downloadJSON"],
+            skipClone=args.skip_clone,
+        )
+    )
+    stages.append(
+        Stage(
+            name="createSchema",
+            run=createSchema.main,
+            inputs=[mh.modelhub_HubMetadataPath],
+            outputs=[mh.modelhub_PTMSchemaPath],
+            dependencies=[stage.name for stage in stages],
+            version=lambda: getClonesVersion(mh.modelhub_ReposPath),
+        )
+    )
+
+    return Pipeline(
+        name="modelhub",
+        stages=stages,
+        statePath=getStatePath(mh.rootFolderPath),
+    )
+
+
+def createModelZooPipeline(args: Namespace) -> Pipeline:
+    import ptm_torrent.modelzoo.createSchema as createSchema
+    import ptm_torrent.modelzoo.downloadHubJSON as downloadHubJSON
+    import ptm_torrent.modelzoo.downloadModelJSON as downloadModelJSON
+    import ptm_torrent.modelzoo.downloadRepos as downloadRepos
+    import ptm_torrent.modelzoo.setupFileSystem as setupFS
+
+    options: CloneOptions = getCloneOptions(args)
+
+    stages: List[Stage] = [
+        Stage(name="setupFileSystem", run=setupFS.main, alwaysRun=True),
+        Stage(
+            name="downloadHubJSON",
+            run=ignoreResult(lambda: downloadHubJSON.main(useCache=args.http_cache)),
+            dependencies=["setupFileSystem"],
+            alwaysRun=True,
+        ),
+        Stage(
+            name="downloadModelJSON",
+            run=ignoreResult(lambda: downloadModelJSON.main(useCache=args.http_cache)),
+            dependencies=["downloadHubJSON"],
+            alwaysRun=True,
+        ),
+    ]
+    stages.extend(
+        getCloneStages(
+            name="downloadRepos",
+            run=lambda: downloadRepos.main(options=options),
+            dependencies=["downloadModelJSON"],
+            skipClone=args.skip_clone,
+        )
+    )
+    stages.append(
+        Stage(
+            name="createSchema",
+            run=createSchema.main,
+            inputs=[mz.modelzoo_ConcatinatedModelMetadataPath],
+            outputs=[mz.modelzoo_PTMSchemaPath],
+            dependencies=[stage.name for stage in stages],
+            version=lambda: getClonesVersion(mz.modelzoo_ReposPath),
+        )
+    )
+
+    return Pipeline(
+        name="modelzoo",
+        stages=stages,
+        statePath=getStatePath(mz.rootFolderPath),
+    )
+
+
+def createONNXModelZooPipeline(args: Namespace) -> Pipeline:
+    import ptm_torrent.onnxmodelzoo.createSchema as createSchema
+    import ptm_torrent.onnxmodelzoo.downloadRepos as downloadRepos
+    import ptm_torrent.onnxmodelzoo.parseREADMEs as parseREADMEs
+    import ptm_torrent.onnxmodelzoo.setupFileSystem as setupFS
+
+    options: CloneOptions = getCloneOptions(args)
+
+    # Every stage after the clone reads the onnx/models checkout
+    def _repoVersion() -> str | None:
+        return readHeadSHA(gitProjectPath=omz.onnxmodelzoo_GitRepoPath)
+
+    stages: List[Stage] = [
+        Stage(name="setupFileSystem", run=setupFS.main, alwaysRun=True),
+    ]
+    stages.extend(
+        getCloneStages(
+            name="downloadRepos",
+            run=lambda: downloadRepos.main(options=options),
+            dependencies=["setupFileSystem"],
+            skipClone=args.skip_clone,
+        )
+    )
+    stages.extend(
+        [
+            Stage(
+                name="parseREADMEs",
+                run=parseREADMEs.main,
+                outputs=[
+                    omz.onnxmodelzoo_HubJSONMetadataPath,
+                    omz.onnxmodelzoo_ModelJSONMetadataPath,
+                ],
+                dependencies=[stage.name for stage in stages],
+                version=_repoVersion,
+            ),
+            Stage(
+                name="createSchema",
+                run=createSchema.main,
+                inputs=[omz.onnxmodelzoo_ConcatinatedModelMetadataPath],
+                outputs=[omz.onnxmodelzoo_PTMSchemaPath],
+                dependencies=["parseREADMEs"],
+                version=_repoVersion,
+            ),
+        ]
+    )
+
+    return Pipeline(
+        name="onnxmodelzoo",
+        stages=stages,
+        statePath=getStatePath(omz.rootFolderPath),
+    )
+
+
+def createPyTorchHubPipeline(args: Namespace) -> Pipeline:
+    import ptm_torrent.pytorchhub.createSchema as createSchema
+    import ptm_torrent.pytorchhub.downloadModelList as downloadModelList
+    import ptm_torrent.pytorchhub.downloadRepos as downloadRepos
+    import ptm_torrent.pytorchhub.parseModelMetadata as parseModelMetadata
+    import ptm_torrent.pytorchhub.setupFileSystem as setupFS
+
+    options: CloneOptions = getCloneOptions(args)
+
+    stages: List[Stage] = [
+        Stage(name="setupFileSystem", run=setupFS.main, alwaysRun=True),
+        Stage(
+            name="downloadModelList",
+            run=ignoreResult(lambda: downloadModelList.main(useCache=args.http_cache)),
+            dependencies=["setupFileSystem"],
+            alwaysRun=True,
+        ),
+        Stage(
+            name="parseModelMetadata",
+            run=parseModelMetadata.main,
+            inputs=[pyth.pytorchhub_ModelHTMLPath],
+            outputs=[pyth.pytorchhub_ConcatinatedModelMetadataPath],
+            dependencies=["downloadModelList"],
+        ),
+    ]
+    stages.extend(
+        getCloneStages(
+            name="downloadRepos",
+            run=lambda: downloadRepos.main(options=options),
+            dependencies=["parseModelMetadata"],
+            skipClone=args.skip_clone,
+        )
+    )
+    stages.append(
+        Stage(
+            name="createSchema",
+            run=createSchema.main,
+            inputs=[pyth.pytorchhub_ConcatinatedModelMetadataPath],
+            outputs=[pyth.pytorchhub_PTMSchemaPath],
+            dependencies=[stage.name for stage in stages],
+            version=lambda: getClonesVersion(pyth.pytorchhub_ReposPath),
+        )
+    )
+
+    return Pipeline(
+        name="pytorchhub",
+        stages=stages,
+        statePath=getStatePath(pyth.rootFolderPath),
+    )
+
+
+pipelineBuilders: Dict[str, Callable[[Namespace], Pipeline]] = {
+    "huggingface": createHuggingFacePipeline,
+    "modelhub": createModelHubPipeline,
+    "modelzoo": createModelZooPipeline,
+    "onnxmodelzoo": createONNXModelZooPipeline,
+    "pytorchhub": createPyTorchHubPipeline,
+}
+
+
+def runPipeline(hubName: str, args: Namespace) -> Dict[str, str]:
+    """Builds and runs `hubName`'s pipeline; safe to call in a worker process"""
+    pipeline: Pipeline = pipelineBuilders[hubName](args)
+    return pipeline.run(force=args.force)
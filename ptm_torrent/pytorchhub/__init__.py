@@ -7,6 +7,8 @@ rootFolderPath: PurePath = PurePath(f"{pt.dataFolderPath}/pytorchhub")
 
 reposFolderPath: PurePath = PurePath(f"{pt.reposFolderPath}")
 
+httpCacheFolderPath: PurePath = PurePath(f"{pt.httpCacheFolderPath}")
+
 jsonFolderPath: PurePath = PurePath(f"{pt.jsonFolderPath}")
 jsonMetadataFolderPath: PurePath = PurePath(f"{pt.jsonMetadataFolderPath}")
 jsonModelMetadataFolderPath: PurePath = PurePath(f"{pt.jsonModelMetadataFolderPath}")
@@ -17,6 +19,7 @@ htmlModelMetadataFolderPath: PurePath = PurePath(f"{pt.htmlModelMetadataFolderPa
 
 subFolders: List[PurePath] = [
     reposFolderPath,
+    httpCacheFolderPath,
     jsonFolderPath,
     jsonMetadataFolderPath,
     jsonModelMetadataFolderPath,
@@ -38,7 +41,15 @@ pytorchhub_HubHTMLMetadataPath: PurePath = PurePath(
 )
 
 pytorchhub_ConcatinatedModelMetadataPath: PurePath = PurePath(
-    f"{rootFolderPath}/{jsonMetadataFolderPath}/pyth_models_metadata.json"
+    f"{rootFolderPath}/{jsonMetadataFolderPath}/pyth_models_metadata.{pt.recordFormat}"
 )
 
 pytorchhub_ReposPath: PurePath = PurePath(f"{rootFolderPath}/{reposFolderPath}")
+
+pytorchhub_HTTPCachePath: PurePath = PurePath(f"{rootFolderPath}/{httpCacheFolderPath}")
+
+pytorchhub_ReposLedgerPath: PurePath = PurePath(f"{rootFolderPath}/repos_ledger.db")
+
+pytorchhub_PTMSchemaPath: PurePath = PurePath(
+    f"{rootFolderPath}/{jsonFolderPath}/pytorchhub.{pt.recordFormat}"
+)
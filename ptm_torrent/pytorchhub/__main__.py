@@ -1,12 +1,29 @@
+from argparse import ArgumentParser
+
+import ptm_torrent.pytorchhub as pyth
 import ptm_torrent.pytorchhub.createSchema as createSchema
 import ptm_torrent.pytorchhub.downloadModelList as downloadModelList
 import ptm_torrent.pytorchhub.downloadRepos as downloadRepos
 import ptm_torrent.pytorchhub.parseModelMetadata as parseModelMetadata
 import ptm_torrent.pytorchhub.setupFileSystem as setupFS
+from ptm_torrent.utils.arguments import (
+    addCloneArguments,
+    addDownloadArguments,
+    getCloneOptions,
+)
+from ptm_torrent.utils.fileSystem import testForFile
 
 if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+    addCloneArguments(parser)
+    addDownloadArguments(parser)
+    args = parser.parse_args()
+
     setupFS.main()
-    downloadModelList.main()
-    parseModelMetadata.main()
-    downloadRepos.main()
+    changed: bool = downloadModelList.main(useCache=args.http_cache)
+    if changed or not testForFile(pyth.pytorchhub_ConcatinatedModelMetadataPath):
+        parseModelMetadata.main()
+    else:
+        print("Model cards have not changed, skipping parseModelMetadata.")
+    downloadRepos.main(options=getCloneOptions(args))
     createSchema.main()
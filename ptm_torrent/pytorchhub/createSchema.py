@@ -1,14 +1,18 @@
 from pathlib import PurePath
-from typing import List
+from typing import Dict, List
 from urllib.parse import ParseResult, urlparse
 
-import pandas
 from pandas import DataFrame, Series
 from progress.bar import Bar
 
 import ptm_torrent.pytorchhub as pyth
-from ptm_torrent.utils.fileSystem import saveJSON, testForFile, testForPath
-from ptm_torrent.utils.git import getLatestGitCommit
+from ptm_torrent.utils.fileSystem import (
+    readDataFrame,
+    saveRecords,
+    testForFile,
+    testForPath,
+)
+from ptm_torrent.utils.git import getLatestGitCommits, getRepoPath
 from ptm_torrent.utils.ptmSchema import ModelHub, PTMTorrent
 
 
@@ -25,6 +29,13 @@ def createModelHub(row: Series) -> ModelHub:
 def createPTMSchema(df: DataFrame) -> List[dict]:
     data: List[dict] = []
 
+    repoPaths: List[PurePath | bool] = [
+        getRepoPath(url, pyth.pytorchhub_ReposPath) for url in df["GitHubURL"]
+    ]
+    commitSHAs: Dict[PurePath, str] = getLatestGitCommits(
+        gitProjectPaths=[path for path in repoPaths if path and testForPath(path)]
+    )
+
     with Bar("Creating PTM Torrent objects...", max=len(df)) as bar:
         idx: int
         for idx in range(len(df)):
@@ -35,8 +46,8 @@ def createPTMSchema(df: DataFrame) -> List[dict]:
             parsedURL: ParseResult = urlparse(url)
             urlPath: str = str(parsedURL.path).strip("/")
 
-            repoPath: PurePath = PurePath(f"{pyth.pytorchhub_ReposPath}")
-            if testForPath(repoPath) == False:
+            repoPath: PurePath | bool = repoPaths[idx]
+            if repoPath == False or testForPath(repoPath) == False:
                 print(f"Path not found: {repoPath}")
                 bar.next()
                 continue
@@ -45,7 +56,7 @@ def createPTMSchema(df: DataFrame) -> List[dict]:
 
             ptm: PTMTorrent = PTMTorrent(
                 id=idx,
-                latest_git_commit_sha=getLatestGitCommit(gitProjectPath=repoPath),
+                latest_git_commit_sha=commitSHAs[repoPath],
                 model_hub=createModelHub(row),
                 model_name=row["ModelName"],
                 model_owner=row["ModelAuthor"],
@@ -68,17 +79,13 @@ def main() -> None | bool:
     if testForFile(path=pyth.pytorchhub_ConcatinatedModelMetadataPath) == False:
         return False
 
-    jsonFilePath: PurePath = PurePath(
-        f"{pyth.rootFolderPath}/{pyth.jsonFolderPath}/pytorchhub.json"
-    )
-
-    df: DataFrame = pandas.read_json(
-        path_or_buf=pyth.pytorchhub_ConcatinatedModelMetadataPath
+    df: DataFrame = readDataFrame(
+        jsonFilePath=pyth.pytorchhub_ConcatinatedModelMetadataPath
     )
 
     json: List[dict] = createPTMSchema(df)
 
-    saveJSON(json, filepath=jsonFilePath)
+    saveRecords(json, filepath=pyth.pytorchhub_PTMSchemaPath)
 
 
 if __name__ == "__main__":
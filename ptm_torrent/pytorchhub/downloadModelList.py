@@ -3,16 +3,25 @@ from typing import List
 from urllib.parse import ParseResult, urlparse
 
 from bs4 import BeautifulSoup, ResultSet
-from progress.bar import Bar
-from requests import Response, get
 
 import ptm_torrent.pytorchhub as pyth
-from ptm_torrent.utils.fileSystem import readHTML, saveHTML
+from ptm_torrent.utils.crawler import crawl
+from ptm_torrent.utils.fileSystem import readHTML, saveHTML, testForFile
+from ptm_torrent.utils.network import CachedResponse, getCached
 
 
-def getHTML(url: str, filepath: PurePath) -> None:
-    resp: Response = get(url)
+def saveResponse(resp: CachedResponse, filepath: PurePath) -> bool:
+    """Saves `resp` unless it is unchanged and already on disk"""
+    if resp.changed == False and testForFile(path=filepath):
+        return False
+
     saveHTML(html=resp.text, filepath=filepath)
+    return True
+
+
+def getHTML(url: str, filepath: PurePath, cachePath: PurePath | None = None) -> bool:
+    resp: CachedResponse = getCached(url, cachePath=cachePath)
+    return saveResponse(resp, filepath)
 
 
 def extractModelURLs(soup: BeautifulSoup) -> List[ParseResult]:
@@ -26,11 +35,17 @@ def extractModelURLs(soup: BeautifulSoup) -> List[ParseResult]:
     return modelURLs
 
 
-def main() -> None:
+def main(useCache: bool = False) -> bool:
+    """Returns True if any of the downloaded HTML files changed"""
+    cachePath: PurePath | None = pyth.pytorchhub_HTTPCachePath if useCache else None
     pytorchHubModelListURL: str = "https://pytorch.org/hub/research-models/compact"
 
     print("Downloading the PyTorch Hub model list...")
-    getHTML(url=pytorchHubModelListURL, filepath=pyth.pytorchhub_HubHTMLMetadataPath)
+    changed: bool = getHTML(
+        url=pytorchHubModelListURL,
+        filepath=pyth.pytorchhub_HubHTMLMetadataPath,
+        cachePath=cachePath,
+    )
 
     modelHubSoup: BeautifulSoup = readHTML(
         htmlFilePath=pyth.pytorchhub_HubHTMLMetadataPath
@@ -38,17 +53,26 @@ def main() -> None:
 
     modelURLs: List[ParseResult] = extractModelURLs(soup=modelHubSoup)
 
-    with Bar(
-        "Downloading PyTorch Hub model card HTML files...", max=len(modelURLs)
-    ) as bar:
-        url: ParseResult
-        for url in modelURLs:
-            splitPath: List[str] = url.path.strip("/").split("/")
-            htmlFilepath: str = PurePath(
-                f"{pyth.pytorchhub_ModelHTMLPath}/{splitPath[-1]}.html"
-            )
-            getHTML(url=url.geturl(), filepath=htmlFilepath)
-            bar.next()
+    htmlFilepaths: List[PurePath] = [
+        PurePath(
+            f"{pyth.pytorchhub_ModelHTMLPath}/{url.path.strip('/').split('/')[-1]}.html"
+        )
+        for url in modelURLs
+    ]
+
+    pages: List[CachedResponse] = crawl(
+        urls=[url.geturl() for url in modelURLs],
+        fetch=lambda url: getCached(url, cachePath=cachePath),
+        message="Downloading PyTorch Hub model card HTML files...",
+    )
+
+    htmlFilepath: PurePath
+    page: CachedResponse
+    for htmlFilepath, page in zip(htmlFilepaths, pages):
+        if saveResponse(page, htmlFilepath):
+            changed = True
+
+    return changed
 
 
 if __name__ == "__main__":
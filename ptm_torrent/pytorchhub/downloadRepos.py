@@ -1,27 +1,34 @@
 from pathlib import PurePath
-from typing import List
-
-from progress.bar import Bar
+from typing import Iterable, List
 
 import ptm_torrent.pytorchhub as pyth
-from ptm_torrent.utils.fileSystem import readJSON
-from ptm_torrent.utils.git import cloneRepo
-
-
-def cloneGitRepos(urls: List[str], gitCloneBarePath: PurePath) -> None:
-    url: str
-    with Bar(f"Cloning git repos to {gitCloneBarePath}...", max=len(urls)) as bar:
-        for url in urls:
-            cloneRepo(url, gitCloneBarePath)
-            bar.next()
+from ptm_torrent.utils.fileSystem import readRecords
+from ptm_torrent.utils.git import CloneOptions, CloneResult, cloneRepos
+from ptm_torrent.utils.ledger import CloneLedger
+
+
+def cloneGitRepos(
+    urls: List[str],
+    gitCloneBarePath: PurePath,
+    options: CloneOptions = CloneOptions(),
+    ledger: CloneLedger | None = None,
+) -> List[CloneResult]:
+    return cloneRepos(
+        urls=urls, rootGitClonePath=gitCloneBarePath, options=options, ledger=ledger
+    )
 
 
-def main() -> None | bool:
-    json: List[dict] = readJSON(
+def main(options: CloneOptions = CloneOptions()) -> List[CloneResult] | bool:
+    json: Iterable[dict] = readRecords(
         jsonFilePath=pyth.pytorchhub_ConcatinatedModelMetadataPath
     )
     urls: List[str] = [data["GitHubURL"] for data in json]
-    cloneGitRepos(urls, pyth.pytorchhub_ReposPath)
+    return cloneGitRepos(
+        urls,
+        pyth.pytorchhub_ReposPath,
+        options=options,
+        ledger=CloneLedger(ledgerPath=pyth.pytorchhub_ReposLedgerPath),
+    )
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ from typing import List
 from bs4 import BeautifulSoup, Tag
 
 import ptm_torrent.pytorchhub as pyth
-from ptm_torrent.utils.fileSystem import readHTML, saveJSON
+from ptm_torrent.utils.fileSystem import readHTML, saveRecords
 
 
 def extractURL(soup: BeautifulSoup, buttonClass: str) -> str | None:
@@ -55,7 +55,7 @@ def main() -> None:
 
     htmlFiles: List[PurePath] = [
         PurePath(f"{pyth.pytorchhub_ModelHTMLPath}/{path}")
-        for path in listdir(path=pyth.pytorchhub_ModelHTMLPath)
+        for path in sorted(listdir(path=pyth.pytorchhub_ModelHTMLPath))
     ]
 
     idx: int
@@ -65,7 +65,7 @@ def main() -> None:
         json.append(data)
 
     print(f"Saving data to {pyth.pytorchhub_ConcatinatedModelMetadataPath}")
-    saveJSON(json=json, filepath=pyth.pytorchhub_ConcatinatedModelMetadataPath)
+    saveRecords(json=json, filepath=pyth.pytorchhub_ConcatinatedModelMetadataPath)
 
 
 if __name__ == "__main__":
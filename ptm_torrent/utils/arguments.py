@@ -0,0 +1,72 @@
+from argparse import ArgumentParser, Namespace
+from pathlib import PurePath
+
+from ptm_torrent.utils.git import CloneOptions, cloneProfiles
+from ptm_torrent.utils.lfsStore import linkModes
+
+
+def addCloneArguments(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Number of concurrent git clones"
+    )
+    parser.add_argument(
+        "--host-limit",
+        type=int,
+        default=None,
+        help="Maximum number of concurrent git clones against a single host",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Fetch into existing clones instead of skipping them",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=list(cloneProfiles.keys()),
+        default="full",
+        help="How much of each repository to download",
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=None,
+        help="Only download the N most recent commits",
+    )
+    parser.add_argument(
+        "--skip-lfs",
+        action="store_true",
+        help="Leave Git LFS files as pointers (sets GIT_LFS_SKIP_SMUDGE=1)",
+    )
+    parser.add_argument(
+        "--lfs-store",
+        type=PurePath,
+        default=None,
+        help="Share Git LFS objects between clones through this directory",
+    )
+    parser.add_argument(
+        "--lfs-link",
+        choices=linkModes,
+        default="hardlink",
+        help="How checked out LFS files are linked to the --lfs-store",
+    )
+
+
+def addDownloadArguments(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help="Cache responses on disk and revalidate them with conditional requests",
+    )
+
+
+def getCloneOptions(args: Namespace) -> CloneOptions:
+    return CloneOptions(
+        workers=args.workers,
+        hostLimit=args.host_limit,
+        update=args.update,
+        profile=args.profile,
+        depth=args.depth,
+        skipLFS=args.skip_lfs,
+        lfsStorePath=args.lfs_store,
+        lfsLinkMode=args.lfs_link,
+    )
@@ -0,0 +1,143 @@
+from itertools import islice
+from pathlib import PurePath
+from typing import Iterable, Iterator, List
+
+import ptm_torrent as pt
+import ptm_torrent.huggingface as hf
+import ptm_torrent.modelhub as mh
+import ptm_torrent.modelzoo as mz
+import ptm_torrent.onnxmodelzoo as omz
+import ptm_torrent.pytorchhub as pyth
+from ptm_torrent.utils.fileSystem import readRecords, testForFile
+
+try:
+    import pyarrow
+    import pyarrow.dataset
+except ImportError:
+    pyarrow = None
+
+catalogPath: PurePath = PurePath(f"{pt.dataFolderPath}/catalog")
+
+ptmSchemaPaths: List[PurePath] = [
+    hf.huggingface_PTMSchemaPath,
+    mh.modelhub_PTMSchemaPath,
+    mz.modelzoo_PTMSchemaPath,
+    omz.onnxmodelzoo_PTMSchemaPath,
+    pyth.pytorchhub_PTMSchemaPath,
+]
+
+modelHubColumns: List[str] = [
+    "MetadataFilePath",
+    "MetadataObjectID",
+    "ModelHubName",
+    "ModelHubURL",
+]
+
+
+def getCatalogSchema() -> "pyarrow.Schema":
+    """Arrow schema of a `PTMTorrent` record with its `ModelHub` flattened"""
+    dataset: pyarrow.StructType = pyarrow.struct(
+        [
+            ("DatasetName", pyarrow.string()),
+            ("DatasetOwner", pyarrow.string()),
+            ("DatasetOwnerURL", pyarrow.string()),
+            ("DatasetURL", pyarrow.string()),
+            ("DatasetPaperDOI", pyarrow.string()),
+            ("DatasetUsages", pyarrow.list_(pyarrow.string())),
+        ]
+    )
+
+    return pyarrow.schema(
+        [
+            ("id", pyarrow.int64()),
+            ("LatestGitCommitSHA", pyarrow.string()),
+            ("MetadataFilePath", pyarrow.string()),
+            ("MetadataObjectID", pyarrow.string()),
+            ("ModelHubName", pyarrow.string()),
+            ("ModelHubURL", pyarrow.string()),
+            ("ModelName", pyarrow.string()),
+            ("ModelOwner", pyarrow.string()),
+            ("ModelOwnerURL", pyarrow.string()),
+            ("ModelURL", pyarrow.string()),
+            ("Dataset", pyarrow.list_(dataset)),
+            ("ModelArchitecture", pyarrow.string()),
+            ("ModelPaperDOIs", pyarrow.list_(pyarrow.string())),
+            ("ModelTask", pyarrow.string()),
+        ]
+    )
+
+
+def flattenRecord(record: dict) -> dict:
+    flatRecord: dict = {
+        key: value for key, value in record.items() if key != "ModelHub"
+    }
+
+    column: str
+    for column in modelHubColumns:
+        flatRecord[column] = record["ModelHub"][column]
+
+    return flatRecord
+
+
+def readRecordBatches(
+    schemaPaths: Iterable[PurePath],
+    schema: "pyarrow.Schema",
+    batchSize: int = 10000,
+) -> Iterator["pyarrow.RecordBatch"]:
+    """
+    Yields the records of every PTM schema file in `schemaPaths` as record
+    batches of at most `batchSize` rows, so that only one batch is held in
+    memory at a time
+    """
+    schemaPath: PurePath
+    for schemaPath in schemaPaths:
+        if testForFile(path=schemaPath) == False:
+            print(f"Skipping {schemaPath} as it does not exist.")
+            continue
+
+        print(f"Exporting {schemaPath}")
+        records: Iterator[dict] = iter(readRecords(jsonFilePath=schemaPath))
+
+        while True:
+            batch: List[dict] = [
+                flattenRecord(record) for record in islice(records, batchSize)
+            ]
+            if len(batch) == 0:
+                break
+
+            yield pyarrow.RecordBatch.from_pylist(batch, schema=schema)
+
+
+def exportCatalog(
+    schemaPaths: Iterable[PurePath] = ptmSchemaPaths,
+    outputPath: PurePath = catalogPath,
+    partitionColumns: List[str] = ["ModelHubName"],
+    batchSize: int = 10000,
+) -> None:
+    """
+    Writes every hub's `PTMTorrent` records to a single Parquet dataset in
+    `outputPath`, hive partitioned by `partitionColumns`
+    """
+    if pyarrow is None:
+        raise ImportError("pyarrow is required to export the catalog to Parquet")
+
+    schema: pyarrow.Schema = getCatalogSchema()
+
+    pyarrow.dataset.write_dataset(
+        data=readRecordBatches(schemaPaths, schema=schema, batchSize=batchSize),
+        base_dir=str(outputPath),
+        schema=schema,
+        format="parquet",
+        partitioning=partitionColumns,
+        partitioning_flavor="hive",
+        existing_data_behavior="delete_matching",
+    )
+
+
+def main() -> None:
+    print(f"Saving Parquet dataset to {catalogPath}")
+    exportCatalog()
+
+
+if __name__ == "__main__":
+    main()
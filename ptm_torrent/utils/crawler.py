@@ -0,0 +1,85 @@
+import asyncio
+from asyncio import AbstractEventLoop, Semaphore
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, TypeVar
+from urllib.parse import urlparse
+
+from progress.bar import Bar
+
+T = TypeVar("T")
+
+
+class RateLimiter:
+    """Spaces out requests so that at most `rate` start per second"""
+
+    def __init__(self, rate: float | None) -> None:
+        self.interval: float = 0.0 if not rate else 1 / rate
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self.nextTime: float = 0.0
+
+    async def wait(self) -> None:
+        async with self.lock:
+            loop: AbstractEventLoop = asyncio.get_running_loop()
+            now: float = loop.time()
+            delay: float = self.nextTime - now
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+                now += delay
+
+            self.nextTime = now + self.interval
+
+
+async def _crawl(
+    urls: List[str],
+    fetch: Callable[[str], T],
+    concurrency: int,
+    hostRate: float | None,
+    message: str,
+) -> List[T]:
+    loop: AbstractEventLoop = asyncio.get_running_loop()
+    semaphore: Semaphore = Semaphore(concurrency)
+    limiters: Dict[str, RateLimiter] = {}
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        with Bar(message, max=len(urls)) as bar:
+
+            async def _fetch(url: str) -> T:
+                host: str = urlparse(url).netloc
+                if host not in limiters:
+                    limiters[host] = RateLimiter(hostRate)
+
+                async with semaphore:
+                    await limiters[host].wait()
+                    result: T = await loop.run_in_executor(executor, fetch, url)
+
+                bar.next()
+                return result
+
+            return await asyncio.gather(*[_fetch(url) for url in urls])
+
+
+def crawl(
+    urls: List[str],
+    fetch: Callable[[str], T],
+    concurrency: int = 16,
+    hostRate: float | None = 10,
+    message: str = "Downloading...",
+) -> List[T]:
+    """
+    Calls `fetch` on every URL with at most `concurrency` requests in flight
+    and at most `hostRate` requests started per second against a single host.
+
+    `fetch` is a blocking function (e.g. `utils.network.downloadJSON`); it is
+    run on a thread pool driven by an asyncio event loop. Results are returned
+    in the same order as `urls`.
+    """
+    return asyncio.run(
+        _crawl(
+            urls=urls,
+            fetch=fetch,
+            concurrency=concurrency,
+            hostRate=hostRate,
+            message=message,
+        )
+    )
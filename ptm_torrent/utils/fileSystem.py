@@ -1,12 +1,19 @@
+import gzip
 from glob import glob
-from json import dump, load
-from os import makedirs
-from os.path import isdir, isfile
+from json import dump, dumps, load, loads
+from os import makedirs, scandir
+from os.path import getmtime, isdir, isfile
 from pathlib import PurePath
-from typing import List
+from typing import IO, Iterable, Iterator, List
 
 from bs4 import BeautifulSoup
 from markdown import markdown
+from pandas import DataFrame, read_json
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 def createPath(path: PurePath) -> bool:
@@ -17,12 +24,59 @@ def createPath(path: PurePath) -> bool:
     return isdir(path)
 
 
+def openFile(filepath: PurePath, mode: str = "r") -> IO[str]:
+    """Opens a text file, compressing it if its name ends in .gz or .zst"""
+    suffix: str = PurePath(filepath).suffix
+
+    if suffix == ".gz":
+        return gzip.open(filepath, f"{mode}t", encoding="UTF-8")
+
+    if suffix == ".zst":
+        if zstandard is None:
+            raise ImportError("zstandard is required to read or write .zst files")
+        return zstandard.open(filepath, f"{mode}t", encoding="UTF-8")
+
+    return open(filepath, mode)
+
+
 def saveJSON(json: List[dict], filepath: PurePath = "data.json") -> None:
-    with open(filepath, "w") as jsonFile:
+    with openFile(filepath, "w") as jsonFile:
         dump(obj=json, fp=jsonFile, indent=4)
         jsonFile.close()
 
 
+def isNDJSON(filepath: PurePath) -> bool:
+    return ".ndjson" in PurePath(filepath).suffixes
+
+
+def saveNDJSON(
+    json: Iterable[dict], filepath: PurePath = "data.ndjson", append: bool = False
+) -> None:
+    """Writes one record per line so that producers can append incrementally"""
+    with openFile(filepath, "a" if append else "w") as jsonFile:
+        record: dict
+        for record in json:
+            jsonFile.write(dumps(record) + "\n")
+        jsonFile.close()
+
+
+def saveRecords(json: Iterable[dict], filepath: PurePath = "data.json") -> None:
+    """Saves a list of records as NDJSON or JSON depending on `filepath`"""
+    if isNDJSON(filepath):
+        saveNDJSON(json, filepath=filepath)
+    else:
+        saveJSON(list(json), filepath=filepath)
+
+
+def readNDJSON(jsonFilePath: PurePath) -> Iterator[dict]:
+    """Yields one record per line of a newline delimited JSON file"""
+    with openFile(jsonFilePath, "r") as jsonFile:
+        line: str
+        for line in jsonFile:
+            if line.strip():
+                yield loads(line)
+
+
 def saveHTML(html: str, filepath: PurePath = "data.html") -> None:
     soup: BeautifulSoup = BeautifulSoup(markup=html, features="lxml")
     prettyHTML: str = soup.prettify()
@@ -33,13 +87,32 @@ def saveHTML(html: str, filepath: PurePath = "data.html") -> None:
 
 
 def readJSON(jsonFilePath: PurePath) -> dict:
-    with open(jsonFilePath, "r") as jsonFile:
+    with openFile(jsonFilePath, "r") as jsonFile:
         jsonData: dict = load(jsonFile)
         jsonFile.close()
 
     return jsonData
 
 
+def readRecords(jsonFilePath: PurePath) -> Iterator[dict] | List[dict]:
+    """
+    Reads a list of records saved with `saveRecords`. NDJSON files are
+    streamed one record at a time.
+    """
+    if isNDJSON(jsonFilePath):
+        return readNDJSON(jsonFilePath)
+    return readJSON(jsonFilePath)
+
+
+def readDataFrame(jsonFilePath: PurePath) -> DataFrame:
+    """Loads a list of records saved with `saveRecords` into a DataFrame"""
+    if PurePath(jsonFilePath).suffix == ".zst":
+        with openFile(jsonFilePath, "r") as jsonFile:
+            return read_json(jsonFile, lines=isNDJSON(jsonFilePath))
+
+    return read_json(jsonFilePath, lines=isNDJSON(jsonFilePath), compression="infer")
+
+
 def testForFile(path: PurePath) -> bool:
     return isfile(path)
 
@@ -48,6 +121,35 @@ def testForPath(path: PurePath) -> bool:
     return isdir(path)
 
 
+def getDirectorySize(path: PurePath) -> int:
+    """Returns the total size in bytes of all files under `path` without following symlinks"""
+    size: int = 0
+    directories: List[PurePath] = [path]
+
+    while directories:
+        directory: PurePath = directories.pop()
+        try:
+            entries = list(scandir(directory))
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                directories.append(PurePath(entry.path))
+            else:
+                size += entry.stat(follow_symlinks=False).st_size
+
+    return size
+
+
+def findNewestFile(paths: List[PurePath]) -> PurePath | None:
+    """Returns the most recently modified of `paths` that exists"""
+    existingPaths: List[PurePath] = [path for path in paths if isfile(path)]
+    if len(existingPaths) == 0:
+        return None
+    return max(existingPaths, key=getmtime)
+
+
 def findFiles(globStr: str) -> List[PurePath]:
     """
     For specific file, use an exact filename.
@@ -58,11 +160,21 @@ def findFiles(globStr: str) -> List[PurePath]:
     return [PurePath(path) for path in filepaths]
 
 
-def markdownToHTML(outputDirectory: str, markdownFilepath: PurePath) -> PurePath:
-    htmlFilepath: PurePath = PurePath(
+def getHTMLFilepath(outputDirectory: str, markdownFilepath: PurePath) -> PurePath:
+    return PurePath(
         f"{outputDirectory}/{markdownFilepath.stem}_{markdownFilepath.parent.stem}.html"
     )
 
+
+def markdownToHTML(
+    outputDirectory: str, markdownFilepath: PurePath, prettify: bool = True
+) -> PurePath:
+    """
+    With `prettify` False the rendered HTML is written as is, skipping a full
+    parse of the document by BeautifulSoup
+    """
+    htmlFilepath: PurePath = getHTMLFilepath(outputDirectory, markdownFilepath)
+
     with open(markdownFilepath, "r") as markdownFile:
         html: str = markdown(
             markdownFile.read(),
@@ -71,10 +183,12 @@ def markdownToHTML(outputDirectory: str, markdownFilepath: PurePath) -> PurePath
         )
         markdownFile.close()
 
-    soup: BeautifulSoup = BeautifulSoup(markup=html, features="lxml")
+    if prettify:
+        soup: BeautifulSoup = BeautifulSoup(markup=html, features="lxml")
+        html = soup.prettify()
 
     with open(htmlFilepath, "w") as htmlFile:
-        htmlFile.write(soup.prettify())
+        htmlFile.write(html)
         htmlFile.close
 
     return htmlFilepath
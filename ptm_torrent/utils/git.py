@@ -1,23 +1,97 @@
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field, replace
+from os import environ
+from os.path import abspath, isdir, isfile
 from pathlib import PurePath
+from shutil import rmtree
+from string import hexdigits
 from subprocess import CompletedProcess
-from typing import List
+from threading import BoundedSemaphore, Lock
+from typing import Dict, Iterable, List
 from urllib.parse import ParseResult, urlparse
 
-# TODO: Merge cloneBareRepo() and cloneRepo() as they use the same code with
-# exception of the gitCommand variable and a renamed argument
+from progress.bar import Bar
 
+from ptm_torrent.utils.fileSystem import (
+    getDirectorySize,
+    readJSON,
+    saveJSON,
+    testForFile,
+    testForPath,
+)
+from ptm_torrent.utils.ledger import DONE, FAILED, IN_PROGRESS, CloneLedger
+from ptm_torrent.utils.lfsStore import reconcileRepo
 
-def cloneBareRepo(url: str, gitCloneBarePath: PurePath) -> CompletedProcess | bool:
+# Extra `git clone` arguments for each clone profile
+cloneProfiles: Dict[str, List[str]] = {
+    "full": [],
+    "bare": ["--bare"],
+    "blobless": ["--filter=blob:none"],
+    "treeless": ["--filter=tree:0"],
+    "shallow": [],
+}
+
+
+@dataclass
+class CloneOptions:
+    workers: int = 4
+    hostLimit: int | None = None
+    # Fetch into existing clones instead of skipping them
+    update: bool = False
+    # One of the keys of `cloneProfiles`
+    profile: str = "full"
+    # History depth; the "shallow" profile defaults to 1
+    depth: int | None = None
+    # Leave Git LFS files as pointers instead of downloading them
+    skipLFS: bool = False
+    # Content-addressed Git LFS object store shared by every clone
+    lfsStorePath: PurePath | None = None
+    # How checked out LFS files are linked to the store; one of `linkModes`
+    lfsLinkMode: str = "hardlink"
+    # `lfs.fetchexclude` patterns per URL for LFS files linked from the store
+    lfsExcludes: Dict[str, List[str]] = field(default_factory=dict)
+
+    def isBare(self) -> bool:
+        return self.profile == "bare"
+
+    def getDepth(self) -> int | None:
+        if self.depth is None and self.profile == "shallow":
+            return 1
+        return self.depth
+
+    def getEnvironment(self) -> Dict[str, str] | None:
+        if self.skipLFS == False:
+            return None
+        return {**environ, "GIT_LFS_SKIP_SMUDGE": "1"}
+
+    def linkLFSObjects(self, gitPath: PurePath) -> None:
+        """Links a fresh or updated clone's LFS files into `lfsStorePath`"""
+        if self.lfsStorePath is not None:
+            reconcileRepo(gitPath, self.lfsStorePath, self.lfsLinkMode)
+
+
+@dataclass
+class CloneResult:
+    url: str
+    path: PurePath | None
+    returnCode: int
+    duration: float
+    size: int
+    # One of "cloned", "updated", "unchanged", "skipped", or "failed"
+    status: str = "cloned"
+
+
+def getRepoPath(url: str, rootGitClonePath: PurePath) -> PurePath | bool:
     author: str
     repo: str
 
-    gitCommand: List[str] = ["git", "clone", "--bare", "-q"]
-
     try:
         parsedURL: ParseResult = urlparse(url)
         pathSplit: List[str] = parsedURL.path.strip("/").split("/")
-    except TypeError:
+    except (TypeError, AttributeError):
         return False
 
     if len(pathSplit) == 1:
@@ -27,35 +101,502 @@ def cloneBareRepo(url: str, gitCloneBarePath: PurePath) -> CompletedProcess | bo
         author = pathSplit[0]
         repo = pathSplit[1]
 
-    gitPath: PurePath = PurePath(f"{gitCloneBarePath}/{author}/{repo}")
-    gitCommand.extend([url, gitPath])
+    return PurePath(f"{rootGitClonePath}/{author}/{repo}")
 
-    return subprocess.run(args=gitCommand)
 
+def getCloneKey(url: str, rootGitClonePath: PurePath) -> str:
+    """
+    Identifies the clone directory of `url`. Hosts ignore the case of owner and
+    repository names and a trailing ".git", and so may the local filesystem,
+    so these URLs all share one clone.
+    """
+    gitPath: PurePath | bool = getRepoPath(url, rootGitClonePath)
+    if gitPath == False:
+        return str(url)
+
+    key: str = abspath(gitPath).casefold()
+    return key[:-4] if key.endswith(".git") else key
 
-def cloneRepo(url: str, rootGitClonePath: PurePath) -> CompletedProcess:
-    author: str
-    repo: str
 
+def cloneBareRepo(url: str, gitCloneBarePath: PurePath) -> CompletedProcess | bool:
+    return cloneRepo(url, gitCloneBarePath, options=CloneOptions(profile="bare"))
+
+
+def cloneRepo(
+    url: str, rootGitClonePath: PurePath, options: CloneOptions = CloneOptions()
+) -> CompletedProcess | bool:
     gitCommand: List[str] = ["git", "clone", "-q"]
+    gitCommand.extend(cloneProfiles[options.profile])
 
-    try:
-        parsedURL: ParseResult = urlparse(url)
-        pathSplit: List[str] = parsedURL.path.strip("/").split("/")
-    except TypeError:
+    depth: int | None = options.getDepth()
+    if depth is not None:
+        gitCommand.append(f"--depth={depth}")
+
+    # Objects already in the store are not downloaded again
+    if options.lfsStorePath is not None:
+        gitCommand.extend(["-c", f"lfs.storage={abspath(options.lfsStorePath)}"])
+
+    # Files another clone downloads are left as pointers and linked afterwards
+    if url in options.lfsExcludes:
+        excludes: str = ",".join(options.lfsExcludes[url])
+        gitCommand.extend(["-c", f"lfs.fetchexclude={excludes}"])
+
+    gitPath: PurePath | bool = getRepoPath(url, rootGitClonePath)
+    if gitPath == False:
         return False
 
-    if len(pathSplit) == 1:
-        author = parsedURL.netloc.strip()
-        repo = pathSplit[0]
+    gitCommand.extend([url, gitPath])
+
+    return subprocess.run(
+        args=gitCommand,
+        shell=False,
+        stderr=subprocess.DEVNULL,
+        env=options.getEnvironment(),
+    )
+
+
+def updateRepo(
+    gitProjectPath: PurePath, options: CloneOptions = CloneOptions()
+) -> CompletedProcess:
+    gitCommand: List[str] = ["git", "-C", gitProjectPath]
+
+    if options.isBare():
+        gitCommand.extend(["fetch", "-q", "origin", "+refs/heads/*:refs/heads/*"])
     else:
-        author = pathSplit[0]
-        repo = pathSplit[1]
+        gitCommand.extend(["pull", "-q", "--ff-only"])
 
-    gitPath: PurePath = PurePath(f"{rootGitClonePath}/{author}/{repo}")
-    gitCommand.extend([url, gitPath])
+    depth: int | None = options.getDepth()
+    if depth is not None:
+        gitCommand.append(f"--depth={depth}")
+
+    return subprocess.run(
+        args=gitCommand,
+        shell=False,
+        stderr=subprocess.DEVNULL,
+        env=options.getEnvironment(),
+    )
+
+
+def getRemoteHeadSHA(url: str) -> str | None:
+    gitCommand: List[str] = ["git", "ls-remote", url, "HEAD"]
+
+    process: CompletedProcess = subprocess.run(
+        args=gitCommand,
+        shell=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+
+    output: List[str] = process.stdout.decode(encoding="UTF-8").split()
+    if process.returncode != 0 or len(output) == 0:
+        return None
+    return output[0]
+
+
+def getRemoteHeadSHAs(urls: List[str], workers: int = 16) -> Dict[str, str | None]:
+    """Runs `git ls-remote` against every URL concurrently"""
+    barLock: Lock = Lock()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        with Bar("Checking remote HEADs...", max=len(urls)) as bar:
+
+            def _concurrentHelper(url: str) -> str | None:
+                sha: str | None = getRemoteHeadSHA(url)
+                with barLock:
+                    bar.next()
+                return sha
+
+            shas: List[str | None] = list(executor.map(_concurrentHelper, urls))
+
+    return dict(zip(urls, shas))
+
+
+def getLocalHeadSHA(
+    url: str, gitPath: PurePath, ledger: CloneLedger | None = None
+) -> str | None:
+    if ledger is not None:
+        record: dict | None = ledger.getRecord(url)
+        if record is not None and record["state"] == DONE and record["sha"]:
+            return record["sha"]
+
+    sha: str = getLatestGitCommit(gitProjectPath=gitPath)
+    return sha if sha != "" else None
+
+
+def filterChangedRepos(
+    urls: List[str],
+    rootGitClonePath: PurePath,
+    expectedSHAs: Dict[str, str] | None = None,
+    workers: int = 16,
+    ledger: CloneLedger | None = None,
+) -> Dict[str, str | None]:
+    """
+    Returns the URLs whose clone under `rootGitClonePath` is missing or does
+    not match the remote HEAD, mapped to that remote HEAD (None if unknown).
+
+    `expectedSHAs` maps URLs to a known remote HEAD (e.g. the `sha` field of
+    the Hugging Face listing). Existing clones without an expected SHA are
+    checked with a batched, concurrent `git ls-remote`.
+    """
+    if expectedSHAs is None:
+        expectedSHAs = {}
+
+    changedURLs: Dict[str, str | None] = {}
+    localSHAs: Dict[str, str | None] = {}
+
+    url: str
+    for url in dict.fromkeys(urls):
+        gitPath: PurePath | bool = getRepoPath(url, rootGitClonePath)
+        if gitPath == False or testForPath(gitPath) == False:
+            changedURLs[url] = expectedSHAs.get(url)
+            continue
+        localSHAs[url] = getLocalHeadSHA(url, gitPath, ledger)
+
+    remoteSHAs: Dict[str, str | None] = getRemoteHeadSHAs(
+        urls=[url for url in localSHAs if expectedSHAs.get(url) is None],
+        workers=workers,
+    )
+
+    localSHA: str | None
+    for url, localSHA in localSHAs.items():
+        remoteSHA: str | None = expectedSHAs.get(url) or remoteSHAs.get(url)
+        if remoteSHA is None or localSHA != remoteSHA:
+            changedURLs[url] = remoteSHA
+
+    print(f"{len(changedURLs)} of {len(set(urls))} repos need to be transferred")
+    return changedURLs
+
+
+def isGitRepo(gitProjectPath: PurePath) -> bool:
+    gitCommand: List[str] = [
+        "git",
+        "-C",
+        gitProjectPath,
+        "rev-parse",
+        "--verify",
+        "-q",
+        "HEAD",
+    ]
+
+    process: CompletedProcess = subprocess.run(
+        args=gitCommand,
+        shell=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return process.returncode == 0
+
+
+def prepareClonePath(url: str, gitPath: PurePath, ledger: CloneLedger) -> bool:
+    """
+    Reconciles an existing clone directory with the ledger before cloning.
+
+    Directories left behind by interrupted or failed clones are removed.
+    Complete clones that predate the ledger are recorded as done.
+
+    Returns True if the repository still needs to be cloned.
+    """
+    if testForPath(gitPath) == False:
+        return True
+
+    state: str | None = ledger.getState(url)
+    if state not in [IN_PROGRESS, FAILED] and isGitRepo(gitPath):
+        ledger.markDone(
+            url,
+            sha=getLatestGitCommit(gitProjectPath=gitPath),
+            size=getDirectorySize(gitPath),
+            duration=None,
+        )
+        return False
+
+    rmtree(gitPath, ignore_errors=True)
+    return True
+
+
+def runUpdate(
+    url: str,
+    gitPath: PurePath,
+    options: CloneOptions = CloneOptions(),
+    ledger: CloneLedger | None = None,
+    remoteSHA: str | None = None,
+    checkRemote: bool = True,
+) -> CloneResult:
+    """
+    Brings an existing clone up to date with its remote.
+
+    The fetch is skipped entirely when the remote HEAD matches the SHA that
+    was recorded for the clone. The remote HEAD is only queried when
+    `checkRemote` is set and `remoteSHA` (e.g. from `filterChangedRepos()`)
+    is not given.
+    """
+    start: float = time.perf_counter()
+
+    record: dict | None = None if ledger is None else ledger.getRecord(url)
+    localSHA: str
+    if record is not None and record["sha"] is not None:
+        localSHA = record["sha"]
+    else:
+        localSHA = getLatestGitCommit(gitProjectPath=gitPath)
+
+    if remoteSHA is None and checkRemote:
+        remoteSHA = getRemoteHeadSHA(url)
+    if remoteSHA is not None and remoteSHA == localSHA:
+        size: int
+        if record is not None and record["size"] is not None:
+            size = record["size"]
+        else:
+            size = getDirectorySize(gitPath)
+
+        return CloneResult(
+            url=url,
+            path=gitPath,
+            returnCode=0,
+            duration=time.perf_counter() - start,
+            size=size,
+            status="unchanged",
+        )
 
-    return subprocess.run(args=gitCommand, shell=False, stderr=subprocess.DEVNULL)
+    process: CompletedProcess = updateRepo(gitPath, options)
+    if process.returncode == 0:
+        options.linkLFSObjects(gitPath)
+    duration: float = time.perf_counter() - start
+    size: int = getDirectorySize(gitPath)
+
+    # A failed fetch leaves the previous snapshot intact, so the ledger entry
+    # is only touched on success
+    if process.returncode == 0 and ledger is not None:
+        ledger.markDone(
+            url,
+            sha=getLatestGitCommit(gitProjectPath=gitPath),
+            size=size,
+            duration=duration,
+        )
+
+    return CloneResult(
+        url=url,
+        path=gitPath,
+        returnCode=process.returncode,
+        duration=duration,
+        size=size,
+        status="updated" if process.returncode == 0 else "failed",
+    )
+
+
+def runClone(
+    url: str,
+    rootGitClonePath: PurePath,
+    options: CloneOptions = CloneOptions(),
+    ledger: CloneLedger | None = None,
+    remoteSHA: str | None = None,
+    checkRemote: bool = True,
+) -> CloneResult:
+    """
+    Clones (or with `options.update`, updates) a single repository. See
+    `runUpdate()` for `remoteSHA` and `checkRemote`.
+    """
+    gitPath: PurePath | bool = getRepoPath(url, rootGitClonePath)
+
+    if options.update and gitPath != False and isGitRepo(gitPath):
+        state: str | None = None if ledger is None else ledger.getState(url)
+        if state not in [IN_PROGRESS, FAILED]:
+            return runUpdate(
+                url, gitPath, options, ledger, remoteSHA, checkRemote=checkRemote
+            )
+
+    if ledger is not None and gitPath != False:
+        if prepareClonePath(url, gitPath, ledger) == False:
+            return CloneResult(
+                url=url,
+                path=gitPath,
+                returnCode=0,
+                duration=0.0,
+                size=getDirectorySize(gitPath),
+                status="skipped",
+            )
+        ledger.markInProgress(url)
+
+    start: float = time.perf_counter()
+
+    process: CompletedProcess | bool = cloneRepo(url, rootGitClonePath, options)
+
+    duration: float = time.perf_counter() - start
+
+    if process == False:
+        return CloneResult(
+            url=url,
+            path=None,
+            returnCode=-1,
+            duration=duration,
+            size=0,
+            status="failed",
+        )
+
+    if process.returncode != 0:
+        if ledger is not None:
+            ledger.markFailed(url)
+            rmtree(gitPath, ignore_errors=True)
+
+        return CloneResult(
+            url=url,
+            path=gitPath,
+            returnCode=process.returncode,
+            duration=duration,
+            size=0,
+            status="failed",
+        )
+
+    options.linkLFSObjects(gitPath)
+
+    size: int = getDirectorySize(gitPath)
+    if ledger is not None:
+        ledger.markDone(
+            url,
+            sha=getLatestGitCommit(gitProjectPath=gitPath),
+            size=size,
+            duration=duration,
+        )
+
+    return CloneResult(
+        url=url,
+        path=gitPath,
+        returnCode=process.returncode,
+        duration=duration,
+        size=size,
+    )
+
+
+class HostLimiter:
+    """Caps the clones running at once against the same host at `hostLimit`"""
+
+    def __init__(self, hostLimit: int | None = None) -> None:
+        self.hostLimit: int | None = hostLimit
+        self.semaphores: Dict[str, BoundedSemaphore] = {}
+        self.lock: Lock = Lock()
+
+    def limit(self, url: str) -> AbstractContextManager:
+        if self.hostLimit is None:
+            return nullcontext()
+
+        host: str = urlparse(url).netloc if isinstance(url, str) else ""
+        with self.lock:
+            if host not in self.semaphores:
+                self.semaphores[host] = BoundedSemaphore(self.hostLimit)
+            return self.semaphores[host]
+
+
+def printRemainingWork(
+    urls: List[str], ledger: CloneLedger, options: CloneOptions
+) -> None:
+    counts: Dict[str, int] = ledger.summary(urls)
+    remaining: int = len(urls) - counts[DONE]
+    estimate: float = remaining * ledger.averageDuration() / max(options.workers, 1)
+
+    print(
+        f"{counts[DONE]} of {len(urls)} repos already cloned, "
+        f"{counts[FAILED]} previously failed, {remaining} remaining "
+        f"(~{estimate / 3600:.1f} hours)"
+    )
+
+
+def cloneRepos(
+    urls: List[str],
+    rootGitClonePath: PurePath,
+    options: CloneOptions = CloneOptions(),
+    ledger: CloneLedger | None = None,
+    expectedSHAs: Dict[str, str] | None = None,
+) -> List[CloneResult]:
+    """
+    Clones `urls` into `rootGitClonePath` with up to `options.workers` clones
+    running at once, and at most `options.hostLimit` against the same host.
+
+    If a `ledger` is given, repositories it records as done are skipped and
+    partial clones from earlier runs are removed and retried. With
+    `options.update`, existing clones are fetched instead of skipped, but only
+    those that `filterChangedRepos()` reports as out of date.
+
+    Results are returned in the same order as `urls`.
+    """
+    doneSizes: Dict[str, int] = {}
+    if ledger is not None:
+        ledger.addURLs(urls)
+        doneSizes = ledger.getDoneSizes()
+        printRemainingWork(urls, ledger, options)
+
+    # Changed URLs and their remote HEADs, which are not queried again
+    changedURLs: Dict[str, str | None] | None = None
+    if options.update:
+        changedURLs = filterChangedRepos(
+            urls,
+            rootGitClonePath,
+            expectedSHAs=expectedSHAs,
+            workers=options.workers,
+            ledger=ledger,
+        )
+
+    hostLimiter: HostLimiter = HostLimiter(options.hostLimit)
+    barLock: Lock = Lock()
+
+    # URLs that share a clone directory would race each other into it (and
+    # `prepareClonePath` could remove a clone still in progress), so only the
+    # first URL of each directory is cloned
+    cloneKeys: Dict[str, str] = {}
+    url: str
+    for url in urls:
+        cloneKeys.setdefault(getCloneKey(url, rootGitClonePath), url)
+
+    with ThreadPoolExecutor(max_workers=options.workers) as executor:
+        with Bar(
+            f"Cloning git repos to {rootGitClonePath}...", max=len(cloneKeys)
+        ) as bar:
+
+            def _concurrentHelper(url: str) -> CloneResult:
+                skipStatus: str | None = None
+                if changedURLs is not None:
+                    if url not in changedURLs:
+                        skipStatus = "unchanged"
+                elif url in doneSizes:
+                    skipStatus = "skipped"
+
+                if skipStatus is not None:
+                    gitPath: PurePath = getRepoPath(url, rootGitClonePath)
+                    size: int | None = doneSizes.get(url)
+                    with barLock:
+                        bar.next()
+                    return CloneResult(
+                        url=url,
+                        path=gitPath,
+                        returnCode=0,
+                        duration=0.0,
+                        size=getDirectorySize(gitPath) if size is None else size,
+                        status=skipStatus,
+                    )
+
+                def _runClone() -> CloneResult:
+                    if changedURLs is None:
+                        return runClone(url, rootGitClonePath, options, ledger)
+                    return runClone(
+                        url,
+                        rootGitClonePath,
+                        options,
+                        ledger,
+                        remoteSHA=changedURLs[url],
+                        checkRemote=False,
+                    )
+
+                with hostLimiter.limit(url):
+                    result: CloneResult = _runClone()
+
+                with barLock:
+                    bar.next()
+                return result
+
+            results: Dict[str, CloneResult] = dict(
+                zip(cloneKeys, executor.map(_concurrentHelper, cloneKeys.values()))
+            )
+
+    return [
+        replace(results[getCloneKey(url, rootGitClonePath)], url=url) for url in urls
+    ]
 
 
 def getLatestGitCommitOfFile(gitProjectPath: PurePath, filepath: PurePath) -> str:
@@ -94,3 +635,163 @@ def getLatestGitCommit(gitProjectPath: PurePath) -> str:
     )
 
     return process.stdout.decode(encoding="UTF-8").strip().replace('"', "")
+
+
+def getGitDirectory(gitProjectPath: PurePath) -> PurePath | None:
+    """Returns the .git directory of a clone, or the clone itself if it is bare"""
+    dotGitPath: PurePath = PurePath(f"{gitProjectPath}/.git")
+    if isdir(dotGitPath):
+        return dotGitPath
+    if isfile(PurePath(f"{gitProjectPath}/HEAD")):
+        return gitProjectPath
+    return None
+
+
+def isSHA(text: str) -> bool:
+    # SHA-1 or SHA-256 object names
+    return len(text) in [40, 64] and all(char in hexdigits for char in text)
+
+
+def readPackedRef(gitDirectory: PurePath, ref: str) -> str | None:
+    try:
+        with open(PurePath(f"{gitDirectory}/packed-refs"), "r") as packedRefsFile:
+            line: str
+            for line in packedRefsFile:
+                if line.startswith(("#", "^")):
+                    continue
+
+                splitLine: List[str] = line.split()
+                if len(splitLine) == 2 and splitLine[1] == ref:
+                    return splitLine[0]
+    except OSError:
+        pass
+
+    return None
+
+
+def readHeadSHA(gitProjectPath: PurePath) -> str | None:
+    """
+    Resolves HEAD by reading `HEAD`, the loose ref it points to, and
+    `packed-refs` directly. Returns None when the refs cannot be read this way
+    (e.g. worktrees, reftable repositories, or empty repositories).
+    """
+    gitDirectory: PurePath | None = getGitDirectory(gitProjectPath)
+    if gitDirectory is None:
+        return None
+
+    try:
+        with open(PurePath(f"{gitDirectory}/HEAD"), "r") as headFile:
+            head: str = headFile.read().strip()
+    except OSError:
+        return None
+
+    if head.startswith("ref: ") == False:
+        return head if isSHA(head) else None
+
+    ref: str = head[5:]
+    try:
+        with open(PurePath(f"{gitDirectory}/{ref}"), "r") as refFile:
+            sha: str = refFile.read().strip()
+    except OSError:
+        return readPackedRef(gitDirectory, ref)
+
+    return sha if isSHA(sha) else None
+
+
+def getLatestGitCommits(
+    gitProjectPaths: Iterable[PurePath], workers: int = 8
+) -> Dict[PurePath, str]:
+    """
+    Resolves the latest commit SHA of every repository in `gitProjectPaths`,
+    resolving each distinct path once.
+
+    SHAs are read from the repository's ref files; only repositories whose
+    refs cannot be read directly fall back to `getLatestGitCommit`, run on a
+    thread pool.
+    """
+    shas: Dict[PurePath, str] = {}
+    fallbackPaths: List[PurePath] = []
+
+    gitProjectPath: PurePath
+    for gitProjectPath in dict.fromkeys(gitProjectPaths):
+        sha: str | None = readHeadSHA(gitProjectPath)
+        if sha is None:
+            fallbackPaths.append(gitProjectPath)
+        else:
+            shas[gitProjectPath] = sha
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        shas.update(
+            zip(
+                fallbackPaths,
+                executor.map(
+                    lambda path: getLatestGitCommit(gitProjectPath=path),
+                    fallbackPaths,
+                ),
+            )
+        )
+
+    return shas
+
+
+def getLatestGitCommitsOfFiles(gitProjectPath: PurePath) -> Dict[str, str]:
+    """
+    Maps every path ever touched in the repository to the SHA of the latest
+    commit that touched it, using a single `git log --name-only` traversal
+    """
+    gitCommand: List[str] = [
+        "git",
+        "--no-pager",
+        "-c",
+        "core.quotePath=false",
+        "-C",
+        gitProjectPath,
+        "log",
+        "--no-renames",
+        # Merges list the files that differ from every parent, which is when
+        # `git log -n 1 -- <path>` reports a merge rather than a parent commit
+        "-c",
+        "--name-only",
+        "--format=commit %H",
+    ]
+
+    process: CompletedProcess = subprocess.run(
+        args=gitCommand, shell=False, stdout=subprocess.PIPE
+    )
+
+    index: Dict[str, str] = {}
+    sha: str = ""
+
+    line: str
+    for line in process.stdout.decode(encoding="UTF-8").splitlines():
+        if line.startswith("commit "):
+            sha = line[7:]
+        elif line != "":
+            # git log lists commits newest first
+            index.setdefault(line, sha)
+
+    return index
+
+
+def loadFileCommitIndex(
+    gitProjectPath: PurePath, indexPath: PurePath
+) -> Dict[str, str]:
+    """
+    Returns the `getLatestGitCommitsOfFiles` index of a repository, rebuilding
+    the copy cached at `indexPath` only when the repository's HEAD has moved
+    """
+    head: str | None = readHeadSHA(gitProjectPath)
+    if head is None:
+        head = getLatestGitCommit(gitProjectPath=gitProjectPath)
+
+    if testForFile(path=indexPath):
+        cachedIndex: dict = readJSON(jsonFilePath=indexPath)
+        if cachedIndex.get("HEAD") == head:
+            return cachedIndex["Files"]
+
+    print(f"Indexing the latest commit of every file in {gitProjectPath}...")
+    index: Dict[str, str] = getLatestGitCommitsOfFiles(gitProjectPath)
+
+    saveJSON(json={"HEAD": head, "Files": index}, filepath=indexPath)
+
+    return index
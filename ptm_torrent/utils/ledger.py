@@ -0,0 +1,128 @@
+import sqlite3
+from pathlib import PurePath
+from sqlite3 import Connection
+from threading import Lock
+from typing import Dict, Iterable, List
+
+PENDING: str = "pending"
+IN_PROGRESS: str = "in-progress"
+DONE: str = "done"
+FAILED: str = "failed"
+
+
+class CloneLedger:
+    """
+    Persistent record of the state of every repository a hub has tried to
+    clone.
+
+    The ledger is a SQLite database so that concurrent `downloadRepos` runs
+    against the same hub can share it, and so that an interrupted run can be
+    restarted without re-cloning finished repositories. Like `WorkQueue`, it
+    uses a rollback journal rather than WAL, so that runs on several machines
+    can share it on a filesystem with working POSIX locks.
+    """
+
+    def __init__(self, ledgerPath: PurePath) -> None:
+        self.ledgerPath: PurePath = ledgerPath
+        self.lock: Lock = Lock()
+        self.connection: Connection = sqlite3.connect(
+            database=ledgerPath, timeout=60, check_same_thread=False
+        )
+
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=DELETE")
+            # Wait for other nodes' transactions rather than fail with "locked"
+            self.connection.execute("PRAGMA busy_timeout=60000")
+            self.connection.execute(
+                """CREATE TABLE IF NOT EXISTS repos (
+                    url TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    sha TEXT,
+                    size INTEGER,
+                    duration REAL
+                )"""
+            )
+
+    def addURLs(self, urls: Iterable[str]) -> None:
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO repos (url, state) VALUES (?, ?)",
+                [(url, PENDING) for url in urls if url is not None],
+            )
+
+    def getState(self, url: str) -> str | None:
+        with self.lock:
+            row: tuple | None = self.connection.execute(
+                "SELECT state FROM repos WHERE url = ?", (url,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def getRecord(self, url: str) -> dict | None:
+        with self.lock:
+            row: tuple | None = self.connection.execute(
+                "SELECT state, sha, size FROM repos WHERE url = ?", (url,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return {"state": row[0], "sha": row[1], "size": row[2]}
+
+    def getDoneSizes(self) -> Dict[str, int]:
+        """Returns the size on disk of every finished repository keyed by URL"""
+        with self.lock:
+            rows: List[tuple] = self.connection.execute(
+                "SELECT url, size FROM repos WHERE state = ?", (DONE,)
+            ).fetchall()
+        return {row[0]: row[1] or 0 for row in rows}
+
+    def markInProgress(self, url: str) -> None:
+        self._setState(url, IN_PROGRESS)
+
+    def markFailed(self, url: str) -> None:
+        self._setState(url, FAILED)
+
+    def markDone(self, url: str, sha: str, size: int, duration: float | None) -> None:
+        with self.lock, self.connection:
+            self.connection.execute(
+                """INSERT INTO repos (url, state, sha, size, duration)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    state = excluded.state,
+                    sha = excluded.sha,
+                    size = excluded.size,
+                    duration = excluded.duration""",
+                (url, DONE, sha, size, duration),
+            )
+
+    def summary(self, urls: Iterable[str]) -> Dict[str, int]:
+        """Returns the number of `urls` in each state"""
+        counts: Dict[str, int] = {PENDING: 0, IN_PROGRESS: 0, DONE: 0, FAILED: 0}
+
+        with self.lock:
+            states: Dict[str, str] = dict(
+                self.connection.execute("SELECT url, state FROM repos").fetchall()
+            )
+
+        url: str
+        for url in urls:
+            counts[states.get(url, PENDING)] += 1
+
+        return counts
+
+    def averageDuration(self) -> float:
+        with self.lock:
+            row: tuple = self.connection.execute(
+                "SELECT AVG(duration) FROM repos WHERE state = ?", (DONE,)
+            ).fetchone()
+        return row[0] or 0.0
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _setState(self, url: str, state: str) -> None:
+        with self.lock, self.connection:
+            self.connection.execute(
+                """INSERT INTO repos (url, state) VALUES (?, ?)
+                ON CONFLICT(url) DO UPDATE SET state = excluded.state""",
+                (url, state),
+            )
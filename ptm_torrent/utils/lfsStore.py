@@ -0,0 +1,324 @@
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from os import environ, getpid, link, makedirs, remove, replace, stat, stat_result, walk
+from os.path import abspath, dirname, isfile
+from pathlib import PurePath
+from shutil import copyfile
+from string import hexdigits
+from subprocess import CompletedProcess
+from threading import Lock
+from typing import List, Set, Tuple
+
+from progress.bar import Bar
+
+from ptm_torrent.utils.fileSystem import findFiles
+
+try:
+    from fcntl import ioctl
+except ImportError:
+    ioctl = None
+
+# Linux ioctl that makes a file share the extents of another (btrfs, XFS, ...)
+FICLONE: int = 0x40049409
+
+linkModes: List[str] = ["hardlink", "reflink"]
+
+
+@dataclass
+class ReconcileResult:
+    repoPath: PurePath
+    # Objects moved from the clone's .git/lfs/objects into the store
+    objectsStored: int = 0
+    # Objects the store already had, deleted from the clone
+    objectsDeduplicated: int = 0
+    # Working tree files replaced with links to the store
+    filesLinked: int = 0
+    bytesSaved: int = 0
+    # Excluded files downloaded because no other clone stored their objects
+    filesPulled: int = 0
+
+
+def isOID(text: str) -> bool:
+    return len(text) == 64 and all(char in hexdigits for char in text)
+
+
+def getObjectPath(storePath: PurePath, oid: str) -> PurePath:
+    # Same layout as .git/lfs/objects, so the store can be used as lfs.storage
+    return PurePath(f"{storePath}/{oid[0:2]}/{oid[2:4]}/{oid}")
+
+
+def runGit(repoPath: PurePath, args: List[str]) -> CompletedProcess:
+    # Never fall through to a repository that contains `repoPath`
+    ceiling: str = dirname(abspath(repoPath))
+    return subprocess.run(
+        args=["git", "-C", repoPath, *args],
+        shell=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env={**environ, "GIT_CEILING_DIRECTORIES": ceiling},
+    )
+
+
+def reflinkFile(source: PurePath, destination: PurePath) -> None:
+    if ioctl is None:
+        raise OSError("Reflinks are not supported on this platform")
+
+    with open(source, "rb") as sourceFile, open(destination, "wb") as destinationFile:
+        ioctl(destinationFile.fileno(), FICLONE, sourceFile.fileno())
+
+
+def linkFile(
+    source: PurePath, destination: PurePath, linkMode: str = "hardlink"
+) -> bool:
+    """
+    Atomically replaces `destination` with a link to `source`. Returns False
+    (leaving `destination` as it was) if the filesystem cannot link them.
+    """
+    temporaryPath: PurePath = PurePath(f"{destination}.{getpid()}.lfslink")
+
+    try:
+        if linkMode == "reflink":
+            reflinkFile(source, temporaryPath)
+        else:
+            link(source, temporaryPath)
+        replace(temporaryPath, destination)
+    except OSError:
+        if isfile(temporaryPath):
+            remove(temporaryPath)
+        return False
+
+    return True
+
+
+def addObject(storePath: PurePath, oid: str, objectPath: PurePath) -> bool:
+    """
+    Moves `objectPath` into the store, or deletes it if the store already has
+    the object. Returns True if the object was new to the store.
+    """
+    storeObjectPath: PurePath = getObjectPath(storePath, oid)
+
+    if isfile(storeObjectPath):
+        remove(objectPath)
+        return False
+
+    makedirs(storeObjectPath.parent, exist_ok=True)
+    try:
+        replace(objectPath, storeObjectPath)
+    except OSError:
+        # The store is on another filesystem
+        temporaryPath: PurePath = PurePath(f"{storeObjectPath}.{getpid()}.tmp")
+        copyfile(objectPath, temporaryPath)
+        replace(temporaryPath, storeObjectPath)
+        remove(objectPath)
+
+    return True
+
+
+def getGitDirectory(repoPath: PurePath) -> PurePath | None:
+    process: CompletedProcess = runGit(repoPath, ["rev-parse", "--absolute-git-dir"])
+    if process.returncode != 0:
+        return None
+    return PurePath(process.stdout.decode(encoding="UTF-8").strip())
+
+
+def isBareRepo(repoPath: PurePath) -> bool:
+    process: CompletedProcess = runGit(repoPath, ["rev-parse", "--is-bare-repository"])
+    return process.stdout.decode(encoding="UTF-8").strip() == "true"
+
+
+def storeObjects(
+    gitDirectory: PurePath, storePath: PurePath, result: ReconcileResult
+) -> None:
+    root: str
+    files: List[str]
+    for root, _, files in walk(f"{gitDirectory}/lfs/objects"):
+        filename: str
+        for filename in files:
+            if isOID(filename) == False:
+                continue
+
+            objectPath: PurePath = PurePath(f"{root}/{filename}")
+            size: int = stat(objectPath).st_size
+
+            if addObject(storePath, filename, objectPath):
+                result.objectsStored += 1
+            else:
+                result.objectsDeduplicated += 1
+                result.bytesSaved += size
+
+
+def getModifiedFiles(repoPath: PurePath) -> Set[str]:
+    process: CompletedProcess = runGit(repoPath, ["ls-files", "-m", "-z"])
+    return set(process.stdout.decode(encoding="UTF-8").split("\0"))
+
+
+def getLFSFiles(repoPath: PurePath) -> List[Tuple[str, str, bool]]:
+    """
+    Returns the (oid, path, whether its content is checked out) of every LFS
+    file, or nothing if git-lfs is not installed
+    """
+    process: CompletedProcess = runGit(repoPath, ["lfs", "ls-files", "--long"])
+    if process.returncode != 0:
+        return []
+
+    files: List[Tuple[str, str, bool]] = []
+
+    line: str
+    for line in process.stdout.decode(encoding="UTF-8").splitlines():
+        # "<oid> * <path>" when checked out, "<oid> - <path>" for pointers
+        splitLine: List[str] = line.split(" ", 2)
+        if len(splitLine) == 3 and isOID(splitLine[0]):
+            files.append((splitLine[0], splitLine[2], splitLine[1] == "*"))
+
+    return files
+
+
+def linkWorkingTree(
+    repoPath: PurePath,
+    storePath: PurePath,
+    linkMode: str,
+    result: ReconcileResult,
+) -> None:
+    # Files that were edited after checkout no longer match their oid
+    modifiedFiles: Set[str] = getModifiedFiles(repoPath)
+
+    oid: str
+    path: str
+    checkedOut: bool
+    for oid, path, checkedOut in getLFSFiles(repoPath):
+        if path in modifiedFiles:
+            continue
+
+        filePath: PurePath = PurePath(f"{repoPath}/{path}")
+        storeObjectPath: PurePath = getObjectPath(storePath, oid)
+        if isfile(storeObjectPath) == False or isfile(filePath) == False:
+            continue
+
+        fileStat: stat_result = stat(filePath)
+        storeStat: stat_result = stat(storeObjectPath)
+        if (fileStat.st_dev, fileStat.st_ino) == (storeStat.st_dev, storeStat.st_ino):
+            continue
+        # Pointers (e.g. files excluded from the clone) are filled from the store
+        if checkedOut and fileStat.st_size != storeStat.st_size:
+            continue
+
+        if linkFile(storeObjectPath, filePath, linkMode):
+            result.filesLinked += 1
+            result.bytesSaved += storeStat.st_size
+
+
+def getFetchExclude(repoPath: PurePath) -> str | None:
+    process: CompletedProcess = runGit(repoPath, ["config", "lfs.fetchexclude"])
+    if process.returncode != 0:
+        return None
+    return process.stdout.decode(encoding="UTF-8").strip() or None
+
+
+def pullExcludedFiles(
+    repoPath: PurePath, storePath: PurePath, result: ReconcileResult
+) -> None:
+    """
+    Clears the `lfs.fetchexclude` a clone was made with and downloads the
+    excluded files whose objects never reached the store (e.g. because the
+    clone meant to download them failed)
+    """
+    fetchExclude: str | None = getFetchExclude(repoPath)
+    if fetchExclude is None:
+        return
+
+    missingFiles: List[str] = [
+        path
+        for oid, path, checkedOut in getLFSFiles(repoPath)
+        if checkedOut == False and isfile(getObjectPath(storePath, oid)) == False
+    ]
+
+    runGit(repoPath, ["config", "--unset", "lfs.fetchexclude"])
+    if len(missingFiles) == 0:
+        return
+
+    command: str = "fetch" if isBareRepo(repoPath) else "pull"
+    if runGit(repoPath, ["lfs", command]).returncode != 0:
+        # Keep the exclude so that the next reconcile retries
+        runGit(repoPath, ["config", "lfs.fetchexclude", fetchExclude])
+        return
+
+    result.filesPulled += len(missingFiles)
+
+
+def reconcileRepo(
+    repoPath: PurePath,
+    storePath: PurePath,
+    linkMode: str = "hardlink",
+    pullExcluded: bool = False,
+) -> ReconcileResult:
+    """
+    Moves a clone's LFS objects into the shared store at `storePath`, points
+    the clone's `lfs.storage` at the store so later fetches skip objects it
+    already has, and replaces LFS files (checked out or still pointers) with
+    links to the store.
+
+    With `pullExcluded`, files the clone excluded for another clone to
+    download but that are still missing from the store are downloaded. Only
+    use it once every clone has finished.
+
+    Linked files share their content with every other clone of the same
+    object, so clones must be treated as read-only snapshots.
+    """
+    result: ReconcileResult = ReconcileResult(repoPath=repoPath)
+
+    gitDirectory: PurePath | None = getGitDirectory(repoPath)
+    if gitDirectory is None:
+        return result
+
+    storeObjects(gitDirectory, storePath, result)
+    runGit(repoPath, ["config", "lfs.storage", abspath(storePath)])
+
+    if pullExcluded:
+        pullExcludedFiles(repoPath, storePath, result)
+
+    if isBareRepo(repoPath) == False:
+        linkWorkingTree(repoPath, storePath, linkMode, result)
+
+    return result
+
+
+def reconcileRepos(
+    reposPath: PurePath,
+    storePath: PurePath,
+    linkMode: str = "hardlink",
+    workers: int = 4,
+    pullExcluded: bool = False,
+) -> List[ReconcileResult]:
+    """Runs `reconcileRepo` on every `{author}/{repo}` clone in `reposPath`"""
+    repoPaths: List[PurePath] = findFiles(globStr=f"{reposPath}/*/*")
+    barLock: Lock = Lock()
+
+    with Bar(f"Linking LFS objects into {storePath}...", max=len(repoPaths)) as bar:
+
+        def _reconcileHelper(repoPath: PurePath) -> ReconcileResult:
+            result: ReconcileResult = reconcileRepo(
+                repoPath, storePath, linkMode, pullExcluded
+            )
+            with barLock:
+                bar.next()
+            return result
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results: List[ReconcileResult] = list(
+                executor.map(_reconcileHelper, repoPaths)
+            )
+
+    print(
+        f"\nStored {sum(result.objectsStored for result in results)} objects, "
+        f"removed {sum(result.objectsDeduplicated for result in results)} duplicate "
+        f"objects, linked {sum(result.filesLinked for result in results)} files, "
+        f"and freed {sum(result.bytesSaved for result in results) / 1e9:.2f} GB"
+    )
+    if pullExcluded:
+        print(
+            f"Downloaded {sum(result.filesPulled for result in results)} excluded "
+            "files whose objects were missing from the store"
+        )
+
+    return results
@@ -1,23 +1,158 @@
-from requests import Response, get
+import json
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import PurePath
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 defaultHeaders: dict = {"User-Agent": "PTMTorrent"}
 
+# (connect, read) timeouts in seconds
+defaultTimeout: tuple = (10, 60)
+
+session: Session | None = None
+
+
+def createSession(
+    poolSize: int = 32, retries: int = 5, backoffFactor: float = 1.0
+) -> Session:
+    """
+    Creates a `requests` session that keeps up to `poolSize` connections per
+    host alive and retries 429 and 5xx responses with exponential backoff,
+    honoring any `Retry-After` header.
+    """
+    retry: Retry = Retry(
+        total=retries,
+        backoff_factor=backoffFactor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=poolSize, pool_maxsize=poolSize, max_retries=retry
+    )
+
+    newSession: Session = Session()
+    newSession.mount("http://", adapter)
+    newSession.mount("https://", adapter)
+    return newSession
+
+
+def getSession() -> Session:
+    """Returns the session shared by every download in this process"""
+    global session
+    if session is None:
+        session = createSession()
+    return session
+
+
+def get(url: str, headers: dict = defaultHeaders, data: dict = {}) -> Response:
+    return getSession().get(url=url, headers=headers, data=data, timeout=defaultTimeout)
+
+
+@dataclass
+class CachedResponse:
+    statusCode: int
+    content: bytes
+    # False when the server confirmed the cached copy is still current
+    changed: bool = True
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("UTF-8")
+
+    def json(self) -> dict | list:
+        return json.loads(self.content)
+
+
+def getCached(
+    url: str,
+    headers: dict = defaultHeaders,
+    data: dict = {},
+    cachePath: PurePath | None = None,
+) -> CachedResponse:
+    """
+    GETs `url`, optionally through an on-disk cache stored in `cachePath`.
+
+    Cached responses are revalidated with `If-None-Match` and
+    `If-Modified-Since` so unchanged resources come back as a 304 without a
+    body. Servers that send no validators are detected by comparing bodies.
+    """
+    if cachePath is None:
+        resp: Response = get(url=url, headers=headers, data=data)
+        return CachedResponse(statusCode=resp.status_code, content=resp.content)
+
+    key: str = sha256(url.encode("UTF-8")).hexdigest()
+    bodyPath: PurePath = PurePath(f"{cachePath}/{key}.body")
+    metadataPath: PurePath = PurePath(f"{cachePath}/{key}.json")
+
+    metadata: dict = {}
+    try:
+        with open(metadataPath, "r") as metadataFile:
+            metadata = json.load(metadataFile)
+        with open(bodyPath, "rb") as bodyFile:
+            cachedBody: bytes | None = bodyFile.read()
+    except (FileNotFoundError, json.JSONDecodeError):
+        metadata = {}
+        cachedBody = None
+
+    conditionalHeaders: dict = dict(headers)
+    if cachedBody is not None:
+        if metadata.get("ETag") is not None:
+            conditionalHeaders["If-None-Match"] = metadata["ETag"]
+        if metadata.get("Last-Modified") is not None:
+            conditionalHeaders["If-Modified-Since"] = metadata["Last-Modified"]
+
+    resp: Response = get(url=url, headers=conditionalHeaders, data=data)
+
+    if resp.status_code == 304 and cachedBody is not None:
+        return CachedResponse(statusCode=200, content=cachedBody, changed=False)
+
+    if resp.status_code != 200:
+        return CachedResponse(statusCode=resp.status_code, content=resp.content)
+
+    with open(bodyPath, "wb") as bodyFile:
+        bodyFile.write(resp.content)
+    with open(metadataPath, "w") as metadataFile:
+        json.dump(
+            {
+                "URL": url,
+                "ETag": resp.headers.get("ETag"),
+                "Last-Modified": resp.headers.get("Last-Modified"),
+            },
+            metadataFile,
+        )
+
+    return CachedResponse(
+        statusCode=200, content=resp.content, changed=resp.content != cachedBody
+    )
+
 
 def downloadJSON(
-    url: str, headers: dict = defaultHeaders, data: dict = {}
+    url: str,
+    headers: dict = defaultHeaders,
+    data: dict = {},
+    cachePath: PurePath | None = None,
 ) -> dict | int:
-    resp: Response = get(url=url, headers=headers, data=data)
+    resp: CachedResponse = getCached(
+        url=url, headers=headers, data=data, cachePath=cachePath
+    )
 
-    if resp.status_code != 200:
-        return resp.status_code
+    if resp.statusCode != 200:
+        return resp.statusCode
 
     return resp.json()
 
 
-def downloadHTML(url: str, headers: dict = defaultHeaders) -> str | int:
-    resp: Response = get(url, headers)
+def downloadHTML(
+    url: str, headers: dict = defaultHeaders, cachePath: PurePath | None = None
+) -> str | int:
+    resp: CachedResponse = getCached(url=url, headers=headers, cachePath=cachePath)
 
-    if resp.status_code != 200:
-        return resp.status_code
+    if resp.statusCode != 200:
+        return resp.statusCode
 
-    return resp.content.decode("UTF-8")
+    return resp.text
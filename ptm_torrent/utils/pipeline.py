@@ -0,0 +1,159 @@
+from dataclasses import dataclass, field
+from hashlib import sha256
+from os import replace, stat, stat_result, walk
+from os.path import exists, isdir, isfile, relpath
+from pathlib import PurePath
+from typing import Any, Callable, Dict, List, Set
+
+from ptm_torrent.utils.fileSystem import readJSON, saveJSON, testForFile
+
+
+@dataclass
+class Stage:
+    name: str
+    run: Callable[[], Any]
+    # Files or directories the stage reads; their contents are fingerprinted
+    inputs: List[PurePath] = field(default_factory=list)
+    # Files or directories the stage writes; missing outputs force a rerun
+    outputs: List[PurePath] = field(default_factory=list)
+    # Names of the stages that must run first
+    dependencies: List[str] = field(default_factory=list)
+    # Stages that read from the network cannot be fingerprinted
+    alwaysRun: bool = False
+    # Anything else the stage's result depends on (e.g. settings or a git HEAD)
+    version: Callable[[], Any] | None = None
+
+
+def fingerprintFile(path: PurePath, digest: Any) -> None:
+    with open(path, "rb") as file:
+        chunk: bytes
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+
+def fingerprintDirectory(path: PurePath, digest: Any) -> None:
+    # Directories (e.g. git clones) are too large to hash, so use file metadata
+    root: str
+    directories: List[str]
+    files: List[str]
+    for root, directories, files in walk(path):
+        directories.sort()
+
+        filename: str
+        for filename in sorted(files):
+            filepath: str = f"{root}/{filename}"
+            try:
+                fileStat: stat_result = stat(filepath)
+            except OSError:
+                continue
+            entry: str = f"{relpath(filepath, path)}:{fileStat.st_size}"
+            digest.update(f"{entry}:{fileStat.st_mtime_ns}\n".encode())
+
+
+def fingerprintStage(stage: Stage) -> str:
+    digest: Any = sha256()
+
+    path: PurePath
+    for path in stage.inputs:
+        digest.update(f"{path}\n".encode())
+        if isfile(path):
+            fingerprintFile(path, digest)
+        elif isdir(path):
+            fingerprintDirectory(path, digest)
+        else:
+            digest.update(b"missing\n")
+
+    if stage.version is not None:
+        digest.update(repr(stage.version()).encode())
+
+    return digest.hexdigest()
+
+
+class Pipeline:
+    """
+    A DAG of stages that skips every stage whose inputs, version, and outputs
+    are unchanged since it last succeeded.
+
+    Fingerprints are stored in `statePath` after each stage, so an interrupted
+    pipeline resumes at the first stage that did not finish.
+    """
+
+    def __init__(self, name: str, stages: List[Stage], statePath: PurePath) -> None:
+        self.name: str = name
+        self.statePath: PurePath = statePath
+        self.stages: List[Stage] = sortStages(stages)
+
+    def readState(self) -> Dict[str, str]:
+        if testForFile(path=self.statePath) == False:
+            return {}
+        return readJSON(jsonFilePath=self.statePath)
+
+    def saveState(self, state: Dict[str, str]) -> None:
+        temporaryPath: PurePath = PurePath(f"{self.statePath}.tmp")
+        saveJSON(json=state, filepath=temporaryPath)
+        replace(temporaryPath, self.statePath)
+
+    def isUpToDate(self, stage: Stage, fingerprint: str, state: Dict[str, str]) -> bool:
+        if stage.alwaysRun or state.get(stage.name) != fingerprint:
+            return False
+        return all(exists(output) for output in stage.outputs)
+
+    def run(self, force: bool = False) -> Dict[str, str]:
+        """
+        Runs the pipeline and returns whether each stage "ran", was "skipped",
+        or "failed". A stage whose `run` returns False fails, and every stage
+        after it is left "pending".
+        """
+        statuses: Dict[str, str] = {stage.name: "pending" for stage in self.stages}
+        state: Dict[str, str] = {} if force else self.readState()
+
+        stage: Stage
+        for stage in self.stages:
+            fingerprint: str = fingerprintStage(stage)
+
+            if self.isUpToDate(stage, fingerprint, state):
+                print(f"[{self.name}] {stage.name} is up to date, skipping it.")
+                statuses[stage.name] = "skipped"
+                continue
+
+            print(f"[{self.name}] Running {stage.name}...")
+            if stage.run() is False:
+                print(f"[{self.name}] {stage.name} failed, stopping.")
+                statuses[stage.name] = "failed"
+                break
+
+            statuses[stage.name] = "ran"
+            state[stage.name] = fingerprint
+            self.saveState(state)
+
+        return statuses
+
+
+def sortStages(stages: List[Stage]) -> List[Stage]:
+    """Orders `stages` so that every stage comes after its dependencies"""
+    stagesByName: Dict[str, Stage] = {stage.name: stage for stage in stages}
+    sortedStages: List[Stage] = []
+    sortedNames: Set[str] = set()
+    visiting: Set[str] = set()
+
+    def _visit(stage: Stage) -> None:
+        if stage.name in sortedNames:
+            return
+        if stage.name in visiting:
+            raise ValueError(f"Stage {stage.name} depends on itself")
+
+        visiting.add(stage.name)
+        dependency: str
+        for dependency in stage.dependencies:
+            if dependency not in stagesByName:
+                raise ValueError(f"Stage {stage.name} depends on unknown {dependency}")
+            _visit(stagesByName[dependency])
+        visiting.remove(stage.name)
+
+        sortedStages.append(stage)
+        sortedNames.add(stage.name)
+
+    for stage in stages:
+        _visit(stage)
+
+    return sortedStages
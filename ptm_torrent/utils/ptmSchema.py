@@ -1,4 +1,6 @@
-# Code generated from https://app.quicktype.io/#l=schema
+# Hand-maintained. Originally generated from https://app.quicktype.io/#l=schema,
+# with the `from_union` chains since replaced by direct type checks and a
+# `validate` flag. Edit this file directly rather than regenerating it.
 
 from dataclasses import dataclass
 from typing import Any, Callable, List, Optional, Type, TypeVar, cast
@@ -40,7 +42,19 @@ def to_class(c: Type[T], x: Any) -> dict:
     return cast(Any, x).to_dict()
 
 
-@dataclass
+def from_optional_str(x: Any) -> Optional[str]:
+    assert x is None or isinstance(x, str)
+    return x
+
+
+def from_optional_list(x: Any) -> Optional[List[Any]]:
+    if x is None:
+        return None
+    assert isinstance(x, list)
+    return list(x)
+
+
+@dataclass(slots=True)
 class Dataset:
     dataset_name: str
     dataset_owner: str
@@ -50,45 +64,49 @@ class Dataset:
     dataset_usages: Optional[List[Any]] = None
 
     @staticmethod
-    def from_dict(obj: Any) -> "Dataset":
+    def from_dict(obj: Any, validate: bool = True) -> "Dataset":
+        if validate == False:
+            return Dataset(
+                obj.get("DatasetName"),
+                obj.get("DatasetOwner"),
+                obj.get("DatasetOwnerURL"),
+                obj.get("DatasetURL"),
+                obj.get("DatasetPaperDOI"),
+                from_optional_list(obj.get("DatasetUsages")),
+            )
+
         assert isinstance(obj, dict)
-        dataset_name = from_str(obj.get("DatasetName"))
-        dataset_owner = from_str(obj.get("DatasetOwner"))
-        dataset_owner_url = from_str(obj.get("DatasetOwnerURL"))
-        dataset_url = from_str(obj.get("DatasetURL"))
-        dataset_paper_doi = from_union(
-            [from_str, from_none], obj.get("DatasetPaperDOI")
-        )
-        dataset_usages = from_union(
-            [lambda x: from_list(lambda x: x, x), from_none], obj.get("DatasetUsages")
-        )
         return Dataset(
-            dataset_name,
-            dataset_owner,
-            dataset_owner_url,
-            dataset_url,
-            dataset_paper_doi,
-            dataset_usages,
+            from_str(obj.get("DatasetName")),
+            from_str(obj.get("DatasetOwner")),
+            from_str(obj.get("DatasetOwnerURL")),
+            from_str(obj.get("DatasetURL")),
+            from_optional_str(obj.get("DatasetPaperDOI")),
+            from_optional_list(obj.get("DatasetUsages")),
         )
 
-    def to_dict(self) -> dict:
-        result: dict = {}
-        result["DatasetName"] = from_str(self.dataset_name)
-        result["DatasetOwner"] = from_str(self.dataset_owner)
-        result["DatasetOwnerURL"] = from_str(self.dataset_owner_url)
-        result["DatasetURL"] = from_str(self.dataset_url)
+    def to_dict(self, validate: bool = True) -> dict:
+        if validate:
+            from_str(self.dataset_name)
+            from_str(self.dataset_owner)
+            from_str(self.dataset_owner_url)
+            from_str(self.dataset_url)
+            from_optional_str(self.dataset_paper_doi)
+
+        result: dict = {
+            "DatasetName": self.dataset_name,
+            "DatasetOwner": self.dataset_owner,
+            "DatasetOwnerURL": self.dataset_owner_url,
+            "DatasetURL": self.dataset_url,
+        }
         if self.dataset_paper_doi is not None:
-            result["DatasetPaperDOI"] = from_union(
-                [from_str, from_none], self.dataset_paper_doi
-            )
+            result["DatasetPaperDOI"] = self.dataset_paper_doi
         if self.dataset_usages is not None:
-            result["DatasetUsages"] = from_union(
-                [lambda x: from_list(lambda x: x, x), from_none], self.dataset_usages
-            )
+            result["DatasetUsages"] = from_optional_list(self.dataset_usages)
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelHub:
     metadata_file_path: str
     metadata_object_id: str
@@ -96,26 +114,39 @@ class ModelHub:
     model_hub_url: str
 
     @staticmethod
-    def from_dict(obj: Any) -> "ModelHub":
+    def from_dict(obj: Any, validate: bool = True) -> "ModelHub":
+        if validate == False:
+            return ModelHub(
+                obj.get("MetadataFilePath"),
+                obj.get("MetadataObjectID"),
+                obj.get("ModelHubName"),
+                obj.get("ModelHubURL"),
+            )
+
         assert isinstance(obj, dict)
-        metadata_file_path = from_str(obj.get("MetadataFilePath"))
-        metadata_object_id = from_str(obj.get("MetadataObjectID"))
-        model_hub_name = from_str(obj.get("ModelHubName"))
-        model_hub_url = from_str(obj.get("ModelHubURL"))
         return ModelHub(
-            metadata_file_path, metadata_object_id, model_hub_name, model_hub_url
+            from_str(obj.get("MetadataFilePath")),
+            from_str(obj.get("MetadataObjectID")),
+            from_str(obj.get("ModelHubName")),
+            from_str(obj.get("ModelHubURL")),
         )
 
-    def to_dict(self) -> dict:
-        result: dict = {}
-        result["MetadataFilePath"] = from_str(self.metadata_file_path)
-        result["MetadataObjectID"] = from_str(self.metadata_object_id)
-        result["ModelHubName"] = from_str(self.model_hub_name)
-        result["ModelHubURL"] = from_str(self.model_hub_url)
-        return result
+    def to_dict(self, validate: bool = True) -> dict:
+        if validate:
+            from_str(self.metadata_file_path)
+            from_str(self.metadata_object_id)
+            from_str(self.model_hub_name)
+            from_str(self.model_hub_url)
 
+        return {
+            "MetadataFilePath": self.metadata_file_path,
+            "MetadataObjectID": self.metadata_object_id,
+            "ModelHubName": self.model_hub_name,
+            "ModelHubURL": self.model_hub_url,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class PTMTorrent:
     id: int
     latest_git_commit_sha: str
@@ -130,62 +161,71 @@ class PTMTorrent:
     model_task: Optional[str] = None
 
     @staticmethod
-    def from_dict(obj: Any) -> "PTMTorrent":
+    def from_dict(obj: Any, validate: bool = True) -> "PTMTorrent":
+        if validate == False:
+            return PTMTorrent(
+                obj.get("id"),
+                obj.get("LatestGitCommitSHA"),
+                ModelHub.from_dict(obj.get("ModelHub"), validate=False),
+                obj.get("ModelName"),
+                obj.get("ModelOwner"),
+                obj.get("ModelOwnerURL"),
+                obj.get("ModelURL"),
+                from_optional_list(obj.get("Dataset")),
+                obj.get("ModelArchitecture"),
+                from_optional_list(obj.get("ModelPaperDOIs")),
+                obj.get("ModelTask"),
+            )
+
         assert isinstance(obj, dict)
-        id = from_int(obj.get("id"))
-        latest_git_commit_sha = from_str(obj.get("LatestGitCommitSHA"))
-        model_hub = ModelHub.from_dict(obj.get("ModelHub"))
-        model_name = from_str(obj.get("ModelName"))
-        model_owner = from_str(obj.get("ModelOwner"))
-        model_owner_url = from_str(obj.get("ModelOwnerURL"))
-        model_url = from_str(obj.get("ModelURL"))
-        datasets = from_union(
-            [lambda x: from_list(lambda x: x, x), from_none], obj.get("Dataset")
-        )
-        model_architecture = from_union(
-            [from_str, from_none], obj.get("ModelArchitecture")
-        )
-        model_paper_dois = from_union(
-            [lambda x: from_list(lambda x: x, x), from_none], obj.get("ModelPaperDOIs")
-        )
-        model_task = from_union([from_str, from_none], obj.get("ModelTask"))
         return PTMTorrent(
-            id,
-            latest_git_commit_sha,
-            model_hub,
-            model_name,
-            model_owner,
-            model_owner_url,
-            model_url,
-            datasets,
-            model_architecture,
-            model_paper_dois,
-            model_task,
+            from_int(obj.get("id")),
+            from_str(obj.get("LatestGitCommitSHA")),
+            ModelHub.from_dict(obj.get("ModelHub")),
+            from_str(obj.get("ModelName")),
+            from_str(obj.get("ModelOwner")),
+            from_str(obj.get("ModelOwnerURL")),
+            from_str(obj.get("ModelURL")),
+            from_optional_list(obj.get("Dataset")),
+            from_optional_str(obj.get("ModelArchitecture")),
+            from_optional_list(obj.get("ModelPaperDOIs")),
+            from_optional_str(obj.get("ModelTask")),
         )
 
-    def to_dict(self) -> dict:
-        result: dict = {}
-        result["id"] = from_int(self.id)
-        result["LatestGitCommitSHA"] = from_str(self.latest_git_commit_sha)
-        result["ModelHub"] = to_class(ModelHub, self.model_hub)
-        result["ModelName"] = from_str(self.model_name)
-        result["ModelOwner"] = from_str(self.model_owner)
-        result["ModelOwnerURL"] = from_str(self.model_owner_url)
-        result["ModelURL"] = from_str(self.model_url)
+    def to_dict(self, validate: bool = True) -> dict:
+        """
+        Serializes the record. With `validate` set to False the field types are
+        trusted instead of asserted, which is faster for records built by this
+        code base.
+        """
+        if validate:
+            from_int(self.id)
+            from_str(self.latest_git_commit_sha)
+            assert isinstance(self.model_hub, ModelHub)
+            from_str(self.model_name)
+            from_str(self.model_owner)
+            from_str(self.model_owner_url)
+            from_str(self.model_url)
+            from_optional_str(self.model_architecture)
+            from_optional_str(self.model_task)
+
+        result: dict = {
+            "id": self.id,
+            "LatestGitCommitSHA": self.latest_git_commit_sha,
+            "ModelHub": self.model_hub.to_dict(validate=validate),
+            "ModelName": self.model_name,
+            "ModelOwner": self.model_owner,
+            "ModelOwnerURL": self.model_owner_url,
+            "ModelURL": self.model_url,
+        }
         if self.datasets is not None:
-            result["Dataset"] = from_union(
-                [lambda x: from_list(lambda x: x, x), from_none], self.datasets
-            )
+            result["Dataset"] = from_optional_list(self.datasets)
         if self.model_architecture is not None:
-            result["ModelArchitecture"] = from_union(
-                [from_str, from_none], self.model_architecture
-            )
+            result["ModelArchitecture"] = self.model_architecture
         if self.model_paper_dois is not None:
-            result["ModelPaperDOIs"] = from_union(
-                [lambda x: from_list(lambda x: x, x), from_none], self.model_paper_dois
-            )
+            result["ModelPaperDOIs"] = from_optional_list(self.model_paper_dois)
         if self.model_task is not None:
-            result["ModelTask"] = from_union([from_str, from_none], self.model_task)
+            result["ModelTask"] = self.model_task
         return result
 
 
@@ -0,0 +1,206 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import islice
+from pathlib import PurePath
+from typing import Deque, Iterable, Iterator, List, Tuple
+
+from progress.spinner import Spinner
+
+import ptm_torrent as pt
+import ptm_torrent.huggingface as hf
+import ptm_torrent.modelhub as mh
+import ptm_torrent.modelzoo as mz
+import ptm_torrent.onnxmodelzoo as omz
+import ptm_torrent.pytorchhub as pyth
+from ptm_torrent.utils.fileSystem import (
+    isNDJSON,
+    readJSON,
+    readRecords,
+    saveRecords,
+    testForFile,
+)
+
+try:
+    from jsonschema.protocols import Validator
+    from jsonschema.validators import validator_for
+except ImportError:
+    validator_for = None
+
+schemasFolderPath: PurePath = PurePath(f"{PurePath(__file__).parent}/schemas")
+
+validationReportPath: PurePath = PurePath(
+    f"{pt.dataFolderPath}/validation_report.{pt.recordFormat}"
+)
+
+# (file to validate, schema in `schemasFolderPath`)
+validationTargets: List[Tuple[PurePath, str]] = [
+    (hf.huggingface_HubMetadataPath, "huggingfaceMetadata.json"),
+    (mh.modelhub_HubMetadataPath, "modelhubMetadata.json"),
+    (mz.modelzoo_HubMetadataPath, "modelZooHubMetadata.json"),
+    (mz.modelzoo_ConcatinatedModelMetadataPath, "modelZooModelMetadata.json"),
+    (omz.onnxmodelzoo_HubJSONMetadataPath, "onnxmodelhubHubMetadata.json"),
+    (omz.onnxmodelzoo_ModelJSONMetadataPath, "onnxmodelhubModelMetadata.json"),
+    (pyth.pytorchhub_ConcatinatedModelMetadataPath, "pytorchhubModelMetadata.json"),
+    (hf.huggingface_PTMSchemaPath, "ptmtorrent.json"),
+    (mh.modelhub_PTMSchemaPath, "ptmtorrent.json"),
+    (mz.modelzoo_PTMSchemaPath, "ptmtorrent.json"),
+    (omz.onnxmodelzoo_PTMSchemaPath, "ptmtorrent.json"),
+    (pyth.pytorchhub_PTMSchemaPath, "ptmtorrent.json"),
+]
+
+# Compiled once per worker process by `initializeWorker`
+validator: "Validator | None" = None
+
+
+@dataclass
+class Violation:
+    filePath: str
+    # Index of the record within the file
+    record: int
+    # JSON pointer style path to the offending field
+    field: str
+    message: str
+
+
+def loadSchema(schemaName: str) -> dict:
+    return readJSON(jsonFilePath=PurePath(f"{schemasFolderPath}/{schemaName}"))
+
+
+def getRecordSchema(schema: dict) -> dict:
+    """
+    Converts a schema describing an array of records into one that describes
+    a single record, so that records can be validated one at a time
+    """
+    if schema.get("type") != "array" or "items" not in schema:
+        return schema
+
+    recordSchema: dict = {
+        key: value for key, value in schema.items() if key not in ["type", "items"]
+    }
+    recordSchema.update(schema["items"])
+    return recordSchema
+
+
+def initializeWorker(schema: dict) -> None:
+    global validator
+    validatorClass: type = validator_for(schema)
+    validatorClass.check_schema(schema)
+    validator = validatorClass(schema)
+
+
+def validateBatch(filePath: str, batch: List[Tuple[int, dict]]) -> List[Violation]:
+    violations: List[Violation] = []
+
+    idx: int
+    record: dict
+    for idx, record in batch:
+        for error in validator.iter_errors(record):
+            violations.append(
+                Violation(
+                    filePath=filePath,
+                    record=idx,
+                    field="/" + "/".join(str(key) for key in error.absolute_path),
+                    message=error.message,
+                )
+            )
+
+    return violations
+
+
+def readBatches(
+    records: Iterable[dict], batchSize: int
+) -> Iterator[List[Tuple[int, dict]]]:
+    numberedRecords: Iterator[Tuple[int, dict]] = enumerate(records)
+    while True:
+        batch: List[Tuple[int, dict]] = list(islice(numberedRecords, batchSize))
+        if len(batch) == 0:
+            return
+        yield batch
+
+
+def validateFile(
+    filePath: PurePath,
+    schemaName: str,
+    workers: int = 4,
+    batchSize: int = 1000,
+) -> List[Violation]:
+    """
+    Validates every record in `filePath` against `schemaName`.
+
+    Records are streamed in batches of `batchSize` to a pool of `workers`
+    processes that each compile the schema once. At most two batches per
+    worker are in flight, so memory use does not grow with the file.
+    """
+    if validator_for is None:
+        raise ImportError("jsonschema is required to validate records")
+
+    schema: dict = loadSchema(schemaName)
+
+    isRecordList: bool = isNDJSON(filePath)
+
+    records: Iterable[dict]
+    if isRecordList:
+        records = readRecords(jsonFilePath=filePath)
+    else:
+        data: dict | List[dict] = readJSON(jsonFilePath=filePath)
+        # Files saved by `saveRecords` in the "json" format hold a list
+        isRecordList = isinstance(data, list)
+        records = data if isRecordList else [data]
+
+    # Lists are validated one record at a time
+    if isRecordList:
+        schema = getRecordSchema(schema)
+
+    violations: List[Violation] = []
+    pending: Deque[Future] = deque()
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializeWorker, initargs=(schema,)
+    ) as executor:
+        with Spinner(f"Validating {filePath} against {schemaName}...") as spinner:
+            batch: List[Tuple[int, dict]]
+            for batch in readBatches(records, batchSize):
+                pending.append(executor.submit(validateBatch, str(filePath), batch))
+
+                if len(pending) >= workers * 2:
+                    violations.extend(pending.popleft().result())
+                spinner.next()
+
+            while len(pending) > 0:
+                violations.extend(pending.popleft().result())
+                spinner.next()
+
+    return violations
+
+
+def main(workers: int = 4) -> bool:
+    """
+    Validates every hub metadata and PTM schema file that exists, saves the
+    violations to `validationReportPath`, and returns True if there were none
+    """
+    violations: List[Violation] = []
+
+    filePath: PurePath
+    schemaName: str
+    for filePath, schemaName in validationTargets:
+        if testForFile(path=filePath) == False:
+            continue
+
+        fileViolations: List[Violation] = validateFile(
+            filePath, schemaName, workers=workers
+        )
+        print(f"\n{filePath}: {len(fileViolations)} violations")
+        violations.extend(fileViolations)
+
+    print(f"Saving violations to {validationReportPath}")
+    saveRecords(
+        [asdict(violation) for violation in violations],
+        filepath=validationReportPath,
+    )
+
+    return len(violations) == 0
+
+
+if __name__ == "__main__":
+    main()
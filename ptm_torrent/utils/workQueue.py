@@ -0,0 +1,278 @@
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from os import getpid
+from pathlib import PurePath
+from socket import gethostname
+from sqlite3 import Connection
+from threading import Event, Lock, Thread
+from typing import Dict, Iterable, List, Set
+
+from progress.spinner import Spinner
+
+from ptm_torrent.utils.git import CloneOptions, CloneResult, HostLimiter, runClone
+from ptm_torrent.utils.ledger import DONE, FAILED, PENDING, CloneLedger
+
+LEASED: str = "leased"
+
+
+class WorkQueue:
+    """
+    Queue of repository URLs shared by cloning processes on one or more
+    machines.
+
+    The queue is a SQLite database, so every node must be able to reach it on
+    a filesystem with working POSIX locks (e.g. NFSv4 with locking enabled).
+    It uses a rollback journal rather than WAL, whose shared-memory index only
+    works between processes on the same host. A worker claims a URL by taking a
+    lease on it and keeps the lease alive with heartbeats while it clones. URLs
+    whose lease expires (e.g. the worker's machine died) or whose clone fails
+    are handed out again, up to `maxAttempts` times.
+    """
+
+    def __init__(
+        self, queuePath: PurePath, leaseDuration: float = 600, maxAttempts: int = 3
+    ) -> None:
+        self.queuePath: PurePath = queuePath
+        self.leaseDuration: float = leaseDuration
+        self.maxAttempts: int = maxAttempts
+        self.lock: Lock = Lock()
+        self.connection: Connection = sqlite3.connect(
+            database=queuePath,
+            timeout=60,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=DELETE")
+            # Wait for other nodes' transactions rather than fail with "locked"
+            self.connection.execute("PRAGMA busy_timeout=60000")
+            self.connection.execute(
+                """CREATE TABLE IF NOT EXISTS queue (
+                    url TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    worker TEXT,
+                    leaseExpires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0
+                )"""
+            )
+            # Claims look up pending URLs and expired leases without scanning
+            # past every finished URL
+            self.connection.execute(
+                """CREATE INDEX IF NOT EXISTS queueState
+                ON queue (state, leaseExpires)"""
+            )
+
+    def addURLs(self, urls: Iterable[str]) -> None:
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO queue (url, state) VALUES (?, ?)",
+                [(url, PENDING) for url in urls if url is not None],
+            )
+            self.connection.execute("COMMIT")
+
+    def requeue(self, urls: Iterable[str] | None = None) -> int:
+        """
+        Puts `urls` (or every URL) that are done or failed back in the queue
+        with a fresh attempt count, and returns how many were requeued
+        """
+        states: tuple = (PENDING, 0, DONE, FAILED)
+
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            if urls is None:
+                count: int = self.connection.execute(
+                    "UPDATE queue SET state = ?, attempts = ? WHERE state IN (?, ?)",
+                    states,
+                ).rowcount
+            else:
+                count = self.connection.executemany(
+                    """UPDATE queue SET state = ?, attempts = ?
+                    WHERE state IN (?, ?) AND url = ?""",
+                    [(*states, url) for url in urls if url is not None],
+                ).rowcount
+            self.connection.execute("COMMIT")
+
+        return count
+
+    def claim(self, worker: str) -> str | None:
+        """Leases the next available URL to `worker`, or returns None if none are"""
+        now: float = time.time()
+
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            # Expired leases that cannot be retried again
+            self.connection.execute(
+                """UPDATE queue SET state = ?, worker = NULL, leaseExpires = NULL
+                WHERE state = ? AND leaseExpires < ? AND attempts >= ?""",
+                (FAILED, LEASED, now, self.maxAttempts),
+            )
+            # Leases that expired (e.g. their worker died) go first
+            row: tuple | None = self.connection.execute(
+                """SELECT url FROM queue
+                WHERE state = ? AND leaseExpires < ? AND attempts < ?
+                ORDER BY leaseExpires LIMIT 1""",
+                (LEASED, now, self.maxAttempts),
+            ).fetchone()
+            if row is None:
+                row = self.connection.execute(
+                    """SELECT url FROM queue
+                    WHERE state = ? AND leaseExpires IS NULL AND attempts < ?
+                    ORDER BY rowid LIMIT 1""",
+                    (PENDING, self.maxAttempts),
+                ).fetchone()
+
+            if row is not None:
+                self.connection.execute(
+                    """UPDATE queue
+                    SET state = ?, worker = ?, leaseExpires = ?, attempts = attempts + 1
+                    WHERE url = ?""",
+                    (LEASED, worker, now + self.leaseDuration, row[0]),
+                )
+            self.connection.execute("COMMIT")
+
+        return None if row is None else row[0]
+
+    def heartbeat(self, worker: str, urls: Iterable[str]) -> None:
+        """Extends the leases `worker` holds on `urls`"""
+        leaseExpires: float = time.time() + self.leaseDuration
+
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.executemany(
+                """UPDATE queue SET leaseExpires = ?
+                WHERE url = ? AND worker = ? AND state = ?""",
+                [(leaseExpires, url, worker, LEASED) for url in urls],
+            )
+            self.connection.execute("COMMIT")
+
+    def complete(self, worker: str, url: str) -> None:
+        self._release(worker, url, DONE)
+
+    def fail(self, worker: str, url: str) -> None:
+        """Puts `url` back in the queue, or marks it failed after `maxAttempts`"""
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.execute(
+                """UPDATE queue
+                SET state = CASE WHEN attempts < ? THEN ? ELSE ? END,
+                    worker = NULL,
+                    leaseExpires = NULL
+                WHERE url = ? AND worker = ?""",
+                (self.maxAttempts, PENDING, FAILED, url, worker),
+            )
+            self.connection.execute("COMMIT")
+
+    def summary(self) -> Dict[str, int]:
+        """Returns the number of URLs in each state"""
+        counts: Dict[str, int] = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+
+        with self.lock:
+            rows: List[tuple] = self.connection.execute(
+                "SELECT state, COUNT(*) FROM queue GROUP BY state"
+            ).fetchall()
+
+        counts.update(dict(rows))
+        return counts
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _release(self, worker: str, url: str, state: str) -> None:
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.execute(
+                """UPDATE queue SET state = ?, worker = NULL, leaseExpires = NULL
+                WHERE url = ? AND worker = ?""",
+                (state, url, worker),
+            )
+            self.connection.execute("COMMIT")
+
+
+def getWorkerName() -> str:
+    return f"{gethostname()}:{getpid()}"
+
+
+def cloneFromQueue(
+    queue: WorkQueue,
+    rootGitClonePath: PurePath,
+    options: CloneOptions = CloneOptions(),
+    ledger: CloneLedger | None = None,
+    worker: str | None = None,
+) -> List[CloneResult]:
+    """
+    Claims and clones URLs from `queue` with `options.workers` threads until
+    the queue has nothing left to hand out, with at most `options.hostLimit`
+    clones against the same host.
+
+    A background thread renews this process's leases every third of the lease
+    duration, so long clones are not handed to another worker.
+    """
+    worker = getWorkerName() if worker is None else worker
+
+    results: List[CloneResult] = []
+    heldURLs: Set[str] = set()
+    heldLock: Lock = Lock()
+    stopped: Event = Event()
+    hostLimiter: HostLimiter = HostLimiter(options.hostLimit)
+
+    def _heartbeat() -> None:
+        while stopped.wait(timeout=queue.leaseDuration / 3) == False:
+            with heldLock:
+                urls: List[str] = list(heldURLs)
+            queue.heartbeat(worker, urls)
+
+    heartbeatThread: Thread = Thread(target=_heartbeat, daemon=True)
+    heartbeatThread.start()
+
+    with Spinner(f"Cloning queued git repos to {rootGitClonePath}...") as spinner:
+
+        def _queueHelper(_: int) -> None:
+            while True:
+                url: str | None = queue.claim(worker)
+                if url is None:
+                    return
+
+                with heldLock:
+                    heldURLs.add(url)
+
+                try:
+                    with hostLimiter.limit(url):
+                        result: CloneResult = runClone(
+                            url, rootGitClonePath, options, ledger
+                        )
+                except Exception:
+                    result = CloneResult(
+                        url=url,
+                        path=None,
+                        returnCode=-1,
+                        duration=0.0,
+                        size=0,
+                        status="failed",
+                    )
+
+                with heldLock:
+                    heldURLs.discard(url)
+                    results.append(result)
+                    spinner.next()
+
+                if result.status == "failed":
+                    queue.fail(worker, url)
+                else:
+                    queue.complete(worker, url)
+
+        with ThreadPoolExecutor(max_workers=options.workers) as executor:
+            list(executor.map(_queueHelper, range(options.workers)))
+
+    stopped.set()
+    heartbeatThread.join()
+
+    counts: Dict[str, int] = queue.summary()
+    print(
+        f"\n{counts[DONE]} repos done, {counts[LEASED]} leased to other workers, "
+        f"{counts[PENDING]} pending, {counts[FAILED]} failed"
+    )
+
+    return results
@@ -0,0 +1,126 @@
+import random
+from pathlib import PurePath
+from typing import List
+
+import numpy
+import pytest
+from pandas import DataFrame, Series
+
+from ptm_torrent.huggingface.createSchema import createPTMSchema
+from ptm_torrent.utils.ptmSchema import ModelHub, PTMTorrent
+
+metadataPath: PurePath = PurePath("hf_metadata.json")
+
+architectures: List[str] = ["bert", "gpt2", "t5", "vit", "wav2vec2"]
+tasks: List[str] = ["fill-mask", "text-generation", "translation", "image-to-text"]
+
+
+def createRowWisePTMSchema(df: DataFrame) -> List[dict]:
+    """The row-wise createPTMSchema that the column-wise version replaced"""
+    data: List[dict] = []
+
+    idx: int
+    for idx in range(len(df)):
+        row: Series = df.loc[idx]
+
+        model_owner: str
+        model_owner_url: str
+        if row["author"] == None:
+            model_owner = "http://huggingface.co/"
+            model_owner_url = "http://huggingface.co/"
+        else:
+            model_owner = str(row["author"])
+            model_owner_url = f"https://huggingface.co/{model_owner}"
+
+        model_architecture: str = None
+        config = row["config"]
+        if config != None:
+            if "model_type" in config:
+                model_architecture = config["model_type"]
+
+        model_paper_dois: List[str] = None
+        tags: List[str] = row["tags"]
+        if tags != None:
+            temp = [x for x in tags if "doi:" in x]
+            if temp:
+                model_paper_dois = temp
+
+        ptm: PTMTorrent = PTMTorrent(
+            id=idx,
+            latest_git_commit_sha=row["sha"],
+            model_hub=ModelHub(
+                metadata_file_path=metadataPath.__str__(),
+                metadata_object_id=str(row["id"]),
+                model_hub_name="Hugging Face",
+                model_hub_url="https://huggingface.co/",
+            ),
+            model_name=str(row["id"]),
+            model_owner=model_owner,
+            model_owner_url=model_owner_url,
+            model_url=f'https://huggingface.co/{row["id"]}',
+            datasets=None,
+            model_architecture=model_architecture,
+            model_paper_dois=model_paper_dois,
+            model_task=row["pipeline_tag"],
+        )
+
+        data.append(ptm.to_dict())
+
+    return data
+
+
+def createListing(modelCount: int, seed: int) -> DataFrame:
+    """A synthetic Hugging Face listing, with missing values stored as None"""
+    generator: random.Random = random.Random(seed)
+    rows: List[dict] = []
+
+    idx: int
+    for idx in range(modelCount):
+        author: str | None = generator.choice([None, f"author{idx % 97}"])
+
+        config: dict | None = generator.choice(
+            [None, {}, {"model_type": generator.choice(architectures)}]
+        )
+
+        tags: List[str] | None = None
+        if generator.random() < 0.8:
+            tags = ["pytorch", f"license:{generator.choice(['mit', 'apache-2.0'])}"]
+            if generator.random() < 0.2:
+                tags.append(f"doi:10.57967/hf/{idx}")
+
+        rows.append(
+            {
+                "id": f"{author or 'model'}/model-{idx}",
+                "author": author,
+                "sha": f"{generator.getrandbits(160):040x}",
+                "config": config,
+                "tags": tags,
+                "pipeline_tag": generator.choice([None, *tasks]),
+            }
+        )
+
+    df: DataFrame = DataFrame(rows)
+    # DataFrame() stores missing strings as NaN; the listing reader keeps None
+    return df.astype(object).where(df.notna(), None)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_column_wise_matches_row_wise(seed: int) -> None:
+    df: DataFrame = createListing(2000, seed)
+
+    assert createPTMSchema(df, metadataPath) == createRowWisePTMSchema(df)
+
+
+def test_missing_values_are_left_out() -> None:
+    """NaN in the listing must be written as a missing field, never as NaN"""
+    df: DataFrame = createListing(1000, 0)
+    df["pipeline_tag"] = df["pipeline_tag"].map(
+        lambda task: numpy.nan if task is None else task
+    )
+    df.loc[0, "sha"] = numpy.nan
+
+    record: dict
+    for record in createPTMSchema(df, metadataPath):
+        value: object
+        for value in [record["LatestGitCommitSHA"], record.get("ModelTask")]:
+            assert value is None or isinstance(value, str), record
@@ -0,0 +1,41 @@
+from pathlib import PurePath
+from typing import List
+
+import pytest
+from pandas import DataFrame
+
+from ptm_torrent.utils.fileSystem import readDataFrame, readRecords, saveRecords
+
+records: List[dict] = [
+    {"id": "bert-base-uncased", "downloads": 10},
+    {"id": "gpt2", "downloads": 20},
+]
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "data.json",
+        "data.json.gz",
+        "data.json.zst",
+        "data.ndjson",
+        "data.ndjson.gz",
+        "data.ndjson.zst",
+    ],
+)
+def test_records_round_trip(tmp_path: PurePath, filename: str) -> None:
+    if filename.endswith(".zst"):
+        pytest.importorskip("zstandard")
+
+    filepath: PurePath = PurePath(f"{tmp_path}/{filename}")
+    saveRecords(records, filepath=filepath)
+
+    if filepath.suffix in (".gz", ".zst"):
+        # The requested compression is applied to JSON arrays as well
+        with open(filepath, "rb") as compressedFile:
+            assert compressedFile.read(1) not in (b"[", b"{")
+
+    assert list(readRecords(filepath)) == records
+
+    df: DataFrame = readDataFrame(filepath)
+    assert df.to_dict(orient="records") == records
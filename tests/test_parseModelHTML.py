@@ -0,0 +1,189 @@
+from copy import deepcopy
+from io import StringIO
+from json import dumps
+from pathlib import PurePath
+from typing import List, Tuple
+
+import pandas
+import pytest
+from pandas import DataFrame, Series
+
+import ptm_torrent.onnxmodelzoo.parseModelHTML as parseModelHTML
+from ptm_torrent.onnxmodelzoo.parseModelHTML import extractModelMetadata, prepareData
+
+
+def loopPrepareData(
+    dfs: List[DataFrame],
+    readmePath: PurePath,
+    category: str,
+    firstColumn: str = "Model",
+) -> DataFrame:
+    """The per-row `prepareData` that the column-wise version replaced"""
+    df: DataFrame
+    for df in dfs:
+        df.columns = [pair[0] for pair in df.columns]
+        df["readmePath"] = readmePath
+        df["category"] = category
+        df[
+            "GitHub URL"
+        ] = f"https://github.com/onnx/models/tree/main/{readmePath.__str__()}"
+
+        if df.columns.__contains__(firstColumn):
+            rowCount: int = len(df)
+            idx: int
+            for idx in range(rowCount):
+                if df.loc[idx, firstColumn][0][0] == ">":
+                    df.drop(index=idx, inplace=True)
+
+    return pandas.concat(objs=dfs, ignore_index=True)
+
+
+def loopExtractTextFromPair(
+    df: DataFrame, labels: List[str], pairIndex: int = 0, drop: bool = False
+) -> DataFrame:
+    """The per-pair `extractTextFromPair` that the column-wise version replaced"""
+    rowCount: int = len(df)
+    idx: int
+    for idx in range(rowCount):
+        label: str
+        for label in labels:
+            try:
+                df.loc[idx, label] = df.loc[idx, label][pairIndex]
+            except TypeError:
+                if drop:
+                    df.drop(index=idx, inplace=True)
+                continue
+    return df
+
+
+def loopCreateJSON(df: DataFrame, category: str) -> List[dict]:
+    """The per-row `createJSON` that the column-wise version replaced"""
+    json: List[dict] = []
+    df = df.fillna(value="N/A")
+
+    idx: int
+    for idx in range(len(df)):
+        row: Series = df.loc[idx]
+        readmePath: PurePath = row["readmePath"]
+
+        data: dict = {
+            "id": idx,
+            "Model": row["Model"],
+            "ModelSize": row["Download"][0],
+            "ModelPath": f'{readmePath}/{row["Download"][1]}',
+            "ONNXVersion": row["ONNX version"],
+            r"Top-1% Accuracy": row["Top-1 accuracy (%)"],
+            r"Top-5% Accuracy": row["Top-5 accuracy (%)"],
+            "Accuracy": row["Accuracy"],
+            "mAP": row["mAP"],
+            "mIOU": row["mIOU  (%)"],
+            "Mean IoU": row["Mean IoU"],
+            "LFW * accuracy (%)": row["LFW * accuracy (%)"],
+            "CFP-FF * accuracy (%)": row["CFP-FF * accuracy (%)"],
+            "CFP-FP * accuracy (%)": row["CFP-FP * accuracy (%)"],
+            "AgeDB-30 * accuracy (%)": row["AgeDB-30 * accuracy (%)"],
+            "Dataset": row["Dataset"],
+            "OpsetVersion": row["OpsetVersion"],
+            "Top-1 Error (%)": row["Top-1 Error (%)"],
+            "Category": row["category"],
+            "GitHub URL": row["GitHub URL"],
+        }
+
+        try:
+            data["ModelSampleSize"] = row["Download (with sample test data)"][0]
+        except TypeError:
+            data["ModelSampleSize"] = None
+
+        try:
+            data[
+                "ModelSamplePath"
+            ] = f'{readmePath}/{row["Download (with sample test data)"][1]}'
+        except TypeError:
+            data["ModelSamplePath"] = None
+
+        json.append(data)
+
+    return json
+
+
+# Model README tables in the layouts the ONNX Model Zoo uses
+classificationTables: List[str] = [
+    """<table>
+<tr><th>Model</th><th>Download</th><th>Download (with sample test data)</th>
+<th>ONNX version</th><th>Opset version</th><th>Top-1 accuracy (%)</th>
+<th>Top-5 accuracy (%)</th><th>Top-1 error</th><th>Top-5 error</th></tr>
+<tr><td>ResNet18</td><td><a href="model/resnet18-v1-7.onnx">44.7 MB</a></td>
+<td><a href="model/resnet18-v1-7.tar.gz">42.9 MB</a></td><td>1.2.1</td><td>7</td>
+<td>69.93</td><td>89.29</td><td>30.07</td><td>10.71</td></tr>
+<tr><td>&gt; Note: the int8 models are quantized</td><td></td><td></td><td></td>
+<td></td><td></td><td></td><td></td><td></td></tr>
+<tr><td><a href="#int8">ResNet50-int8</a></td>
+<td><a href="model/resnet50-v1-12-int8.onnx">25.2 MB</a></td><td></td>
+<td><a href="https://github.com/onnx/onnx/releases">1.9.0</a></td><td>12</td>
+<td>75.81</td><td></td></tr>
+<tr><td>ResNet101</td><td>170 MB</td></tr>
+</table>""",
+    """<table>
+<tr><th>Dataset</th><th>Details</th><th>Size</th></tr>
+<tr><td><a href="http://www.image-net.org/">ImageNet</a></td><td>1000 classes</td>
+<td>138 GB</td></tr>
+</table>""",
+]
+
+otherTables: List[str] = [
+    """<table>
+<tr><th>Model</th><th>Download</th><th>Download (with sample test data)</th>
+<th>ONNX version</th><th>Opset Version</th><th>TOP-1 ERROR</th><th>Accuracy</th>
+<th>mAP</th><th>mIOU<br> (%)</th><th>Mean IoU</th><th>Filename</th>
+<th>LFW * accuracy (%)</th><th>CFP-FF * accuracy (%)</th>
+<th>CFP-FP * accuracy (%)</th><th>AgeDB-30 * accuracy (%)</th></tr>
+<tr><td>ArcFace</td><td><a href="model/arcfaceresnet100-8.onnx">248.9 MB</a></td>
+<td><a href="model/arcfaceresnet100-8.tar.gz">237 MB</a></td><td>1.3</td>
+<td>8</td><td>24.3</td><td>0.8</td><td>0.7</td><td>65.1</td><td>0.6</td>
+<td><a href="model/arcface.onnx">arcface.onnx</a></td><td>99.77</td><td>99.83</td>
+<td>94.21</td><td>97.87</td></tr>
+<tr><td>FCN</td><td><a>134 MB</a></td><td></td><td></td><td></td><td></td></tr>
+</table>""",
+]
+
+
+def readTables(tables: List[str]) -> List[DataFrame]:
+    return [
+        pandas.read_html(io=StringIO(table), extract_links="all")[0] for table in tables
+    ]
+
+
+def createRecords(
+    tables: List[Tuple[List[DataFrame], str]],
+    monkeypatch: pytest.MonkeyPatch | None = None,
+) -> List[dict]:
+    if monkeypatch is not None:
+        monkeypatch.setattr(
+            parseModelHTML, "extractTextFromPair", loopExtractTextFromPair
+        )
+        monkeypatch.setattr(parseModelHTML, "createJSON", loopCreateJSON)
+
+    prepare = prepareData if monkeypatch is None else loopPrepareData
+    return extractModelMetadata(
+        [
+            prepare(
+                dfs=dfs,
+                readmePath=PurePath(f"vision/{category}/model/README.md"),
+                category=category,
+            )
+            for dfs, category in tables
+        ]
+    )
+
+
+def test_records_match_per_pair_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    tables: List[Tuple[List[DataFrame], str]] = [
+        (readTables(classificationTables), "classification"),
+        (readTables(otherTables), "body_analysis"),
+    ]
+
+    records: List[dict] = createRecords(deepcopy(tables))
+    expectedRecords: List[dict] = createRecords(deepcopy(tables), monkeypatch)
+
+    assert len(records) == 5
+    assert dumps(records) == dumps(expectedRecords)
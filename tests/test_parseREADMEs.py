@@ -0,0 +1,95 @@
+from os import makedirs
+from pathlib import PurePath
+from typing import List
+
+import pandas
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from ptm_torrent.onnxmodelzoo.parseREADMEs import readTables, renderMarkdown
+from ptm_torrent.utils.fileSystem import markdownToHTML
+
+# Tables as they appear in the ONNX Model Zoo READMEs
+markdownTables: str = """# Model Zoo
+
+<a name="vision"></a>
+
+## Image Classification
+
+|Model Class |Reference |Description |Hugging Face Spaces |
+|-|-|-|-|
+|<b>[MobileNet](vision/classification/mobilenet)</b> |[Sandler et al.](https://arxiv.org/abs/1801.04381) |Light-weight deep neural network best suited for mobile and embedded vision applications. <br>Top-5 error from paper - ~10% | |
+|<b>[ResNet](vision/classification/resnet)</b> |[He et al.](https://arxiv.org/abs/1512.03385) |A CNN model (up to 152 layers). Uses shortcut connections to achieve higher accuracy when classifying images. <br> Top-5 error from paper - ~3.6% |[![Hugging Face Spaces](https://img.shields.io/badge/%F0%9F%A4%97%20Hugging%20Face-Spaces-blue)](https://huggingface.co/spaces/onnx/ResNet) |
+| | | `inline code` and **bold** text | |
+
+|Model |Download |Download (with sample test data)| ONNX version |Opset version|Top-1 accuracy (%)|
+|-------------|:--------------|:--------------|:--------------|:--------------|:--------------|
+|MobileNet v2-1.0| [13.6 MB](model/mobilenetv2-7.onnx) | [14.1 MB](model/mobilenetv2-7.tar.gz) | 1.2.1 | 7 | 70.94 |
+|MobileNet v2-1.0-int8| [3.5 MB](model/mobilenetv2-12-int8.onnx) | | 1.9.0 | 12 | |
+"""
+
+htmlTables: str = """# Spans
+
+<table>
+<thead>
+<tr><th>Model</th><th colspan="2">Download</th><th>Notes</th></tr>
+</thead>
+<tbody>
+<tr><td rowspan="2"><a href="model/a.onnx">A</a></td><td>fp32</td><td><a href="model/a-int8.onnx">int8</a></td><td></td></tr>
+<tr><td colspan="2">Both <i>quantized</i></td><td>see <a href="#a">notes</a></td></tr>
+<tr><td>B</td><td></td><td>int8</td><td rowspan="2">last</td></tr>
+</tbody>
+</table>
+
+<table>
+<thead>
+<tr><th>Only a header</th></tr>
+</thead>
+</table>
+"""
+
+
+# Header, footer, and padding layouts `pandas.read_html` handles specially
+structureTables: str = """# Structures
+
+<table><tr><td>no</td><td>header</td></tr><tr><td>short</td></tr></table>
+
+<table><tr><th>H1</th><th>H2</th></tr><tr><td>a</td><td><a href="x">b</a></td></tr></table>
+
+<table><thead><tr><th>Short</th></tr></thead>
+<tbody><tr></tr><tr><td>a</td><td></td><td>c</td></tr></tbody></table>
+
+<table><thead><tr><th rowspan="2">H</th><th>I</th></tr></thead>
+<tbody><tr><td rowspan="3">b</td></tr><tr><td>c</td></tr></tbody>
+<tfoot><tr><td>f</td></tr></tfoot></table>
+
+<table><thead><tr><th colspan="2">A</th><th>B</th></tr><tr><th>a</th><th>a</th></tr>
+<tr><th>x</th><th>y</th></tr></thead>
+<tbody><tr><td>1</td><td>2</td><td>3</td><td>4</td></tr></tbody></table>
+
+<table><thead><tr></tr><tr><th>A</th><th>A</th><th>A.1</th></tr></thead>
+<tbody><tr><td>1</td><td>2</td><td>3</td></tr></tbody></table>
+
+<table></table>
+"""
+
+
+@pytest.mark.parametrize("readme", [markdownTables, htmlTables, structureTables])
+def test_tables_match_read_html(tmp_path: PurePath, readme: str) -> None:
+    readmePath: PurePath = PurePath(f"{tmp_path}/model/README.md")
+    makedirs(PurePath(f"{tmp_path}/model"))
+    with open(readmePath, "w") as readmeFile:
+        readmeFile.write(readme)
+
+    tables: List[DataFrame] = readTables(renderMarkdown(readmePath))
+    expectedTables: List[DataFrame] = pandas.read_html(
+        io=markdownToHTML(str(tmp_path), readmePath), extract_links="all"
+    )
+
+    assert len(tables) == len(expectedTables)
+
+    table: DataFrame
+    expectedTable: DataFrame
+    for table, expectedTable in zip(tables, expectedTables):
+        assert_frame_equal(table, expectedTable)
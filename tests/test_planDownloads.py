@@ -0,0 +1,78 @@
+from os import makedirs
+from pathlib import PurePath
+from typing import Dict, List
+
+import pytest
+
+import ptm_torrent.huggingface.planDownloads as planDownloads
+from ptm_torrent.utils.fileSystem import readJSON, saveRecords
+
+sharedOID: str = "a" * 64
+
+# Files as `?blobs=true` reports them: both repos carry the same weights
+blobs: Dict[str, List[dict]] = {
+    "first/model": [
+        {"rfilename": "README.md", "size": 10},
+        {
+            "rfilename": "pytorch_model.bin",
+            "size": 500,
+            "lfs": {"sha256": sharedOID, "size": 500},
+        },
+    ],
+    "second/copy": [
+        {"rfilename": "README.md", "size": 12},
+        {
+            "rfilename": "weights/model.bin",
+            "size": 500,
+            "lfs": {"sha256": sharedOID, "size": 500},
+        },
+        {
+            "rfilename": "tokenizer.bin",
+            "size": 7,
+            "lfs": {"sha256": "b" * 64, "size": 7},
+        },
+    ],
+}
+
+
+def writeInputs(tmp_path: PurePath, monkeypatch: pytest.MonkeyPatch) -> None:
+    # The model listing that `downloadJSON` saves has file names only
+    listing: List[dict] = [
+        {"id": modelID, "siblings": [{"rfilename": f["rfilename"]} for f in files]}
+        for modelID, files in blobs.items()
+    ]
+    metadataPath: PurePath = PurePath(f"{tmp_path}/hf_metadata.ndjson")
+    saveRecords(listing, filepath=metadataPath)
+    monkeypatch.setattr(planDownloads, "getHubMetadataPath", lambda: metadataPath)
+
+    splitPath: PurePath = PurePath(f"{tmp_path}/split_urls")
+    makedirs(splitPath)
+    with open(f"{splitPath}/split_url_0.txt", "w") as urlFile:
+        urlFile.writelines([f"https://huggingface.co/{modelID}\n" for modelID in blobs])
+
+
+def runMain(tmp_path: PurePath) -> None | bool:
+    return planDownloads.main(
+        splitPath=PurePath(f"{tmp_path}/split_urls"),
+        storePath=PurePath(f"{tmp_path}/lfs_objects"),
+        planPath=PurePath(f"{tmp_path}/plan.json"),
+    )
+
+
+def test_shared_oid_is_downloaded_once(
+    tmp_path: PurePath, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    writeInputs(tmp_path, monkeypatch)
+    monkeypatch.setattr(planDownloads, "fetchSiblings", blobs.get)
+
+    assert runMain(tmp_path) is None
+    assert readJSON(jsonFilePath=PurePath(f"{tmp_path}/plan.json")) == {
+        "https://huggingface.co/second/copy": ["/weights/model.bin"]
+    }
+
+
+def test_missing_oids_fail(tmp_path: PurePath, monkeypatch: pytest.MonkeyPatch) -> None:
+    writeInputs(tmp_path, monkeypatch)
+    monkeypatch.setattr(planDownloads, "fetchSiblings", lambda modelID: None)
+
+    assert runMain(tmp_path) == False
@@ -0,0 +1,49 @@
+from pathlib import PurePath
+from typing import List
+
+import pytest
+from pandas import DataFrame
+
+from ptm_torrent.huggingface.createSchema import createPTMSchema
+from ptm_torrent.utils.fileSystem import saveRecords
+from ptm_torrent.utils.validation import Violation, validateFile
+
+pytest.importorskip("jsonschema")
+
+
+def createHubOutput() -> List[dict]:
+    """PTM Torrent records as the Hugging Face createSchema writes them"""
+    listing: DataFrame = DataFrame(
+        {
+            "id": ["bert-base-uncased", "openai/whisper-tiny", "gpt2"],
+            "author": [None, "openai", None],
+            "sha": ["0" * 40, "1" * 40, "2" * 40],
+            "config": [{"model_type": "bert"}, {}, None],
+            "tags": [["pytorch", "doi:10.57967/hf/0"], ["audio"], None],
+            "pipeline_tag": ["fill-mask", None, "text-generation"],
+        }
+    )
+    return createPTMSchema(listing, PurePath("hf_metadata.json"))
+
+
+@pytest.mark.parametrize("filename", ["huggingface.json", "huggingface.ndjson"])
+def test_hub_output_is_valid(tmp_path: PurePath, filename: str) -> None:
+    filePath: PurePath = PurePath(f"{tmp_path}/{filename}")
+    saveRecords(createHubOutput(), filepath=filePath)
+
+    assert validateFile(filePath, "ptmtorrent.json", workers=1) == []
+
+
+def test_violations_are_reported_per_record(tmp_path: PurePath) -> None:
+    records: List[dict] = createHubOutput()
+    del records[1]["ModelName"]
+
+    filePath: PurePath = PurePath(f"{tmp_path}/huggingface.json")
+    saveRecords(records, filepath=filePath)
+
+    violations: List[Violation] = validateFile(filePath, "ptmtorrent.json", workers=1)
+
+    assert [(violation.record, violation.field) for violation in violations] == [
+        (1, "/")
+    ]
+    assert "'ModelName' is a required property" in violations[0].message
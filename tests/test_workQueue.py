@@ -0,0 +1,113 @@
+import time
+from pathlib import PurePath
+from threading import Lock
+from typing import Dict, List
+
+import pytest
+
+import ptm_torrent.utils.workQueue as workQueue
+from ptm_torrent.utils.git import CloneOptions, CloneResult
+from ptm_torrent.utils.ledger import DONE, FAILED, PENDING
+from ptm_torrent.utils.workQueue import LEASED, WorkQueue, cloneFromQueue
+
+
+def createQueue(tmp_path: PurePath, **kwargs) -> WorkQueue:
+    return WorkQueue(queuePath=PurePath(f"{tmp_path}/queue.db"), **kwargs)
+
+
+def test_workers_claim_distinct_urls(tmp_path: PurePath) -> None:
+    first: WorkQueue = createQueue(tmp_path)
+    second: WorkQueue = createQueue(tmp_path)
+    first.addURLs(["https://a/1", "https://a/2"])
+    second.addURLs(["https://a/2"])
+
+    claimed: List[str | None] = [first.claim("w1"), second.claim("w2")]
+    assert sorted(claimed) == ["https://a/1", "https://a/2"]
+    assert first.claim("w1") is None
+
+    first.complete("w1", claimed[0])
+    second.complete("w2", claimed[1])
+    assert first.summary()[DONE] == 2
+
+
+def test_expired_lease_moves_to_another_worker(tmp_path: PurePath) -> None:
+    first: WorkQueue = createQueue(tmp_path, leaseDuration=0.2)
+    second: WorkQueue = createQueue(tmp_path, leaseDuration=0.2)
+    first.addURLs(["https://a/1"])
+
+    url: str | None = first.claim("w1")
+    time.sleep(0.15)
+    first.heartbeat("w1", [url])
+    time.sleep(0.1)
+    # The heartbeat kept the lease alive
+    assert second.claim("w2") is None
+
+    time.sleep(0.25)
+    assert second.claim("w2") == url
+
+    # The first worker no longer holds the lease, so it cannot finish the URL
+    first.complete("w1", url)
+    assert second.summary()[LEASED] == 1
+    second.complete("w2", url)
+    assert second.summary()[DONE] == 1
+
+
+def test_failures_are_retried_up_to_max_attempts(tmp_path: PurePath) -> None:
+    first: WorkQueue = createQueue(tmp_path, maxAttempts=2)
+    second: WorkQueue = createQueue(tmp_path, maxAttempts=2)
+    first.addURLs(["https://a/1"])
+
+    first.fail("w1", first.claim("w1"))
+    assert first.summary()[PENDING] == 1
+
+    second.fail("w2", second.claim("w2"))
+    assert second.summary()[FAILED] == 1
+    assert first.claim("w1") is None
+
+
+def test_requeue_hands_out_done_and_failed_urls(tmp_path: PurePath) -> None:
+    queue: WorkQueue = createQueue(tmp_path, maxAttempts=1)
+    queue.addURLs(["https://a/1", "https://a/2", "https://a/3"])
+
+    queue.complete("w1", queue.claim("w1"))
+    queue.fail("w1", queue.claim("w1"))
+    assert queue.summary() == {PENDING: 1, LEASED: 0, DONE: 1, FAILED: 1}
+
+    assert queue.requeue(["https://a/2"]) == 1
+    assert queue.requeue() == 1
+    assert queue.summary()[PENDING] == 3
+    # Failures get a fresh attempt count
+    assert queue.claim("w1") is not None
+
+
+def test_clone_from_queue_respects_host_limit(
+    tmp_path: PurePath, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    running: Dict[str, int] = {}
+    peaks: Dict[str, int] = {}
+    lock: Lock = Lock()
+
+    def _runClone(url: str, *args, **kwargs) -> CloneResult:
+        host: str = url.split("/")[2]
+        with lock:
+            running[host] = running.get(host, 0) + 1
+            peaks[host] = max(peaks.get(host, 0), running[host])
+        time.sleep(0.05)
+        with lock:
+            running[host] -= 1
+        return CloneResult(
+            url=url, path=None, returnCode=0, duration=0.0, size=0, status="cloned"
+        )
+
+    monkeypatch.setattr(workQueue, "runClone", _runClone)
+
+    queue: WorkQueue = createQueue(tmp_path)
+    queue.addURLs([f"https://{host}/{idx}" for idx in range(6) for host in "ab"])
+
+    results: List[CloneResult] = cloneFromQueue(
+        queue, PurePath(tmp_path), CloneOptions(workers=6, hostLimit=2), worker="w1"
+    )
+
+    assert len(results) == 12
+    assert peaks == {"a": 2, "b": 2}
+    assert queue.summary()[DONE] == 12